@@ -59,9 +59,9 @@ class ThreadProfileWorkbench(Workbench):
         "This function is executed when FreeCAD starts"
         import ThreadProfileCmd #needed files for FreeCAD commands
         self.list = ["ThreadProfileCreateObject", "ThreadProfileCreateButtressObject", "ThreadProfileCreateBottleObject",
-                    "ThreadProfileMakeHelix", "ThreadProfileDoSweep", "ThreadProfileOpenOnlineCalculator",
-                    "ThreadProfileSettings"] # A list of command names created in the line above
-        self.appendToolbar("ThreadProfile Commands",self.list[:-1]) # leave settings off toolbar
+                    "ThreadProfileMakeHelix", "ThreadProfileDoSweep", "ThreadProfileMakeThread", "ThreadProfileFit", "ThreadProfileOpenOnlineCalculator",
+                    "ThreadProfileReport", "ThreadProfileSettings"] # A list of command names created in the line above
+        self.appendToolbar("ThreadProfile Commands",self.list[:-2]) # leave report and settings off toolbar
         self.appendMenu("&ThreadProfile",self.list) # creates a new menu
         #considered putting the menu inside the Edit menu, but decided against it
         #self.appendMenu(["&Edit","ThreadProfile"],self.list) # appends a submenu to an existing menu
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  ThreadProfileBackground.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Background sweep: the thread solid is built by a FreeCADCmd worker process from the profile spline,
+the lead and the height, with the progress shown in a task panel that can cancel the build.  The
+document is only touched when the worker has finished, the result is a Part::Feature with the solid.
+The GUI is never blocked, the worker does the same sweep as ThreadProfileSolid.replicateTurns()."""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import FreeCAD
+
+###################################################################################
+# Worker side, runs in FreeCADCmd without the GUI
+
+def buildSweep(job, progress=None):
+    '''buildSweep(job, progress=None): the thread solid for job, a dict with the keys curve (BREP file of the
+    profile spline), lead, height and out (BREP file for the solid).  progress(percent, message) is
+    called between the stages.'''
+    import Part
+    from ThreadProfileSolid import makeTurn, wholeTurns, replicateTurns
+    progress = progress or (lambda percent, message: None)
+    progress(0, "reading profile")
+    shape = Part.Shape()
+    shape.read(job["curve"])
+    curve = shape.Edges[0].Curve
+    lead, turns = job["lead"], job["height"] / job["lead"]
+    progress(5, "sweeping one turn")
+    makeTurn(curve, lead, 1., "Sweep")
+    progress(35, "joining %d turns" % int(turns))
+    whole = wholeTurns(curve, lead, int(turns + 1e-9), "Sweep")
+    progress(75, "closing the solid")
+    solid = replicateTurns(curve, lead, turns, "Sweep", previous=whole)[0]
+    progress(95, "writing the solid")
+    solid.exportBrep(job["out"])
+    progress(100, "done")
+    return solid
+
+def main(job_path):
+    '''main(job_path): worker entry point, builds the job in the json file job_path and reports
+    on stdout, one line per stage: PROGRESS percent message, then DONE or ERROR message'''
+    def report(percent, message):
+        sys.stdout.write("PROGRESS %d %s\n" % (percent, message))
+        sys.stdout.flush()
+    try:
+        with open(job_path) as f:
+            buildSweep(json.load(f), report)
+    except Exception as e:
+        sys.stdout.write("ERROR %s\n" % str(e).replace("\n", " "))
+        sys.stdout.flush()
+        return 1
+    sys.stdout.write("DONE\n")
+    sys.stdout.flush()
+    return 0
+
+###################################################################################
+# GUI side
+
+#builds in progress, kept here so the QProcess objects live until they finish
+activeBuilds = []
+
+def workerExecutable():
+    '''workerExecutable(): FreeCADCmd next to the running FreeCAD, or the WorkerExecutable parameter if set'''
+    pg = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/ThreadProfile")
+    path = pg.GetString("WorkerExecutable", "")
+    if path:
+        return path
+    ext = ".exe" if sys.platform.startswith("win") else ""
+    for name in ("FreeCADCmd", "freecadcmd"):
+        path = os.path.join(FreeCAD.getHomePath(), "bin", name + ext)
+        if os.path.exists(path):
+            return path
+    return shutil.which("FreeCADCmd") or shutil.which("freecadcmd")
+
+def canBuildInBackground(profile, helix):
+    '''canBuildInBackground(profile, helix): True if the sweep of profile along helix is the solid buildSweep()
+    makes: a right handed, cylindrical Part::Helix with the placement of the profile and a worker executable'''
+    return (helix.isDerivedFrom("Part::Helix") and helix.LocalCoord == "Right-handed"
+            and helix.Angle.Value == 0 and helix.Pitch.Value > 0
+            and helix.Height.Value > 0 and helix.Placement.isSame(profile.Placement, 1e-9)
+            and workerExecutable() is not None)
+
+class BackgroundSweep(object):
+    """Sweep of a ThreadProfile along a Part::Helix built by a worker process, see startBackgroundSweep()"""
+
+    def __init__(self, profile, helix, part=None):
+        from PySide import QtCore
+        from ThreadProfileSolid import profileCurve
+        import Part
+        self.docName = profile.Document.Name
+        self.profileName = profile.Name
+        self.partName = part.Name if part else None
+        self.placement = profile.Placement
+        self.label = profile.Label
+        self.folder = tempfile.mkdtemp(prefix="ThreadProfile")
+        job = dict(curve=os.path.join(self.folder, "profile.brep"), out=os.path.join(self.folder, "thread.brep"),
+                   lead=helix.Pitch.Value, height=helix.Height.Value)
+        Part.Edge(profileCurve(profile)).exportBrep(job["curve"])
+        self.out = job["out"]
+        jobPath = os.path.join(self.folder, "job.json")
+        with open(jobPath, "w") as f:
+            json.dump(job, f)
+        self.panel = None
+        self.error = None
+        self.cancelled = False
+        self.process = QtCore.QProcess()
+        self.process.readyReadStandardOutput.connect(self.onOutput)
+        self.process.finished.connect(self.onFinished)
+        here = os.path.dirname(__file__)
+        script = "import sys; sys.path.insert(0, %r); import ThreadProfileBackground; ThreadProfileBackground.main(%r)" % (here, jobPath)
+        self.process.start(workerExecutable(), ["-c", script])
+        if not self.process.waitForStarted(10000):
+            shutil.rmtree(self.folder, ignore_errors=True)
+            raise RuntimeError("unable to start the worker "+str(workerExecutable()))
+
+    def onOutput(self):
+        while self.process.canReadLine():
+            line = bytes(self.process.readLine()).decode("utf-8", "replace").strip()
+            if line.startswith("PROGRESS "):
+                percent, _, message = line[9:].partition(" ")
+                if self.panel:
+                    self.panel.setProgress(int(percent), message)
+            elif line.startswith("ERROR "):
+                self.error = line[6:]
+
+    def onFinished(self, *args):
+        self.onOutput()
+        if self.panel:
+            self.panel.close()
+        doc = FreeCAD.listDocuments().get(self.docName)
+        if self.error or not os.path.exists(self.out):
+            if not self.cancelled:
+                FreeCAD.Console.PrintError("ThreadProfile: background sweep of "+self.label+" failed: "+str(self.error or self.process.exitCode())+"\n")
+        elif doc: #the document may have been closed while building
+            import Part
+            shape = Part.Shape()
+            shape.read(self.out)
+            doc.openTransaction("Background sweep")
+            obj = doc.addObject("Part::Feature", "ThreadSweep")
+            obj.Shape = shape
+            obj.Placement = self.placement
+            part = doc.getObject(self.partName) if self.partName else None
+            if part:
+                part.Group = part.Group + [obj]
+            profile = doc.getObject(self.profileName)
+            if FreeCAD.GuiUp and profile:
+                profile.ViewObject.Visibility = False
+            doc.commitTransaction()
+            doc.recompute()
+        shutil.rmtree(self.folder, ignore_errors=True)
+        if self in activeBuilds:
+            activeBuilds.remove(self)
+
+    def cancel(self):
+        '''stops the worker, nothing is written to the document'''
+        self.cancelled = True
+        self.process.kill()
+
+class BackgroundSweepTaskPanel(object):
+    """Task panel with the progress of a BackgroundSweep and a Cancel button"""
+
+    def __init__(self, build):
+        from PySide import QtGui
+        self.build = build
+        self.form = QtGui.QWidget()
+        self.form.setWindowTitle("Background sweep")
+        layout = QtGui.QVBoxLayout(self.form)
+        self.message = QtGui.QLabel("Sweeping "+build.label+"\nstarting worker")
+        self.bar = QtGui.QProgressBar()
+        self.bar.setRange(0, 100)
+        layout.addWidget(self.message)
+        layout.addWidget(self.bar)
+        self.closed = False
+
+    def getStandardButtons(self):
+        from PySide import QtGui
+        return int(QtGui.QDialogButtonBox.Cancel)
+
+    def setProgress(self, percent, message):
+        self.bar.setValue(percent)
+        self.message.setText("Sweeping "+self.build.label+"\n"+message)
+
+    def reject(self):
+        self.build.cancel()
+        self.close()
+        return True
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            import FreeCADGui
+            FreeCADGui.Control.closeDialog()
+
+def startBackgroundSweep(profile, helix, part=None):
+    '''startBackgroundSweep(profile, helix, part=None): starts building the sweep of the ThreadProfile object
+    profile along the Part::Helix helix in a worker process, with a progress task panel if no other
+    task dialog is open.  The result is added to the document (and part) as a Part::Feature when the
+    worker is done.  Returns the BackgroundSweep, cancel() stops it.'''
+    build = BackgroundSweep(profile, helix, part)
+    activeBuilds.append(build)
+    if FreeCAD.GuiUp:
+        import FreeCADGui
+        if FreeCADGui.Control.activeDialog():
+            FreeCAD.Console.PrintMessage("ThreadProfile: task dialog open, sweeping "+profile.Label+" in the background without progress\n")
+        else:
+            build.panel = BackgroundSweepTaskPanel(build)
+            FreeCADGui.Control.showDialog(build.panel)
+    return build
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  ThreadProfileBatch.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Batch creation of threads.  A spec is a dict describing one thread, e.g.
+
+    {"type": "V", "preset": "M8 Coarse 1.25", "internal_or_external": "External", "thread_count": 12,
+     "x": 20, "y": 0, "z": 0, "helix": True, "sweep": True}
+
+Keys (all optional):
+    type: "V" (default), "Buttress", "Bottle", or the synthesized "ACME" and "Trapezoidal" (no presets,
+          give pitch and minor_diameter)
+    name: name of the ThreadProfile object, must contain "ThreadProfile"
+    preset: preset name, sets pitch and minor diameter
+    nominal: nominal diameter in mm, selects the nearest preset (with pitch or tpi if given)
+    pitch, tpi, minor_diameter: used as given, minor_diameter is needed if there is no preset or nominal
+    internal_or_external: "External" (default) or "Internal"
+    thread_count: number of threads, default 10
+    starts: number of starts, default 1, the helix gets a lead of starts * pitch
+    x, y, z, axis_x, axis_y, axis_z, angle: placement (angle in degrees), or placement: a FreeCAD.Placement
+    helix: make a helix, default True
+    sweep: sweep the profile along the helix, default True (needs helix)
+
+makeThreads(specs) makes all the profiles, helices and sweeps in one transaction with a single
+recompute at the end.  loadSpecs(path) reads specs from a .json file (a list of specs) or a .csv
+file (one spec per row, the keys above as column headers).  FreeCAD is only imported when threads
+are made, so the spec handling can also be used outside FreeCAD (see ThreadProfileCatalog)."""
+
+import os
+import csv
+import json
+
+#type: (object name, library ID)
+profileTypes = {
+    "V": ("VThreadProfile", "VThread"),
+    "Buttress": ("BThreadProfile", "Buttress"),
+    "Bottle": ("Bottle_M_ThreadProfile", "Bottle"),
+    "ACME": ("ACMEThreadProfile", "ACME"),
+    "Trapezoidal": ("TrapezoidalThreadProfile", "Trapezoidal"),
+}
+
+_floatKeys = ("nominal", "pitch", "tpi", "minor_diameter", "thread_count", "x", "y", "z", "axis_x", "axis_y", "axis_z", "angle")
+_intKeys = ("starts",)
+_boolKeys = ("helix", "sweep")
+
+def _toBool(value):
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "y")
+    return bool(value)
+
+def normalizeSpec(spec):
+    '''normalizeSpec(spec): returns a copy of spec with empty values dropped and numbers / booleans converted,
+    so specs read from csv files (all strings) and json files look the same'''
+    result = {}
+    for key, value in spec.items():
+        if value is None or (isinstance(value, str) and not value.strip()):
+            continue
+        if key in _floatKeys:
+            value = float(value)
+        elif key in _intKeys:
+            value = int(float(value))
+        elif key in _boolKeys:
+            value = _toBool(value)
+        elif isinstance(value, str):
+            value = value.strip()
+        result[key] = value
+    return result
+
+def loadSpecs(path):
+    '''loadSpecs(path): list of specs from a .json or .csv file'''
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, newline="") as f:
+        if ext == ".json":
+            specs = json.load(f)
+            if isinstance(specs, dict): #also allow {"threads": [...]}
+                specs = specs.get("threads", [])
+        elif ext == ".csv":
+            specs = list(csv.DictReader(f))
+        else:
+            raise ValueError("ThreadProfile: unsupported spec file type "+ext+", use .json or .csv")
+    return [normalizeSpec(spec) for spec in specs]
+
+def specPlacement(spec):
+    '''specPlacement(spec): FreeCAD.Placement from the placement keys of spec'''
+    import FreeCAD
+    if "placement" in spec:
+        return spec["placement"]
+    base = FreeCAD.Vector(spec.get("x", 0.), spec.get("y", 0.), spec.get("z", 0.))
+    axis = FreeCAD.Vector(spec.get("axis_x", 0.), spec.get("axis_y", 0.), spec.get("axis_z", 1.))
+    return FreeCAD.Placement(base, FreeCAD.Rotation(axis, spec.get("angle", 0.)))
+
+def resolvePreset(spec, library_id):
+    '''resolvePreset(spec, library_id): the ThreadProfileCore.Preset for spec, None if pitch and minor diameter are given'''
+    from ThreadProfileCore.presetdb import presetDatabase
+    db = presetDatabase(library_id)
+    if "preset" in spec:
+        preset = db.find(spec["preset"])
+        if preset is None:
+            raise ValueError("ThreadProfile: unknown "+library_id+" preset \""+spec["preset"]+"\"")
+        return preset
+    if "nominal" in spec:
+        preset = db.nearest(spec["nominal"], pitch=spec.get("pitch"), tpi=spec.get("tpi"))
+        if preset is None:
+            raise ValueError("ThreadProfile: no "+library_id+" preset near nominal "+str(spec["nominal"]))
+        return preset
+    if "minor_diameter" not in spec:
+        raise ValueError("ThreadProfile: spec needs a preset, a nominal diameter, or pitch and minor_diameter")
+    return None
+
+def makeThreads(specs, doc=None, body=None, part=None):
+    '''makeThreads(specs, doc=None, body=None, part=None): makes the ThreadProfile objects, helices and sweeps
+    for a list of specs (dicts, see module docstring) in doc (default: active document) in one transaction
+    with one recompute.  With a PartDesign body the helices get ShapeBinders in it and the sweeps are
+    Additive/Subtractive pipes.  Returns a list of (profile, helix, sweep), helix and sweep may be None.'''
+    import FreeCAD
+    from ThreadProfileObject import makeThreadProfile, makeThread
+    doc = doc or FreeCAD.ActiveDocument
+    if not doc:
+        raise RuntimeError("ThreadProfile: no active document")
+    if doc != FreeCAD.ActiveDocument:
+        FreeCAD.setActiveDocument(doc.Name)
+    results = []
+    doc.openTransaction("Make threads")
+    try:
+        for spec in specs:
+            spec = normalizeSpec(spec)
+            kind = spec.get("type", "V")
+            if kind not in profileTypes:
+                raise ValueError("ThreadProfile: unknown thread type \""+kind+"\", use one of "+", ".join(profileTypes))
+            name, library_id = profileTypes[kind]
+            preset = resolvePreset(spec, library_id)
+            external = spec.get("internal_or_external", "External")
+            profile = makeThreadProfile(name=spec.get("name", name), profile_id=library_id,
+                                        internal_or_external=external, thread_count=spec.get("thread_count", 10),
+                                        preset=preset.name if preset is not None else None, recompute=False)
+            #explicit values override the preset
+            if "pitch" in spec or "tpi" in spec:
+                profile.Pitch = spec["pitch"] if "pitch" in spec else 25.4 / spec["tpi"]
+            if "minor_diameter" in spec:
+                profile.MinorDiameter = spec["minor_diameter"]
+            if "starts" in spec:
+                profile.Starts = spec["starts"]
+            profile.Placement = specPlacement(spec)
+            helix = sweep = None
+            if spec.get("helix", True):
+                profile, helix, shapebinder, sweep = makeThread(profile, body=body, part=part, sweep=spec.get("sweep", True))
+            results.append((profile, helix, sweep))
+    except Exception:
+        doc.abortTransaction()
+        raise
+    doc.commitTransaction()
+    doc.recompute()
+    return results
+
+def makeThreadsFromFile(path, doc=None, body=None, part=None):
+    '''makeThreadsFromFile(path, doc=None, body=None, part=None): makeThreads() with the specs in a .json or .csv file'''
+    return makeThreads(loadSpecs(path), doc=doc, body=body, part=part)
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  ThreadProfileCatalog.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Headless catalog generator: makes a thread solid for every preset matching a filter and writes
+one STEP or BREP file per preset plus manifest.json with the timings, using a pool of processes.
+
+Usage (FreeCAD's lib folder on PYTHONPATH, or FreeCADCmd -c "import ThreadProfileCatalog; ThreadProfileCatalog.main([...])"):
+
+    python ThreadProfileCatalog.py --out catalog --types V --family "Metric Coarse" --side both
+    python ThreadProfileCatalog.py --out catalog --match "M1? Coarse*" "1/4 in-*" --format brep --jobs 32
+    python ThreadProfileCatalog.py --types Bottle --list
+
+Presets are selected with ThreadProfileCore only, so --list works without FreeCAD.  FreeCAD is
+imported by the worker processes, one document per preset."""
+
+import os
+import re
+import sys
+import json
+import time
+import fnmatch
+import argparse
+import multiprocessing
+
+from ThreadProfileCore.presetdb import presetDatabase
+from ThreadProfileBatch import profileTypes
+
+#Method choices: how the solid is made, see ThreadProfileSolid
+methods = ("sweep", "direct", "replicated")
+
+def selectPresets(types=None, families=None, patterns=None):
+    '''selectPresets(types=None, families=None, patterns=None): list of (type, Preset) for the presets of the
+    given types (keys of ThreadProfileBatch.profileTypes, default all) in any of families (default all)
+    whose names match any of the fnmatch patterns (default all)'''
+    selected = []
+    for kind in types or list(profileTypes):
+        if kind not in profileTypes:
+            raise ValueError("ThreadProfile: unknown thread type \""+kind+"\", use one of "+", ".join(profileTypes))
+        db = presetDatabase(profileTypes[kind][1])
+        for preset in db.presets[1:]:
+            if families and preset.family not in families:
+                continue
+            if patterns and not any(fnmatch.fnmatchcase(preset.name, pattern) for pattern in patterns):
+                continue
+            selected.append((kind, preset))
+    return selected
+
+def fileName(kind, preset_name, side, ext):
+    '''fileName(kind, preset_name, side, ext): file name for a catalog entry, safe on any file system'''
+    return re.sub(r"[^A-Za-z0-9.+-]+", "_", "%s_%s_%s" % (kind, preset_name, side)).strip("_") + "." + ext
+
+def buildOne(job):
+    '''buildOne(job): makes one catalog entry in a new document, job is a dict with the keys type, preset,
+    side, turns, method, format and out.  Returns the manifest entry, errors are reported in it.'''
+    import FreeCAD
+    from ThreadProfileObject import makeThreadProfile, makeThread
+    entry = dict(job)
+    entry.pop("out")
+    name, library_id = profileTypes[job["type"]]
+    path = os.path.join(job["out"], fileName(job["type"], job["preset"], job["side"], job["format"]))
+    doc = FreeCAD.newDocument("ThreadProfileCatalog")
+    FreeCAD.setActiveDocument(doc.Name)
+    try:
+        start = time.perf_counter()
+        profile = makeThreadProfile(name=name, profile_id=library_id,
+            internal_or_external=job["side"].capitalize(), thread_count=job["turns"], preset=job["preset"], recompute=False)
+        profile.recompute()
+        profiled = time.perf_counter()
+        if job["method"] == "sweep":
+            solid = makeThread(profile, direct=False)[3]
+        else:
+            from ThreadProfileSolid import makeThreadSolid
+            solid = makeThreadSolid(profile, method="Direct" if job["method"] == "direct" else "ReplicatedDirect")
+        doc.recompute()
+        built = time.perf_counter()
+        if job["format"] == "step":
+            solid.Shape.exportStep(path)
+        else:
+            solid.Shape.exportBrep(path)
+        exported = time.perf_counter()
+        entry.update(file=os.path.basename(path), profile_s=profiled - start, solid_s=built - profiled, export_s=exported - built,
+            total_s=exported - start, volume=solid.Shape.Volume, valid=solid.Shape.isValid())
+    except Exception as e:
+        entry.update(error=str(e))
+    finally:
+        FreeCAD.closeDocument(doc.Name)
+    return entry
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ThreadProfile headless catalog generator")
+    parser.add_argument("--out", default="catalog", help="output folder, created if needed")
+    parser.add_argument("--types", nargs="+", choices=sorted(profileTypes), help="thread types, default all")
+    parser.add_argument("--family", nargs="+", help="preset families, e.g. \"Metric Coarse\" UNC Buttress, default all")
+    parser.add_argument("--match", nargs="+", help="preset name patterns (fnmatch, e.g. \"M1? Coarse*\"), default all")
+    parser.add_argument("--side", choices=("external", "internal", "both"), default="external")
+    parser.add_argument("--turns", type=float, default=10., help="thread length in turns")
+    parser.add_argument("--method", choices=methods, default="direct", help="sweep = Helix and Part Sweep, direct / replicated = ThreadSolid")
+    parser.add_argument("--format", choices=("step", "brep"), default="step")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="worker processes, 1 = no pool")
+    parser.add_argument("--list", action="store_true", help="only list the selected presets")
+    args = parser.parse_args(argv)
+    presets = selectPresets(args.types, args.family, args.match)
+    if args.list:
+        for kind, preset in presets:
+            print("%-10s %-16s %s" % (kind, preset.family, preset.name))
+        return
+    sides = ("external", "internal") if args.side == "both" else (args.side,)
+    jobs = [dict(type=kind, preset=preset.name, side=side, turns=args.turns, method=args.method, format=args.format, out=args.out)
+            for kind, preset in presets for side in sides]
+    os.makedirs(args.out, exist_ok=True)
+    start = time.perf_counter()
+    if args.jobs > 1 and len(jobs) > 1:
+        #one document per job, the workers share nothing; maxtasksperchild keeps memory in check on long runs
+        with multiprocessing.Pool(min(args.jobs, len(jobs)), maxtasksperchild=50) as pool:
+            entries = list(pool.imap_unordered(buildOne, jobs))
+    else:
+        entries = [buildOne(job) for job in jobs]
+    entries.sort(key=lambda e: (e["type"], e["preset"], e["side"]))
+    failed = [e for e in entries if "error" in e]
+    manifest = {"jobs": args.jobs, "method": args.method, "format": args.format, "turns": args.turns,
+                "count": len(entries), "failed": len(failed), "wall_s": time.perf_counter() - start, "entries": entries}
+    with open(os.path.join(args.out, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+    print("%d files in %s, %d failed, %.1f s" % (len(entries) - len(failed), args.out, len(failed), manifest["wall_s"]))
+    for e in failed:
+        print("  %s %s %s: %s" % (e["type"], e["preset"], e["side"], e["error"]))
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
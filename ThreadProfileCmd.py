@@ -33,200 +33,82 @@ __date__    = "2020.08.27"
 __version__ = "1.66"
 version = 1.66
 
-import FreeCAD, FreeCADGui, Part, os, math, re
-from PySide import QtCore, QtGui
-import math
-import Draft
-from FreeCAD import Base
-import Draft_rc
-from PySide.QtCore import QT_TRANSLATE_NOOP
-from Draft import _DraftObject, getParam, _ViewProviderWire, formatObject, select
+import FreeCAD, os, math, re
 
+#the GUI modules only with the GUI up, ThreadProfileObject imports this module in FreeCADCmd too
 if FreeCAD.GuiUp:
+    import FreeCADGui
     from FreeCAD import Gui
+    from PySide import QtCore, QtGui
 
 __dir__ = os.path.dirname(__file__)
 iconPath = os.path.join( __dir__, 'Resources', 'icons' )
 keepToolbar = False
 
-class _ThreadProfile(_DraftObject):
-    "The ThreadProfile object"
-
-    def __init__(self, obj):
-        _DraftObject.__init__(self,obj,"ThreadProfile")
-        obj.addProperty("App::PropertyFloat", "Version", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property","The version of ThreadProfile Workbench used to create this object")).Version = version
-        obj.addProperty("App::PropertyFloat", "ThreadCount", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property","Height of thread in terms of number of threads, applied to Helix if created with workbench")).ThreadCount=10
-        obj.addProperty("App::PropertyVectorList","Points","ThreadProfile", QT_TRANSLATE_NOOP("App::Property","The points of the B-spline"))
-        obj.addProperty("App::PropertyBool","Closed","ThreadProfile",QT_TRANSLATE_NOOP("App::Property","If the B-spline is closed or not"))
-        obj.addProperty("App::PropertyBool","MakeFace","ThreadProfile",QT_TRANSLATE_NOOP("App::Property","Create a face if this spline is closed"))
-        obj.addProperty("App::PropertyArea","Area","ThreadProfile",QT_TRANSLATE_NOOP("App::Property","The area of this object"))
-        obj.addProperty("App::PropertyLength", "MinorDiameter", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "The minor diameter of the thread"))
-        obj.addProperty("App::PropertyFloatList","internal_data","ThreadProfile",QT_TRANSLATE_NOOP("App::Property", "Data used to construct internal thread"))
-        obj.addProperty("App::PropertyFloatList","external_data","ThreadProfile",QT_TRANSLATE_NOOP("App::Property", "Data used to construct external thread"))
-        obj.addProperty("App::PropertyStringList","preset_names","ThreadProfile",QT_TRANSLATE_NOOP("App::Property", "list of preset names"))
-        obj.addProperty("App::PropertyFloatList","presets_data","ThreadProfile",QT_TRANSLATE_NOOP("App::Property","list of pitches and diameters"))
-        obj.addProperty("App::PropertyLength", "Pitch", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Pitch of the thread, use 25.4 / TPI if in mm mode else 1 / TPI to convert from threads per inch"))
-        obj.addProperty("App::PropertyEnumeration", "InternalOrExternal", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Whether to make internal or external thread profile"))
-        obj.InternalOrExternal=["Internal", "External"]
-        obj.InternalOrExternal="External"
-        obj.addProperty("App::PropertyEnumeration", "Presets", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Some presets"))
-        obj.addProperty("App::PropertyIntegerConstraint", "Quality", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Quality of profile: 1 = highest quality, 12 = lowest quality, higher numbers improve performance, but degrade quality of profile, valid values = 1 through 12"))
-        obj.addProperty("App::PropertyString", "Continuity", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Continuity of the produced BSpline -- readonly"))
-        obj.addProperty("App::PropertyStringList", "Instructions", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Instructions")).Instructions=[\
-"Expand this with the ... button to view instructions",\
-"Sweep this object along a helix of the same pitch to produce your thread.",\
-"It is recommended to make the helix in the ThreadProfile workbench.",\
-"If there is an active Body the ThreadProfile object will be put into it.,"\
-"If not it can be dragged and dropped into the body later.",\
-"If there is an active Body when the helix is made there will be made a ShapeBinder for it",\
-"For internal threads you will need to cut the Sweep object out of a cylinder, or if using Part Design sweep it as a Subtractive Pipe.",\
-"Always use Frenet mode",\
-"I have provided some presets, but it is possible there could be some errors.  Double check for mission critical applications.",\
-"Also, the tolerances might be different from what you wish to have.  I believe the internal minor diameters are all minimum and the external are all maximum.",\
-]
-        obj.Quality = (1,1,12,1) #1 default, 1 minimum, 12 max, 1 step size
-        obj.setEditorMode("internal_data", 2) #0 = normal, 1 = readonly, 2 = hidden
-        obj.setEditorMode("Closed", 2)
-        obj.setEditorMode("MakeFace", 2)
-        obj.setEditorMode("external_data", 2)
-        obj.setEditorMode("Area", 2)
-        obj.setEditorMode("Version", 1)
-        obj.setEditorMode("Continuity", 1)
-        obj.setEditorMode("preset_names", 2)
-        obj.setEditorMode("presets_data", 2)
-        obj.MakeFace = getParam("fillmode",True)
-        obj.Closed = True
-        obj.Points = []
-        self.assureProperties(obj)
-
-
-    def assureProperties(self, obj): # for Compatibility with older versions
-        if not hasattr(obj, "Parameterization"):
-            obj.addProperty("App::PropertyFloat","Parameterization","ThreadProfile",QT_TRANSLATE_NOOP("App::Property","Parameterization factor"))
-            obj.Parameterization = 1.0
-            obj.setEditorMode("Parameterization", 2)
-            self.knotSeq = []
-
-    def parameterization (self, pts, a, closed):
-        # Computes a knot Sequence for a set of points
-        # fac (0-1) : parameterization factor
-        # fac=0 -> Uniform / fac=0.5 -> Centripetal / fac=1.0 -> Chord-Length
-        if closed: # we need to add the first point as the end point
-            pts.append(pts[0])
-        params = [0]
-        for i in range(1,len(pts)):
-            p = pts[i].sub(pts[i-1])
-            pl = pow(p.Length,a)
-            params.append(params[-1] + pl)
-        return params
-
-    def makePoints(self, obj):
-        if hasattr(obj.Pitch,"Value"): #compatibility with objects created with version <= 1.20
-            pitch = obj.Pitch.Value
-        else:
-            pitch = obj.Pitch
-        minor_diameter = obj.MinorDiameter.Value
-        if "external" in obj.InternalOrExternal.lower():
-            external = True
-        else:
-            if "internal" in obj.InternalOrExternal.lower():
-                external=False
-            else:
-                FreeCAD.Console.PrintWarning("ThreadProfile: Unable to determine internal or external thread type, using external\n")
-                external=True
-        step = obj.Quality #1 means do not skip any points, 2 means use every other, 3 every 3rd, etc.
-        points = []
-        alpha = 0
-        idx = obj.preset_names.index(obj.Presets)
-        if external:
-            our_data = obj.external_data
-        else:
-            our_data = obj.internal_data
-        for ii in range(0, len(our_data),step):
-            alpha += math.pi * 2 / len(our_data) * step
-            od = our_data[ii]
-            radius = minor_diameter / 2 + od * pitch
-            x = math.cos(alpha) * radius
-            y = math.sin(alpha) * radius
-            points.append(Base.Vector(x,y,0))
-            
-        return points
-
-
-    def onChanged(self, fp, prop):
-        if prop == "Parameterization":
-            if fp.Parameterization < 0.:
-                fp.Parameterization = 0.
-            if fp.Parameterization > 1.0:
-                fp.Parameterization = 1.0
-        if prop == "Presets" or prop == "InternalOrExternal":
-            if hasattr(fp,"Presets"):
-                preset_string = getattr(fp,"Presets")
-                if preset_string in fp.preset_names:
-                    idx = fp.preset_names.index(preset_string)
-                    if idx != 0:
-                        fp.Pitch = fp.presets_data[idx*3]
-                        if "External" in fp.InternalOrExternal:
-                            fp.MinorDiameter = fp.presets_data[idx*3+1]
-                        else:
-                            fp.MinorDiameter = fp.presets_data[idx*3+2]
-        if prop == "ThreadCount":
-            ins = fp.InList
-            for inobj in ins:
-                if hasattr(inobj,"Spine"):
-                    spine = inobj.Spine
-                    helix = spine[0]
-                    edgeNames = []
-                    for ii in range(1,int(getattr(fp,prop))):
-                        edgeNames.append("Edge"+str(ii))
-                    inobj.Spine = [helix,edgeNames]
-
-
-    def execute(self, obj):
-        obj.Points = self.makePoints(obj)
-        import Part
-        self.assureProperties(obj)
-        if obj.Points:
-            self.knotSeq = self.parameterization(obj.Points, obj.Parameterization, obj.Closed)
-            plm = obj.Placement
-            if obj.Closed and (len(obj.Points) > 2):
-                if obj.Points[0] == obj.Points[-1]:  # should not occur, but OCC will crash
-                    FreeCAD.Console.PrintError(QT_TRANSLATE_NOOP('draft',  "_ThreadProfile.createGeometry: Closed with same first/last Point. Geometry not updated.")+"\n")
-                    return
-                spline = Part.BSplineCurve()
-                #spline.interpolate(obj.Points, PeriodicFlag = True, Parameters = self.knotSeq)
-                spline.approximate(Points = obj.Points, DegMin = 3, DegMax = 5, Tolerance = .003692, Continuity = 'C3', ParamType = 'ChordLength')
-                spline.setPeriodic()
-                # DNC: bug fix: convert to face if closed
-                shape = Part.Wire(spline.toShape())
-                # Creating a face from a closed spline cannot be expected to always work
-                # Usually, if the spline is not flat the call of Part.Face() fails
-                try:
-                    if hasattr(obj,"MakeFace"):
-                        if obj.MakeFace:
-                            shape = Part.Face(shape)
-                    else:
-                        shape = Part.Face(shape)
-                except Part.OCCError:
-                    pass
-                obj.Shape = shape
-                if hasattr(obj,"Area") and hasattr(shape,"Area"):
-                    obj.Area = shape.Area
-            else:
-                spline = Part.BSplineCurve()
-                #spline.interpolate(obj.Points, PeriodicFlag = False, Parameters = self.knotSeq)
-                spline.approximate(Points = obj.Points, DegMin = 3, DegMax = 5, Tolerance = .003692, Continuity = 'C3', ParamType = 'ChordLength')
-                spline.setPeriodic()
-                shape = spline.toShape()
-                obj.Shape = shape
-                if hasattr(obj,"Area") and hasattr(shape,"Area"):
-                    obj.Area = shape.Area
-            obj.Continuity = spline.Continuity
-            obj.Placement = plm
-        obj.positionBySupport()
-
-    # for compatibility with older versions
-    _ViewProviderBSpline = _ViewProviderWire
+def __getattr__(name):
+    #the ThreadProfile object class lives in ThreadProfileObject, which imports Draft and Part,
+    #so it is only imported when an object is created or a document containing one is restored
+    #(documents refer to the class as ThreadProfileCmd._ThreadProfile)
+    if name in ("_ThreadProfile", "shapeCache"):
+        import ThreadProfileObject
+        return getattr(ThreadProfileObject, name)
+    raise AttributeError("module 'ThreadProfileCmd' has no attribute '"+name+"'")
+
+#######################################################################################
+# Selection, classified once per selection change for the IsActive() methods
+
+class SelectionCache(object):
+    """Selection observer, keeps the names of the selected ThreadProfile, Helix and ShapeBinder so the
+    IsActive() methods, called on every GUI refresh, do not have to go through the selection"""
+
+    def __init__(self):
+        self.dirty = True
+        self.docName = None
+        self.count = 0
+        self.first = None #name of the first selected object
+        self.profile = None
+        self.helix = None
+        self.shapebinder = None
+        self.profiles = [] #names of all selected ThreadProfile objects
+
+    def changed(self, *args):
+        self.dirty = True
+
+    #observer callbacks, (doc, obj, sub, pnt), (doc, obj, sub), (doc) and (doc)
+    addSelection = removeSelection = setSelection = clearSelection = changed
+
+    def classify(self):
+        '''goes through the selection, only if it changed since the last call, returns self'''
+        doc = FreeCAD.ActiveDocument
+        docName = doc.Name if doc else None
+        if not self.dirty and docName == self.docName: #switching documents is no selection event
+            return self
+        self.__init__()
+        self.dirty = False
+        self.docName = docName
+        if not doc:
+            return self
+        selection = Gui.Selection.getSelectionEx()
+        self.count = len(selection)
+        for s in selection:
+            name = getattr(getattr(s, "Object", None), "Name", "")
+            if self.first is None:
+                self.first = name
+            if "ThreadProfile" in name:
+                self.profile = name
+                self.profiles.append(name)
+            if "Helix" in name:
+                self.helix = name
+            if "ShapeBinder" in name:
+                self.shapebinder = name
+        return self
+
+    def selectedProfile(self):
+        '''name of the ThreadProfile object if it is the first selected object, else None'''
+        self.classify()
+        return self.first if self.first and "ThreadProfile" in self.first else None
+
+selectionCache = SelectionCache()
 
 #######################################################################################
 # Keep Toolbar active even after leaving workbench
@@ -250,7 +132,7 @@ class ThreadProfileSettingsCommandClass(object):
         pg.SetBool("LinkHelixPlacementParametrically", True)
         keep = pg.GetBool('KeepToolbar',True)
         mostRecentTypesLength = pg.GetInt('mruLength',5)
-        items=["Keep the toolbar active","Do not keep the toolbar active","Link helix placement parametrically", "Do not link helix placement parametrically","Cancel"]
+        items=["Keep the toolbar active","Do not keep the toolbar active","Link helix placement parametrically", "Do not link helix placement parametrically","Make Thread makes a direct thread solid (no helix or sweep)","Make Thread makes a helix and sweep","Enable instrumentation (recompute times, see Recompute Report)","Disable instrumentation","Do Sweep builds in the background (helix only, no body)","Do Sweep builds immediately","Cancel"]
         item,ok = QtGui.QInputDialog.getItem(window,'ThreadProfile','Settings\n\nSelect the settings option\n',items,0,False)
         if ok and item == items[-1]:
             return
@@ -264,6 +146,18 @@ class ThreadProfileSettingsCommandClass(object):
             pg.SetBool('LinkHelixPlacementParametrically', True)
         elif ok and item == items[3]:
             pg.SetBool('LinkHelixPlacementParametrically', False)
+        elif ok and item == items[4]:
+            pg.SetBool('UseDirectSolid', True)
+        elif ok and item == items[5]:
+            pg.SetBool('UseDirectSolid', False)
+        elif ok and item == items[6]:
+            pg.SetBool('Instrumentation', True)
+        elif ok and item == items[7]:
+            pg.SetBool('Instrumentation', False)
+        elif ok and item == items[8]:
+            pg.SetBool('BackgroundSweep', True)
+        elif ok and item == items[9]:
+            pg.SetBool('BackgroundSweep', False)
         return
    
     def IsActive(self):
@@ -272,14 +166,63 @@ class ThreadProfileSettingsCommandClass(object):
 
 #Gui.addCommand("ThreadProfileKeepToolbar", ThreadProfileKeepToolbarCommandClass())
 ###################################################################################
+# Helix and sweep, used by the commands and by ThreadProfileBatch
+
+def makeHelix(profile, body=None, part=None):
+    '''makeHelix(profile, body=None, part=None): see ThreadProfileObject.makeHelix()'''
+    import ThreadProfileObject
+    return ThreadProfileObject.makeHelix(profile, body=body, part=part)
+
+def makeSweep(profile, spine, body=None):
+    '''makeSweep(profile, spine, body=None): see ThreadProfileObject.makeSweep()'''
+    import ThreadProfileObject
+    return ThreadProfileObject.makeSweep(profile, spine, body=body)
+
+def makeThread(profile=None, body=None, part=None, sweep=True, direct=None):
+    '''makeThread(profile=None, body=None, part=None, sweep=True, direct=None): see ThreadProfileObject.makeThread()'''
+    import ThreadProfileObject
+    return ThreadProfileObject.makeThread(profile, body=body, part=part, sweep=sweep, direct=direct)
+
+###################################################################################
+
+class ThreadProfileMakeThreadCommandClass(object):
+    """Make Thread command, profile, helix and sweep in one go"""
+
+    def GetResources(self):
+        return {'Pixmap'  : os.path.join( iconPath , 'MakeThread.svg') ,
+            'MenuText': "Make &Thread" ,
+            'ToolTip' : "Make helix and sweep (or a direct thread solid, see Settings) for the selected thread profile in one step, or a new V thread if none is selected"}
+
+    def Activated(self):
+        doc = FreeCAD.ActiveDocument
+        from PySide import QtGui,QtCore
+        name = selectionCache.selectedProfile()
+        profile = doc.getObject(name) if name else None
+        body=FreeCADGui.ActiveDocument.ActiveView.getActiveObject("pdbody")
+        part=FreeCADGui.ActiveDocument.ActiveView.getActiveObject("part")
+        QtGui.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
+        doc.openTransaction("Make Thread")
+        try:
+            makeThread(profile, body=body, part=part)
+        except Exception as e:
+            FreeCAD.Console.PrintError("ThreadProfile Error: Exception making thread: "+str(e)+"\n")
+            doc.abortTransaction()
+            QtGui.QApplication.restoreOverrideCursor()
+            return
+        doc.commitTransaction()
+        doc.recompute()
+        QtGui.QApplication.restoreOverrideCursor()
+        return
+
+    def IsActive(self):
+        if not FreeCAD.ActiveDocument:
+            return False
+        return True
+
+###################################################################################
 
 class ThreadProfileMakeHelixCommandClass(object):
     """Make Helix command"""
-    def __init__(self):
-        self.Pitch = None
-        self.Placement = None
-        self.Name = None
-
     def GetResources(self):
         return {'Pixmap'  : os.path.join( iconPath , 'MakeHelix.svg') ,
             'MenuText': "&Make Helix" ,
@@ -289,34 +232,9 @@ class ThreadProfileMakeHelixCommandClass(object):
         doc = FreeCAD.ActiveDocument
         doc.openTransaction("Make Helix")
         import Part,PartGui
-        doc.addObject("Part::Helix","Helix")
-        doc.recompute()
-        name = doc.ActiveObject.Name
-        getattr(doc,name).Label = name
-        getattr(doc,name).setExpression("Pitch",self.Name+'.Pitch')
-        getattr(doc,name).setExpression("Height",self.Name+'.ThreadCount*'+self.Name+'.Pitch')
-        pg = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/ThreadProfile")
-        if pg.GetBool("LinkHelixPlacementParametrically", True):
-            getattr(doc,name).setExpression('Placement.Base.x',self.Name+'.Placement.Base.x')
-            getattr(doc,name).setExpression('Placement.Base.y',self.Name+'.Placement.Base.y')
-            getattr(doc,name).setExpression('Placement.Base.z',self.Name+'.Placement.Base.z')
-            getattr(doc,name).setExpression('Placement.Rotation.Angle',self.Name+'.Placement.Rotation.Angle')
-            getattr(doc,name).setExpression('Placement.Rotation.Axis.x',self.Name+'.Placement.Rotation.Axis.x')
-            getattr(doc,name).setExpression('Placement.Rotation.Axis.y',self.Name+'.Placement.Rotation.Axis.y')
-            getattr(doc,name).setExpression('Placement.Rotation.Axis.z',self.Name+'.Placement.Rotation.Axis.z')
-        else:
-            getattr(doc,name).Placement=self.Placement
         body=FreeCADGui.ActiveDocument.ActiveView.getActiveObject("pdbody")
         part=FreeCADGui.ActiveDocument.ActiveView.getActiveObject("part")
-        if part:
-            part.Group=part.Group+[getattr(doc,name)]
-        if body:
-            pass
-            import PartDesignGui
-            getattr(doc,body.Name).newObject('PartDesign::ShapeBinder','ShapeBinder')
-            getattr(doc,doc.ActiveObject.Name).Support = [(getattr(doc,name),'')]
-            getattr(FreeCADGui.ActiveDocument,name).Visibility=False
-
+        makeHelix(getattr(doc,selectionCache.selectedProfile()), body=body, part=part)
         doc.commitTransaction()
         doc.recompute()
         return
@@ -324,29 +242,15 @@ class ThreadProfileMakeHelixCommandClass(object):
     def IsActive(self):
         if not FreeCAD.ActiveDocument:
             return False
-        selection = Gui.Selection.getSelectionEx()
-        if not selection:
-            return False
-        if not "ThreadProfile" in selection[0].Object.Name:
-            return False
-        else:
-            self.Pitch = selection[0].Object.Pitch
-            self.Placement = selection[0].Object.Placement
-            self.Name = selection[0].Object.Name
-        return True
+        return selectionCache.selectedProfile() is not None
 ###################################################################################
 
 class ThreadProfileDoSweepCommandClass(object):
     """Perform sweep command"""
-    def __init__(self):
-        self.helixName = None
-        self.profileName = None
-        self.shapebinderName = None
-
     def GetResources(self):
         return {'Pixmap'  : os.path.join( iconPath , 'DoSweep.svg') ,
             'MenuText': "&Do Sweep" ,
-            'ToolTip' : "Sweep selected thread profile along selected helix or shapebinder"}
+            'ToolTip' : "Sweep selected thread profile along selected helix or shapebinder, optionally in the background (see Settings)"}
  
     def Activated(self):
         doc = FreeCAD.ActiveDocument
@@ -354,39 +258,31 @@ class ThreadProfileDoSweepCommandClass(object):
         import Part
         from PySide import QtGui,QtCore
         body = FreeCADGui.ActiveDocument.ActiveView.getActiveObject("pdbody")
+        selected = selectionCache.classify()
+        profile = getattr(doc,selected.profile)
+        pg = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/ThreadProfile")
+        if selected.helix and pg.GetBool("BackgroundSweep", False):
+            import ThreadProfileBackground
+            helix = getattr(doc,selected.helix)
+            if ThreadProfileBackground.canBuildInBackground(profile, helix):
+                part = FreeCADGui.ActiveDocument.ActiveView.getActiveObject("part")
+                try:
+                    ThreadProfileBackground.startBackgroundSweep(profile, helix, part=part)
+                    return
+                except Exception as e:
+                    FreeCAD.Console.PrintWarning("ThreadProfile: background sweep failed to start, sweeping now: "+str(e)+"\n")
+            else:
+                FreeCAD.Console.PrintWarning("ThreadProfile: background sweep needs a right handed helix with the profile's placement and FreeCADCmd, sweeping now\n")
         QtGui.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
-        if self.helixName:
+        if selected.helix:
             doc.openTransaction("Perform sweep")
-            doc.addObject('Part::Sweep','Sweep')
-            doc.ActiveObject.Sections=[getattr(doc,self.profileName),]
-            edgeList = []
-            count = len(getattr(doc,self.helixName).Shape.Edges)
-            for ii in range(1,count+1):
-                edgeList.append("Edge"+str(ii))
-            doc.ActiveObject.Spine=(getattr(doc,self.helixName),edgeList)
-            doc.ActiveObject.Solid=True
-            doc.ActiveObject.Frenet=True
-            FreeCADGui.getDocument(doc.Name).getObject(self.profileName).Visibility = False
-            FreeCADGui.getDocument(doc.Name).getObject(self.helixName).Visibility = False
+            makeSweep(profile, getattr(doc,selected.helix))
         elif body: #if there is active part design body
-            if "External" in getattr(doc,self.profileName).InternalOrExternal:
-                #additive part design sweep
+            if "External" in profile.InternalOrExternal:
                 doc.openTransaction("AdditivePipe")
-                pipe = body.newObject("PartDesign::AdditivePipe","AdditivePipe")
             else:
                 doc.openTransaction("SubtractivePipe")
-                pipe = body.newObject("PartDesign::SubtractivePipe","SubtractivePipe")
-
-            pipe.Profile = getattr(doc, self.profileName)
-            pipe.Spine = getattr(doc,self.shapebinderName)
-            pipe.Mode = 'Frenet'
-            Gui.activeDocument().hide(self.profileName)
-            Gui.activeDocument().hide(self.shapebinderName)
-            pipe.ViewObject.ShapeColor=body.ViewObject.ShapeColor
-            pipe.ViewObject.LineColor=body.ViewObject.LineColor
-            pipe.ViewObject.PointColor=body.ViewObject.PointColor
-            pipe.ViewObject.Transparency=body.ViewObject.Transparency
-            pipe.ViewObject.DisplayMode=body.ViewObject.DisplayMode
+            pipe = makeSweep(profile, getattr(doc,selected.shapebinder), body=body)
             pipe.ViewObject.makeTemporaryVisible(True)
             FreeCADGui.activeDocument().setEdit(pipe.Name,0)
             FreeCADGui.getDocument(doc.Name).getObject(pipe.Name).Visibility=True
@@ -398,58 +294,210 @@ class ThreadProfileDoSweepCommandClass(object):
     def IsActive(self):
         if not FreeCAD.ActiveDocument:
             return False
-        selection = Gui.Selection.getSelectionEx()
-        if not selection:
-            return False
-        if len(selection) != 2:
-            return False
-        profileFound = False
-        helixFound = False
-        self.helixName = ''
-        for s in selection:
-            if hasattr(s,"Object") and hasattr(s.Object,"Name") and "ThreadProfile" in s.Object.Name:
-                profileFound = True
-                self.profileName = s.Object.Name
-            if hasattr(s, "Object") and hasattr(s.Object,"Name") and "Helix" in s.Object.Name:
-                helixFound = True
-                self.helixName = s.Object.Name
-            if hasattr(s, "Object") and hasattr(s.Object,"Name") and "ShapeBinder" in s.Object.Name:
-                helixFound = True
-                self.shapebinderName = s.Object.Name
-        if profileFound and helixFound:
-            return True
-        else:
-            return False
+        selected = selectionCache.classify()
+        return selected.count == 2 and bool(selected.profile) and bool(selected.helix or selected.shapebinder)
 
 ###################################################################################
 
+#standard: (limits function name in ThreadProfileCore.standards, (internal, external) class choices)
+calculatorStandards = {
+    "ISO 965 metric": ("isoMetricLimits", ["6H / 6h", "6H / 6g", "5H / 5g6g", "7H / 7g6g", "6G / 6g", "6H / 6f", "6H / 6e", "4H / 4h"]),
+    "ASME B1.1 unified inch": ("unifiedLimits", ["3B / 3A", "2B / 2A", "1B / 1A"]),
+    "ANSI B1.9 buttress": ("buttressLimits", ["2 / 2", "3 / 3", "1 / 1"]),
+}
+
+def threadLimits(standard, nominal, pitch, classes=None, engagement=None):
+    '''threadLimits(standard, nominal, pitch, classes=None, engagement=None): ThreadProfileCore.standards.ThreadLimits of one
+    size, standard is a key of calculatorStandards, classes "internal / external" (default the first choice),
+    engagement S, N, L (metric only) or a length in mm, None for the standard's default'''
+    from ThreadProfileCore import standards
+    function, choices = calculatorStandards[standard]
+    internal, external = [c.strip() for c in (classes or choices[0]).split("/")]
+    if function == "isoMetricLimits":
+        return standards.isoMetricLimits([nominal], [pitch], internal, external, engagement or "N")
+    if isinstance(engagement, str):
+        engagement = None
+    return getattr(standards, function)([nominal], [pitch], internal, external, engagement)
+
 class ThreadProfileOpenOnlineCalculatorCommandClass(object):
-    """Open Online Calculator command"""
+    """Thread calculator command, tolerance limits computed locally, the online calculators are still offered"""
     def __init__(self):
         pass
 
     def GetResources(self):
         return {'Pixmap'  : os.path.join( iconPath , 'OpenOnlineCalculator.svg') ,
-            'MenuText': "&Open Online Calculator" ,
-            'ToolTip' : "Open online calculator to determine minor diameter for desired thread fit."}
- 
+            'MenuText': "&Thread Calculator" ,
+            'ToolTip' : "Compute the diameter limits of a metric, unified inch or buttress thread for a tolerance class and length of engagement, and optionally set the minor diameter of the selected ThreadProfile object.  The online calculators can still be opened."}
+
     def Activated(self):
         import webbrowser
-        items = ["Open online metric calculator", "Open online unified inch calculator", "Open online ANSI buttress thread calculator","Cancel"]
+        items = ["Calculate thread limits (ISO 965, ASME B1.1, ANSI B1.9)", "Open online metric calculator", "Open online unified inch calculator", "Open online ANSI buttress thread calculator","Cancel"]
         window = QtGui.QApplication.activeWindow()
-        item,ok = QtGui.QInputDialog.getItem(window,'ThreadProfile','Open online calculator in default browser?',items,0,False)
+        item,ok = QtGui.QInputDialog.getItem(window,'ThreadProfile','Thread calculator',items,0,False)
         if ok and item == items[0]:
-            webbrowser.open('https://www.amesweb.info/Screws/IsoMetricScrewThread.aspx')
+            self.calculate(window)
         elif ok and item == items[1]:
-            webbrowser.open('https://www.amesweb.info/Screws/AsmeUnifiedInchScrewThread.aspx')
+            webbrowser.open('https://www.amesweb.info/Screws/IsoMetricScrewThread.aspx')
         elif ok and item == items[2]:
+            webbrowser.open('https://www.amesweb.info/Screws/AsmeUnifiedInchScrewThread.aspx')
+        elif ok and item == items[3]:
             webbrowser.open('https://www.amesweb.info/Screws/ButtressInchScrewThreads.aspx')
 
         return
-   
+
+    def calculate(self, window):
+        '''asks for the thread, defaults from the selected ThreadProfile object, shows the limits and offers to set
+        the minor diameter of the object'''
+        from ThreadProfileCore import parseNominal
+        from ThreadProfileCore.standards import presetMinors, limitsSummary
+        name = selectionCache.selectedProfile() if FreeCAD.ActiveDocument else None
+        profile = FreeCAD.ActiveDocument.getObject(name) if name else None
+        names = list(calculatorStandards)
+        index, nominal, pitch = 0, 10., 1.5
+        if profile:
+            preset = profile.Presets if hasattr(profile, "Presets") else ""
+            index = 2 if "Buttress" in getattr(profile, "ProfileId", "") else 1 if ("UNC" in preset or "UNF" in preset) else 0
+            nominal = parseNominal(preset) or nominal
+            pitch = getattr(profile.Pitch, "Value", profile.Pitch)
+        standard,ok = QtGui.QInputDialog.getItem(window,'ThreadProfile','Standard',names,index,False)
+        if not ok:
+            return
+        nominal,ok = QtGui.QInputDialog.getDouble(window,'ThreadProfile','Nominal diameter (mm)',nominal,0.5,2000.,4)
+        if not ok:
+            return
+        pitch,ok = QtGui.QInputDialog.getDouble(window,'ThreadProfile','Pitch (mm, 25.4 / TPI for inch threads)',pitch,0.05,50.,5)
+        if not ok:
+            return
+        classes,ok = QtGui.QInputDialog.getItem(window,'ThreadProfile','Tolerance classes, internal / external',calculatorStandards[standard][1],0,False)
+        if not ok:
+            return
+        engagement = None
+        if standard.startswith("ISO"):
+            engagement,ok = QtGui.QInputDialog.getItem(window,'ThreadProfile','Length of engagement',["N","S","L"],0,False)
+            if not ok:
+                return
+        try:
+            limits = threadLimits(standard, nominal, pitch, classes, engagement)
+        except ValueError as e:
+            QtGui.QMessageBox.warning(window, "ThreadProfile thread calculator", str(e))
+            return
+        report = "\n".join(limitsSummary(limits))
+        FreeCAD.Console.PrintMessage("ThreadProfile thread calculator:\n"+report+"\n")
+        if not profile:
+            QtGui.QMessageBox.information(window, "ThreadProfile thread calculator", report)
+            return
+        materials = ["Do not change "+profile.Label, "Set minor diameter, maximum material", "Set minor diameter, middle of the pitch diameter tolerance", "Set minor diameter, minimum material"]
+        item,ok = QtGui.QInputDialog.getItem(window,'ThreadProfile thread calculator',report+"\n\nMinor diameter of "+profile.Label+" ("+profile.InternalOrExternal+")",materials,0,False)
+        if not ok or item == materials[0]:
+            return
+        external, internal = presetMinors(limits, ("max", "mid", "min")[materials.index(item) - 1])
+        doc = profile.Document
+        doc.openTransaction("Set minor diameter")
+        profile.MinorDiameter = float((external if "external" in profile.InternalOrExternal.lower() else internal)[0])
+        doc.commitTransaction()
+        doc.recompute()
+
+    def IsActive(self):
+        return True
+
+
+####################################################################################
+# Report of the instrumentation recorded by ThreadProfile objects
+
+def instrumentationReport(doc=None):
+    '''instrumentationReport(doc=None): list of (object, TimeTotal, TimePoints, TimeApproximation, TimeFace,
+    TimePlacement, PointCount, SplinePoles, CacheHit) for the ThreadProfile objects in doc (default:
+    active document) that recorded timings, most expensive first'''
+    doc = doc or FreeCAD.ActiveDocument
+    rows = []
+    for obj in doc.Objects if doc else []:
+        if hasattr(obj, "TimeTotal"): #only ThreadProfile objects with instrumentation have it
+            rows.append((obj, obj.TimeTotal, obj.TimePoints, obj.TimeApproximation, obj.TimeFace,
+                         obj.TimePlacement, obj.PointCount, obj.SplinePoles, obj.CacheHit))
+    rows.sort(key=lambda row: -row[1])
+    return rows
+
+class ThreadProfileReportCommandClass(object):
+    """Instrumentation report command"""
+
+    def GetResources(self):
+        return {'Pixmap'  : os.path.join( iconPath , 'Report.svg') ,
+            'MenuText': "&Recompute Report" ,
+            'ToolTip' : "Report the recompute times of the ThreadProfile objects in the document, most expensive first (enable instrumentation in Settings)"}
+
+    def Activated(self):
+        pg = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/ThreadProfile")
+        rows = instrumentationReport()
+        if not rows:
+            state = "on" if pg.GetBool("Instrumentation", False) else "off (turn it on in Settings)"
+            FreeCAD.Console.PrintMessage("ThreadProfile: no timings recorded yet, instrumentation is "+state+", then recompute the objects\n")
+            return
+        lines = ["%-24s %9s %9s %9s %9s %9s %7s %6s %s" % ("Object", "total ms", "points", "approx", "face", "placement", "points", "poles", "cached")]
+        for obj, total, points, approx, face, placement, count, poles, hit in rows:
+            lines.append("%-24s %9.2f %9.2f %9.2f %9.2f %9.2f %7d %6d %s" % (obj.Label[:24], total, points, approx, face, placement, count, poles, "yes" if hit else ""))
+        lines.append("%-24s %9.2f" % ("Sum", sum(row[1] for row in rows)))
+        report = "\n".join(lines)
+        FreeCAD.Console.PrintMessage("ThreadProfile recompute report:\n"+report+"\n")
+        window = QtGui.QApplication.activeWindow()
+        box = QtGui.QMessageBox(window)
+        box.setWindowTitle("ThreadProfile recompute report")
+        box.setText("%d ThreadProfile objects, %.1f ms in total, most expensive first.  Also printed in the report view." % (len(rows), sum(row[1] for row in rows)))
+        box.setDetailedText(report)
+        box.exec_()
+
     def IsActive(self):
+        if not FreeCAD.ActiveDocument:
+            return False
         return True
 
+####################################################################################
+# Fit of an internal and an external thread from the profile data
+
+def fitProfiles(internal, external):
+    '''fitProfiles(internal, external): ThreadProfileCore.fit.Fit of the internal and external ThreadProfile objects,
+    from their profile data, pitch and minor diameters.  Raises ValueError if they cannot mate.'''
+    from ThreadProfileCore.fit import analyzeFit
+    internal_data, pitch, internal_minor = internal.Proxy.getProfileData(internal)[:3]
+    external_data, external_pitch, external_minor = external.Proxy.getProfileData(external)[:3]
+    if abs(pitch - external_pitch) > 1e-6 or getattr(internal, "Starts", 1) != getattr(external, "Starts", 1):
+        raise ValueError("ThreadProfile: "+internal.Label+" and "+external.Label+" differ in pitch or starts")
+    return analyzeFit(internal_data, external_data, pitch, internal_minor, external_minor)
+
+class ThreadProfileFitCommandClass(object):
+    """Fit analysis command"""
+
+    def GetResources(self):
+        return {'Pixmap'  : os.path.join( iconPath , 'Fit.svg') ,
+            'MenuText': "&Fit Analysis" ,
+            'ToolTip' : "Select an internal and an external ThreadProfile object to report their clearances, axial play, pitch diameter allowance and any interference"}
+
+    def Activated(self):
+        doc = FreeCAD.ActiveDocument
+        profiles = [doc.getObject(name) for name in selectionCache.classify().profiles]
+        internal = [p for p in profiles if "internal" in p.InternalOrExternal.lower()]
+        external = [p for p in profiles if "external" in p.InternalOrExternal.lower()]
+        window = QtGui.QApplication.activeWindow()
+        if len(internal) != 1 or len(external) != 1:
+            QtGui.QMessageBox.warning(window, "ThreadProfile fit analysis", "Select one internal and one external ThreadProfile object.")
+            return
+        try:
+            fit = fitProfiles(internal[0], external[0])
+        except ValueError as e:
+            QtGui.QMessageBox.warning(window, "ThreadProfile fit analysis", str(e))
+            return
+        from ThreadProfileCore.fit import fitSummary
+        report = "\n".join(fitSummary(fit))
+        title = internal[0].Label+" / "+external[0].Label
+        FreeCAD.Console.PrintMessage("ThreadProfile fit of "+title+":\n"+report+"\n")
+        box = QtGui.QMessageBox(window)
+        box.setWindowTitle("ThreadProfile fit analysis")
+        box.setText(title+"\n\n"+report)
+        box.exec_()
+
+    def IsActive(self):
+        if not FreeCAD.ActiveDocument:
+            return False
+        return len(selectionCache.classify().profiles) == 2
 
 ####################################################################################
 # Create the thread profile object
@@ -489,318 +537,13 @@ class ThreadProfileCreateObjectCommandClass(object):
                 "installation of the ThreadProfile workbench is required.",
 ]
 
-    def makeThreadProfile(self,name="VThreadProfile",minor_diameter=4.773,pitch=1,internal_or_external="External",internal_data=[],external_data=[],presets=[],thread_count=10):
-        '''minor_diameter=4.891,pitch=1,closed=True,placement=None,face=None,support=None,internal_or_external="External",internal_data=[],external_data=[]): Creates a thread profile object
-    that can be swept along a helix to produce a thread.  Code is based on Draft.makeBSpline()'''
-        if not FreeCAD.ActiveDocument:
-            FreeCAD.Console.PrintError("No active document. Aborting\n")
-            return
-        else: fname = name
-        obj = FreeCAD.ActiveDocument.addObject("Part::Part2DObjectPython",fname)
-        _ThreadProfile(obj)
-        obj.Closed = True
-        obj.Support = None
-        #allow to include custom thread profile for internal_data or external_data
-        #these are 720 floats of the x-coordinates
-        #of a thread profile with pitch=1 sketched on the xz plane
-        #with x=0 at the minor radius of the profile
-        #the element position is the z-coordinate / 720 (2 points per degree)
-        #y-coordinate is always zero
-        #the thread profile produced is a function of these values, minor diameter, and pitch
-        if len(internal_data)==0:
-            obj.internal_data = [0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.002405626122,0.004811252243,0.007216878365,0.009622504486,0.012028130608,0.01443375673,0.016839382851,0.019245008973,0.021650635095,0.024056261216,0.026461887338,0.028867513459,0.031273139581,0.033678765703,0.036084391824,0.038490017946,0.040895644068,0.043301270189,0.045706896311,0.048112522432,0.050518148554,0.052923774676,0.055329400797,0.057735026919,0.060140653041,0.062546279162,0.064951905284,0.067357531405,0.069763157527,0.072168783649,0.07457440977,0.076980035892,0.079385662014,0.081791288135,0.084196914257,0.086602540378,0.0890081665,0.091413792622,0.093819418743,0.096225044865,0.098630670987,0.101036297108,0.10344192323,0.105847549351,0.108253175473,0.110658801595,0.113064427716,0.115470053838,0.11787567996,0.120281306081,0.122686932203,0.125092558324,0.127498184446,0.129903810568,0.132309436689,0.134715062811,0.137120688933,0.139526315054,0.141931941176,0.144337567297,0.146743193419,0.149148819541,0.151554445662,0.153960071784,0.156365697906,0.158771324027,0.161176950149,0.16358257627,0.165988202392,0.168393828514,0.170799454635,0.173205080757,0.175610706879,0.178016333,0.180421959122,0.182827585243,0.185233211365,0.187638837487,0.190044463608,0.19245008973,0.194855715851,0.197261341973,0.199666968095,0.202072594216,0.204478220338,0.20688384646,0.209289472581,0.211695098703,0.214100724824,0.216506350946,0.218911977068,0.221317603189,0.223723229311,0.226128855433,0.228534481554,0.230940107676,0.233345733797,0.235751359919,0.238156986041,0.240562612162,0.242968238284,0.245373864406,0.247779490527,0.250185116649,0.25259074277,0.254996368892,0.257401995014,0.259807621135,0.262213247257,0.264618873379,0.2670244995,0.269430125622,0.271835751743,0.274241377865,0.276647003987,0.279052630108,0.28145825623,0.283863882352,0.286269508473,0.288675134595,0.291080760716,0.293486386838,0.29589201296,0.298297639081,0.300703265203,0.303108891325,0.305514517446,0.307920143568,0.310325769689,0.312731395811,0.315137021933,0.317542648054,0.319948274176,0.322353900298,0.324759526419,0.327165152541,0.329570778662,0.331976404784,0.334382030906,0.336787657027,0.339193283149,0.341598909271,0.344004535392,0.346410161514,0.348815787635,0.351221413757,0.353627039879,0.356032666,0.358438292122,0.360843918244,0.363249544365,0.365655170487,0.368060796608,0.37046642273,0.372872048852,0.375277674973,0.377683301095,0.380088927216,0.382494553338,0.38490017946,0.387305805581,0.389711431703,0.392117057825,0.394522683946,0.396928310068,0.399333936189,0.401739562311,0.404145188433,0.406550814554,0.408956440676,0.411362066798,0.413767692919,0.416173319041,0.418578945162,0.420984571284,0.423390197406,0.425795823527,0.428201449649,0.430607075771,0.433012701892,0.435418328014,0.437823954135,0.440229580257,0.442635206379,0.4450408325,0.447446458622,0.449852084744,0.452257710865,0.454663336987,0.457068963108,0.45947458923,0.461880215352,0.464285841473,0.466691467595,0.469097093717,0.471502719838,0.47390834596,0.476313972081,0.478719598203,0.481125224325,0.483530850446,0.485936476568,0.48834210269,0.490747728811,0.493153354933,0.495558981054,0.497964607176,0.500370233298,0.502775859419,0.505181485541,0.507587111663,0.509992737784,0.512398363906,0.514803990027,0.517209616149,0.519615242271,0.522020868392,0.524426494514,0.526832120636,0.529237746757,0.531643372879,0.534048999,0.536454625122,0.538860251244,0.541265877365,0.543571138211,0.545698019279,0.547673314821,0.549517290262,0.55124571874,0.5528711653,0.554403833171,0.55585214206,0.557223135528,0.558522775457,0.55975615972,0.560927686209,0.56204117857,0.563099984046,0.56410705064,0.5650649887,0.565976120619,0.56684252132,0.567666051537,0.568448385396,0.56919103344,0.56989536197,0.570562609407,0.571193900198,0.571790256698,0.572352609371,0.57288180558,0.573378617192,0.573843747176,0.57427783534,0.574681463337,0.57505515903,0.575399400317,0.575714618461,0.576001201008,0.576259494329,0.576489805835,0.576692405885,0.576867529433,0.577015377435,0.577136118024,0.577229887482,0.577296791017,0.577336903362,0.57735026919,0.577336903362,0.577296791017,0.577229887482,0.577136118024,0.577015377435,0.576867529433,0.576692405885,0.576489805835,0.576259494329,0.576001201008,0.575714618461,0.575399400317,0.57505515903,0.574681463337,0.57427783534,0.573843747176,0.573378617192,0.57288180558,0.572352609371,0.571790256698,0.571193900198,0.570562609407,0.56989536197,0.56919103344,0.568448385396,0.567666051537,0.56684252132,0.565976120619,0.5650649887,0.56410705064,0.563099984047,0.56204117857,0.560927686209,0.55975615972,0.558522775457,0.557223135528,0.55585214206,0.554403833171,0.552871165301,0.55124571874,0.549517290262,0.547673314821,0.545698019279,0.543571138211,0.541265877365,0.538860251244,0.536454625122,0.534048999001,0.531643372879,0.529237746757,0.526832120636,0.524426494514,0.522020868393,0.519615242271,0.517209616149,0.514803990028,0.512398363906,0.509992737784,0.507587111663,0.505181485541,0.50277585942,0.500370233298,0.497964607176,0.495558981055,0.493153354933,0.490747728811,0.48834210269,0.485936476568,0.483530850447,0.481125224325,0.478719598203,0.476313972082,0.47390834596,0.471502719838,0.469097093717,0.466691467595,0.464285841474,0.461880215352,0.45947458923,0.457068963109,0.454663336987,0.452257710865,0.449852084744,0.447446458622,0.445040832501,0.442635206379,0.440229580257,0.437823954136,0.435418328014,0.433012701892,0.430607075771,0.428201449649,0.425795823528,0.423390197406,0.420984571284,0.418578945163,0.416173319041,0.413767692919,0.411362066798,0.408956440676,0.406550814555,0.404145188433,0.401739562311,0.39933393619,0.396928310068,0.394522683946,0.392117057825,0.389711431703,0.387305805582,0.38490017946,0.382494553338,0.380088927217,0.377683301095,0.375277674973,0.372872048852,0.37046642273,0.368060796609,0.365655170487,0.363249544365,0.360843918244,0.358438292122,0.356032666001,0.353627039879,0.351221413757,0.348815787636,0.346410161514,0.344004535392,0.341598909271,0.339193283149,0.336787657028,0.334382030906,0.331976404784,0.329570778663,0.327165152541,0.324759526419,0.322353900298,0.319948274176,0.317542648055,0.315137021933,0.312731395811,0.31032576969,0.307920143568,0.305514517446,0.303108891325,0.300703265203,0.298297639082,0.29589201296,0.293486386838,0.291080760717,0.288675134595,0.286269508473,0.283863882352,0.28145825623,0.279052630109,0.276647003987,0.274241377865,0.271835751744,0.269430125622,0.2670244995,0.264618873379,0.262213247257,0.259807621136,0.257401995014,0.254996368892,0.252590742771,0.250185116649,0.247779490527,0.245373864406,0.242968238284,0.240562612163,0.238156986041,0.235751359919,0.233345733798,0.230940107676,0.228534481554,0.226128855433,0.223723229311,0.22131760319,0.218911977068,0.216506350946,0.214100724825,0.211695098703,0.209289472581,0.20688384646,0.204478220338,0.202072594217,0.199666968095,0.197261341973,0.194855715852,0.19245008973,0.190044463608,0.187638837487,0.185233211365,0.182827585244,0.180421959122,0.178016333,0.175610706879,0.173205080757,0.170799454636,0.168393828514,0.165988202392,0.163582576271,0.161176950149,0.158771324027,0.156365697906,0.153960071784,0.151554445663,0.149148819541,0.146743193419,0.144337567298,0.141931941176,0.139526315054,0.137120688933,0.134715062811,0.13230943669,0.129903810568,0.127498184446,0.125092558325,0.122686932203,0.120281306081,0.11787567996,0.115470053838,0.113064427717,0.110658801595,0.108253175473,0.105847549352,0.10344192323,0.101036297108,0.098630670987,0.096225044865,0.093819418744,0.091413792622,0.0890081665,0.086602540379,0.084196914257,0.081791288135,0.079385662014,0.076980035892,0.074574409771,0.072168783649,0.069763157527,0.067357531406,0.064951905284,0.062546279162,0.060140653041,0.057735026919,0.055329400798,0.052923774676,0.050518148554,0.048112522433,0.045706896311,0.043301270189,0.040895644068,0.038490017946,0.036084391825,0.033678765703,0.031273139581,0.02886751346,0.026461887338,0.024056261216,0.021650635095,0.019245008973,0.016839382852,0.01443375673,0.012028130608,0.009622504487,0.007216878365,0.004811252244,0.002405626122]
-        else:
-            obj.internal_data = internal_data
-        if len(external_data)==0:
-            obj.external_data = [-0.002353874267,-0.004610521688,-0.006778280188,-0.008864283825,-0.010874693731,-0.012814874909,-0.014689533648,-0.016502825791,-0.018258443075,-0.019959682748,-0.021609504262,-0.023210575868,-0.024765313218,-0.026275911608,-0.027744373085,-0.029172529388,-0.030562061489,-0.031914516323,-0.033231321182,-0.034513796181,-0.035763165074,-0.036980564707,-0.038167053291,-0.039323617685,-0.040451179823,-0.041550602408,-0.042622693966,-0.043668213361,-0.04468787382,-0.045682346547,-0.046652263972,-0.047598222668,-0.048520785999,-0.049420486507,-0.050297828076,-0.051153287908,-0.051987318311,-0.052800348341,-0.05359278529,-0.05436501606,-0.055117408419,-0.055850312148,-0.056564060107,-0.057258969208,-0.057935341316,-0.058593464082,-0.059233611709,-0.059856045664,-0.06046101534,-0.061048758664,-0.061619502667,-0.062173464009,-0.062710849475,-0.063231856427,-0.06373667323,-0.064225479652,-0.06469844723,-0.06515573962,-0.065597512915,-0.066023915948,-0.066435090577,-0.066831171941,-0.067212288714,-0.067578563329,-0.067930112196,-0.068267045903,-0.068589469403,-0.06889748219,-0.069191178464,-0.069470647283,-0.069735972706,-0.069987233927,-0.070224505396,-0.070447856939,-0.070657353858,-0.070853057037,-0.071035023027,-0.071203304134,-0.071357948492,-0.071499000139,-0.071626499073,-0.071740481317,-0.071840978965,-0.071928020232,-0.072001629489,-0.072061827303,-0.07210863046,-0.072142051993,-0.072162101198,-0.072168783647,-0.072162101198,-0.072142051993,-0.07210863046,-0.072061827303,-0.072001629489,-0.071928020232,-0.071840978965,-0.071740481317,-0.071626499073,-0.071499000139,-0.071357948492,-0.071203304134,-0.071035023027,-0.070853057037,-0.070657353858,-0.070447856939,-0.070224505396,-0.069987233927,-0.069735972706,-0.069470647283,-0.069191178464,-0.06889748219,-0.068589469403,-0.068267045903,-0.067930112196,-0.067578563329,-0.067212288714,-0.066831171941,-0.066435090577,-0.066023915948,-0.065597512915,-0.06515573962,-0.06469844723,-0.064225479652,-0.06373667323,-0.063231856427,-0.062710849475,-0.062173464009,-0.061619502667,-0.061048758664,-0.06046101534,-0.059856045664,-0.059233611709,-0.058593464082,-0.057935341316,-0.057258969208,-0.056564060107,-0.055850312148,-0.055117408419,-0.05436501606,-0.05359278529,-0.052800348341,-0.051987318311,-0.051153287908,-0.050297828076,-0.049420486507,-0.048520785999,-0.047598222668,-0.046652263972,-0.045682346547,-0.04468787382,-0.043668213361,-0.042622693966,-0.041550602408,-0.040451179823,-0.039323617685,-0.038167053291,-0.036980564707,-0.035763165074,-0.034513796181,-0.033231321182,-0.031914516323,-0.030562061489,-0.029172529388,-0.027744373085,-0.026275911608,-0.024765313218,-0.023210575868,-0.021609504262,-0.019959682748,-0.018258443075,-0.016502825791,-0.014689533648,-0.012814874909,-0.010874693731,-0.008864283825,-0.006778280188,-0.004610521688,-0.002353874267,-1e-12,0.002405626125,0.004811252246,0.007216878368,0.009622504489,0.012028130611,0.014433756733,0.016839382854,0.019245008976,0.021650635097,0.024056261219,0.026461887341,0.028867513462,0.031273139584,0.033678765706,0.036084391827,0.038490017949,0.04089564407,0.043301270192,0.045706896314,0.048112522435,0.050518148557,0.052923774678,0.0553294008,0.057735026922,0.060140653043,0.062546279165,0.064951905286,0.067357531408,0.06976315753,0.072168783651,0.074574409773,0.076980035894,0.079385662016,0.081791288138,0.084196914259,0.086602540381,0.089008166503,0.091413792624,0.093819418746,0.096225044867,0.098630670989,0.101036297111,0.103441923232,0.105847549354,0.108253175475,0.110658801597,0.113064427719,0.11547005384,0.117875679962,0.120281306083,0.122686932205,0.125092558327,0.127498184448,0.12990381057,0.132309436692,0.134715062813,0.137120688935,0.139526315056,0.141931941178,0.1443375673,0.146743193421,0.149148819543,0.151554445664,0.153960071786,0.156365697908,0.158771324029,0.161176950151,0.163582576272,0.165988202394,0.168393828516,0.170799454637,0.173205080759,0.175610706881,0.178016333002,0.180421959124,0.182827585245,0.185233211367,0.187638837489,0.19004446361,0.192450089732,0.194855715853,0.197261341975,0.199666968097,0.202072594218,0.20447822034,0.206883846461,0.209289472583,0.211695098705,0.214100724826,0.216506350948,0.218911977069,0.221317603191,0.223723229313,0.226128855434,0.228534481556,0.230940107678,0.233345733799,0.235751359921,0.238156986042,0.240562612164,0.242968238286,0.245373864407,0.247779490529,0.25018511665,0.252590742772,0.254996368894,0.257401995015,0.259807621137,0.262213247258,0.26461887338,0.267024499502,0.269430125623,0.271835751745,0.274241377867,0.276647003988,0.27905263011,0.281458256231,0.283863882353,0.286269508475,0.288675134596,0.291080760718,0.293486386839,0.295892012961,0.298297639083,0.300703265204,0.303108891326,0.305514517447,0.307920143569,0.310325769691,0.312731395812,0.315137021934,0.317542648056,0.319948274177,0.322353900299,0.32475952642,0.327165152542,0.329570778664,0.331976404785,0.334382030907,0.336787657028,0.33919328315,0.341598909272,0.344004535393,0.346410161515,0.348815787636,0.351221413758,0.35362703988,0.356032666001,0.358438292123,0.360843918245,0.363249544366,0.365655170488,0.368060796609,0.370466422731,0.372872048853,0.375277674974,0.377683301096,0.380088927217,0.382494553339,0.384900179461,0.387305805582,0.389711431704,0.392117057825,0.394522683947,0.396928310069,0.39933393619,0.401739562312,0.404145188433,0.406550814555,0.408956440677,0.411362066798,0.41376769292,0.416173319042,0.418578945163,0.420984571285,0.423390197406,0.425795823528,0.42820144965,0.430607075771,0.433012701893,0.435418328014,0.437823954136,0.440229580258,0.442635206379,0.445040832501,0.447446458622,0.449852084744,0.452257710866,0.454663336987,0.457068963109,0.459474589231,0.461880215352,0.464285841474,0.466691467595,0.469097093717,0.471502719839,0.47390834596,0.476313972082,0.478719598203,0.481125224325,0.483530850447,0.485936476568,0.48834210269,0.490747728811,0.493153354933,0.495558981055,0.497964607176,0.500370233298,0.50277585942,0.505181485541,0.507587111663,0.509992737784,0.512398363906,0.514803990028,0.517209616149,0.519615242271,0.522020868392,0.524426494514,0.526832120636,0.529237746757,0.531643372879,0.534048999,0.536454625122,0.538860251244,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.541265877365,0.538860251244,0.536454625122,0.534048999,0.531643372879,0.529237746757,0.526832120636,0.524426494514,0.522020868392,0.519615242271,0.517209616149,0.514803990027,0.512398363906,0.509992737784,0.507587111663,0.505181485541,0.502775859419,0.500370233298,0.497964607176,0.495558981054,0.493153354933,0.490747728811,0.48834210269,0.485936476568,0.483530850446,0.481125224325,0.478719598203,0.476313972081,0.47390834596,0.471502719838,0.469097093717,0.466691467595,0.464285841473,0.461880215352,0.45947458923,0.457068963108,0.454663336987,0.452257710865,0.449852084744,0.447446458622,0.4450408325,0.442635206379,0.440229580257,0.437823954135,0.435418328014,0.433012701892,0.430607075771,0.428201449649,0.425795823527,0.423390197406,0.420984571284,0.418578945162,0.416173319041,0.413767692919,0.411362066798,0.408956440676,0.406550814554,0.404145188433,0.401739562311,0.399333936189,0.396928310068,0.394522683946,0.392117057825,0.389711431703,0.387305805581,0.38490017946,0.382494553338,0.380088927217,0.377683301095,0.375277674973,0.372872048852,0.37046642273,0.368060796608,0.365655170487,0.363249544365,0.360843918244,0.358438292122,0.356032666,0.353627039879,0.351221413757,0.348815787635,0.346410161514,0.344004535392,0.341598909271,0.339193283149,0.336787657027,0.334382030906,0.331976404784,0.329570778662,0.327165152541,0.324759526419,0.322353900298,0.319948274176,0.317542648054,0.315137021933,0.312731395811,0.310325769689,0.307920143568,0.305514517446,0.303108891325,0.300703265203,0.298297639081,0.29589201296,0.293486386838,0.291080760716,0.288675134595,0.286269508473,0.283863882352,0.28145825623,0.279052630108,0.276647003987,0.274241377865,0.271835751743,0.269430125622,0.2670244995,0.264618873379,0.262213247257,0.259807621135,0.257401995014,0.254996368892,0.25259074277,0.250185116649,0.247779490527,0.245373864406,0.242968238284,0.240562612162,0.238156986041,0.235751359919,0.233345733797,0.230940107676,0.228534481554,0.226128855433,0.223723229311,0.221317603189,0.218911977068,0.216506350946,0.214100724824,0.211695098703,0.209289472581,0.20688384646,0.204478220338,0.202072594216,0.199666968095,0.197261341973,0.194855715851,0.19245008973,0.190044463608,0.187638837487,0.185233211365,0.182827585243,0.180421959122,0.178016333,0.175610706879,0.173205080757,0.170799454635,0.168393828514,0.165988202392,0.16358257627,0.161176950149,0.158771324027,0.156365697906,0.153960071784,0.151554445662,0.149148819541,0.146743193419,0.144337567297,0.141931941176,0.139526315054,0.137120688933,0.134715062811,0.132309436689,0.129903810568,0.127498184446,0.125092558324,0.122686932203,0.120281306081,0.11787567996,0.115470053838,0.113064427716,0.110658801595,0.108253175473,0.105847549351,0.10344192323,0.101036297108,0.098630670987,0.096225044865,0.093819418743,0.091413792622,0.0890081665,0.086602540378,0.084196914257,0.081791288135,0.079385662014,0.076980035892,0.07457440977,0.072168783649,0.069763157527,0.067357531405,0.064951905284,0.062546279162,0.060140653041,0.057735026919,0.055329400797,0.052923774676,0.050518148554,0.048112522432,0.045706896311,0.043301270189,0.040895644068,0.038490017946,0.036084391824,0.033678765703,0.031273139581,0.028867513459,0.026461887338,0.024056261216,0.021650635095,0.019245008973,0.016839382851,0.01443375673,0.012028130608,0.009622504486,0.007216878365,0.004811252243,0.002405626122]
-        else:
-            obj.external_data = external_data
-        obj.Pitch = pitch #default pitch
-        obj.MinorDiameter = minor_diameter #M6x1 internal 6g tolerance class is default
-
-        if len (presets) == 0:
-            tmp_presets_data=[
-            ['V Thread Presets',0,0,0],
-            ['Garden Hose NHR',0.08696*25.4,0.9495*25.4,0.9720*25.4],
-            ['M1 Coarse',0.25,0.693,0.729],
-            ['M1.1 Coarse',0.25,0.793,0.829],
-            ['M1.2 Coarse',0.25,0.893,0.929],
-            ['M1.4 Coarse',0.30,1.032,1.075],
-            ['M1.6 Coarse',0.35,1.171,1.221],
-            ['M1.8 Coarse',0.35,1.371,1.421],
-            ['M2 Coarse',0.40,1.509,1.567],
-            ['M2.2 Coarse',0.45,1.648,1.713],
-            ['M2.5 Coarse',0.45,1.948,2.013],
-            ['M3 Coarse',0.50,2.387,2.459],
-            ['M3.5 Coarse',0.60,2.764,2.850],
-            ['M4 Coarse',0.70,3.141,3.242],
-            ['M4.5 Coarse',0.75,3.580,3.688],
-            ['M5 Coarse',0.80,4.019,4.134],
-            ['M6 Coarse',1.00,4.773,4.917],
-            ['M7 Coarse',1.00,5.773,5.917],
-            ['M8 Coarse',1.25,6.466,6.647],
-            ['M9 Coarse',1.25,7.466,7.647],
-            ['M10 Coarse',1.50,8.160,8.376],
-            ['M11 Coarse',1.50,9.160,9.376],
-            ['M12 Coarse',1.75,9.853,10.106],
-            ['M14 Coarse',2.00,11.546,11.835],
-            ['M16 Coarse',2.00,13.546,13.835],
-            ['M18 Coarse',2.50,14.933,15.394],
-            ['M20 Coarse',2.50,16.933,17.294],
-            ['M22 Coarse',2.50,18.933,19.294],
-            ['M24 Coarse',3.00,20.319,20.752],
-            ['M27 Coarse',3.00,23.319,23.752],
-            ['M30 Coarse',3.50,25.706,26.211],
-            ['M33 Coarse',3.50,28.706,29.211],
-            ['M36 Coarse',4.00,31.093,31.670],
-            ['M39 Coarse',4.00,34.093,34.670],
-            ['M42 Coarse',4.50,36.479,37.129],
-            ['M45 Coarse',4.50,39.479,40.129],
-            ['M48 Coarse',5.00,41.866,42.857],
-            ['M52 Coarse',5.00,45.866,46.587],
-            ['M56 Coarse',5.50,49.252,50.046],
-            ['M60 Coarse',5.50,53.252,54.046],
-            ['M64 Coarse',6.00,56.639,57.505],
-            ['M68 Coarse',6.00,60.639,61.505],
-            ['M1 Fine',0.20,0.755,0.783],
-            ['M1.1 Fine',0.20,0.855,0.883],
-            ['M1.2 Fine',0.20,0.955,0.983],
-            ['M1.4 Fine',0.20,1.155,1.183],
-            ['M1.6 Fine',0.20,1.355,1.383],
-            ['M1.8 Fine',0.20,1.555,1.583],
-            ['M2 Fine',0.25,1.693,1.729],
-            ['M2.2 Fine',0.25,1.893,1.929],
-            ['M2.5 Fine',0.35,2.071,2.121],
-            ['M3 Fine',0.35,2.571,2.621],
-            ['M3.5 Fine',0.35,3.071,3.121],
-            ['M4 Fine',0.50,3.387,3.459],
-            ['M4.5 Fine',0.50,3.887,3.959],
-            ['M5 Fine',0.50,4.387,4.459],
-            ['M5.5 Fine',0.50,4.887,4.959],
-            ['M6 Fine',0.75,5.080,5.188],
-            ['M7 Fine',0.75,6.080,6.188],
-            ['M8 Fine',0.75,7.080,7.188],
-            ['M8 Fine',1.00,6.773,6.917],
-            ['M9 Fine',0.75,8.080,8.188],
-            ['M9 Fine',1.00,7.773,7.917],
-            ['M10 Fine',0.75,9.080,9.188],
-            ['M10 Fine',1.00,8.773,8.917],
-            ['M10 Fine',1.25,8.466,8.647],
-            ['M11 Fine',0.75,10.080,10.188],
-            ['M11 Fine',1.00,9.773,9.917],
-            ['M12 Fine',1.00,10.773,10.917],
-            ['M12 Fine',1.25,10.466,10.647],
-            ['M12 Fine',1.50,10.160,10.376],
-            ['M14 Fine',1.00,12.773,12.917],
-            ['M14 Fine',1.25,12.466,12.647],
-            ['M14 Fine',1.50,12.160,12.376],
-            ['M15 Fine',1.00,13.773,13.917],
-            ['M15 Fine',1.50,13.160,13.376],
-            ['M16 Fine',1.00,14.773,14.917],
-            ['M16 Fine',1.50,14.160,14.376],
-            ['M17 Fine',1.00,15.773,15.917],
-            ['M17 Fine',1.50,15.160,15.376],
-            ['M18 Fine',1.00,16.773,16.917],
-            ['M18 Fine',1.50,16.160,16.376],
-            ['M18 Fine',2.00,15.546,15.835],
-            ['M20 Fine',1.00,18.773,18.917],
-            ['M20 Fine',1.50,18.160,18.376],
-            ['M20 Fine',2.00,17.546,17.835],
-            ['M22 Fine',1.00,20.773,20.917],
-            ['M22 Fine',1.50,20.160,20.376],
-            ['M22 Fine',2.00,19.546,19.835],
-            ['M24 Fine',1.00,22.773,22.917],
-            ['M24 Fine',1.50,22.160,22.376],
-            ['M24 Fine',2.00,21.546,21.835],
-            ['M25 Fine',1.00,23.773,23.917],
-            ['M25 Fine',1.50,23.160,23.376],
-            ['M25 Fine',2.00,22.546,22.835],
-            ['M27 Fine',1.00,25.773,25.917],
-            ['M27 Fine',1.50,25.160,25.376],
-            ['M27 Fine',2.00,24.546,24.835],
-            ['M28 Fine',1.00,26.773,26.917],
-            ['M28 Fine',1.50,26.160,26.376],
-            ['M28 Fine',2.00,25.546,25.835],
-            ['M30 Fine',1.00,28.773,28.917],
-            ['M30 Fine',1.50,28.160,28.376],
-            ['M30 Fine',2.00,27.546,27.835],
-            ['M30 Fine',3.00,26.319,26.752],
-            ['M32 Fine',1.50,30.160,30.376],
-            ['M32 Fine',2.00,29.546,29.835],
-            ['M33 Fine',1.50,31.160,31.376],
-            ['M33 Fine',2.00,30.546,30.835],
-            ['M33 Fine',3.00,29.319,29.752],
-            ['M35 Fine',1.50,33.160,33.376],
-            ['M35 Fine',2.00,32.546,32.835],
-            ['M36 Fine',1.50,34.160,34.376],
-            ['M36 Fine',2.00,33.546,33.835],
-            ['M36 Fine',3.00,32.319,32.752],
-            ['M39 Fine',1.50,37.160,37.376],
-            ['M39 Fine',2.00,36.546,36.835],
-            ['M39 Fine',3.00,35.319,35.752],
-            ['M40 Fine',1.50,38.160,38.376],
-            ['M40 Fine',2.00,37.546,37.835],
-            ['M40 Fine',3.00,36.619,36.752],
-            ['M42 Fine',1.50,40.160,40.376],
-            ['M42 Fine',2.00,39.546,39.835],
-            ['M42 Fine',3.00,38.319,38.752],
-            ['M42 Fine',4.00,37.093,37.670],
-            ['M45 Fine',1.50,43.160,43.376],
-            ['M45 Fine',2.00,42.546,42.835],
-            ['M45 Fine',3.00,41.319,41.752],
-            ['M45 Fine',4.00,40.093,40.670],
-            ['M48 Fine',1.50,46.160,46.376],
-            ['M48 Fine',2.00,45.546,45.835],
-            ['M48 Fine',3.00,44.319,44.752],
-            ['M48 Fine',4.00,43.093,43.670],
-            ['M50 Fine',1.50,48.160,48.376],
-            ['M50 Fine',2.00,47.546,47.835],
-            ['M50 Fine',3.00,46.319,46.752],
-            ['M52 Fine',1.50,50.160,50.376],
-            ['M52 Fine',2.00,49.546,49.835],
-            ['M52 Fine',3.00,48.319,48.752],
-            ['M52 Fine',4.00,47.093,47.670],
-            ['M55 Fine',1.50,53.160,53.376],
-            ['M55 Fine',2.00,52.546,52.835],
-            ['M55 Fine',3.00,51.319,51.752],
-            ['M55 Fine',4.00,50.093,50.670],
-            ['M56 Fine',1.50,54.160,54.376],
-            ['M56 Fine',2.00,43.546,53.835],
-            ['M56 Fine',3.00,52.319,52.752],
-            ['M56 Fine',4.00,51.903,51.670],
-            ['M58 Fine',1.50,56.160,56.376],
-            ['M58 Fine',2.00,55.546,55.835],
-            ['M58 Fine',3.00,54.319,54.752],
-            ['M58 Fine',4.00,53.093,53.670],
-            ['M60 Fine',1.50,58.160,58.376],
-            ['M60 Fine',2.00,57.546,57.835],
-            ['M60 Fine',3.00,56.319,56.752],
-            ['M60 Fine',4.00,55.093,55.670],
-            ['M62 Fine',1.50,60.160,60.376],
-            ['M62 Fine',2.00,59.546,59.835],
-            ['M62 Fine',3.00,58.319,58.752],
-            ['M62 Fine',4.00,57.093,57.670],
-            ['M64 Fine',1.50,62.160,62.376],
-            ['M64 Fine',2.00,61.546,61.835],
-            ['M64 Fine',3.00,60.319,60.752],
-            ['M64 Fine',4.00,59.093,59.670],
-            ['M65 Fine',1.50,63.160,63.376],
-            ['M65 Fine',2.00,62.546,62.835],
-            ['M65 Fine',3.00,61.319,61.752],
-            ['M65 Fine',4.00,60.093,60.670],
-            ['M68 Fine',1.50,66.160,66.376],
-            ['M68 Fine',2.00,65.546,65.835],
-            ['M68 Fine',3.00,64.319,64.752],
-            ['M68 Fine',4.00,63.093,63.670],
-            ['M70 Fine',1.50,68.160,68.376],
-            ['M70 Fine',2.00,67.546,67.835],
-            ['M70 Fine',3.00,66.319,66.752],
-            ['M70 Fine',4.00,65.093,65.670],
-            ['M70 Fine',6.00,62.639,63.505],
-            ['M72 Fine',1.50,70.160,70.376],
-            ['M72 Fine',2.00,69.546,69.835],
-            ['M72 Fine',3.00,68.319,68.752],
-            ['M72 Fine',4.00,67.093,67.670],
-            ['M72 Fine',6.00,64.639,65.505],
-            ['M75 Fine',1.50,73.160,73.376],
-            ['M75 Fine',2.00,72.546,72.835],
-            ['M75 Fine',3.00,71.319,71.752],
-            ['M75 Fine',4.00,70.093,70.670],
-            ['M75 Fine',6.00,67.639,68.505],
-            ['M76 Fine',1.50,74.160,74.376],
-            ['M76 Fine',2.00,73.546,73.835],
-            ['M76 Fine',3.00,72.319,72.752],
-            ['M76 Fine',4.00,71.093,71.670],
-            ['M76 Fine',6.00,68.639,69.505],
-            ['M80 Fine',1.50,78.160,78.376],
-            ['M80 Fine',2.00,77.546,77.835],
-            ['M80 Fine',3.00,76.319,76.752],
-            ['M80 Fine',4.00,75.093,75.670],
-            ['M80 Fine',6.00,72.639,73.505],
-            ['M85 Fine',2.00,82.546,82.535],
-            ['M85 Fine',3.00,81.319,81.752],
-            ['M85 Fine',4.00,80.093,80.670],
-            ['M85 Fine',6.00,77.639,78.505],
-            ['M90 Fine',2.00,87.546,87.835],
-            ['M90 Fine',3.00,86.319,86.752],
-            ['M90 Fine',4.00,85.093,85.670],
-            ['M90 Fine',6.00,82.639,83.505],
-            ['M95 Fine',2.00,92.546,92.835],
-            ['M95 Fine',3.00,91.319,91.752],
-            ['M95 Fine',4.00,90.093,90.670],
-            ['M95 Fine',6.00,87.639,88.505],
-            ['M100 Fine',2.00,97.546,97.835],
-            ['M100 Fine',3.00,96.319,96.752],
-            ['M100 Fine',4.00,95.093,95.670],
-            ['M100 Fine',6.00,92.639,93.505],
-            ['1/4 in-20 UNC',25.4*0.0500,25.4*0.1887,25.4*0.1959],
-            ['5/16 in-18 UNC UNC',25.4*0.0556,25.4*0.2443,25.4*0.2524],
-            ['3/8 in-16 UNC UNC',25.4*0.0625,25.4*0.2983,25.4*0.3073],
-            ['7/16 in-14 UNC',25.4*0.0714,25.4*0.3499,25.4*0.3602],
-            ['1/2 in-13 UNC',25.4*0.0769,25.4*0.4056,25.4*0.4167],
-            ['9/16 in-12 UNC',25.4*0.0833,25.4*0.4603,25.4*0.4723],
-            ['5/8 in-11 UNC',25.4*0.0909,25.4*0.5135,25.4*0.5266],
-            ['3/4 in-10 UNC',25.4*0.1000,25.4*0.6273,25.4*0.6417],
-            ['7/8 in-9 UNC',25.4*0.1111,25.4*0.7387,25.4*0.7547],
-            ['1 in-8 UNC',25.4*0.1250,25.4*0.8466,25.4*0.8647],
-            ['1 1/8 in-7 UNC',25.4*0.1429,25.4*0.9497,25.4*0.9704],
-            ['1 1/4 in-7 UNC',25.4*0.1429,25.4*1.0747,25.4*1.0954],
-            ['1 3/8 in-6 UNC',25.4*0.1667,25.4*1.1705,25.4*1.1946],
-            ['1 1/2 in-6 UNC',25.4*0.1667,25.4*1.2955,25.4*1.3196],
-            ['1 3/4 in-5 UNC',25.4*0.2000,25.4*1.5046,25.4*1.5335],
-            ['2 in-4 1/2 UNC',25.4*0.2222,25.4*1.7274,25.4*1.7594],
-            ['2 1/4 in-4 1/2 UNC',25.4*0.2222,25.4*1.9774,25.4*2.0094],
-            ['2-1/2 in-4 UNC',25.4*0.2500,25.4*2.1992,25.4*2.229 ],
-            ['2-3/4 in-4 UNC',25.4*0.2500,25.4*2.4491,25.4*2.479],
-            ['3 in-4 UNC',25.4*0.2500,25.4*2.699,25.4*2.729],
-            ['3-1/4 in-4 UNC',25.4*0.2500,25.4*2.949,25.4*2.979],
-            ['3-1/2 in-4 UNC',25.4*0.2500,25.4*3.199,25.4*3.229 ],
-            ['3-3/4 in-4 UNC',25.4*0.2500,25.4*3.4489,25.4*3.479 ],
-            ['4 in-4 UNC',25.4*0.2500,25.4*3.6989,25.4*3.729],
-            ['1/4 in-28 UNF UNF',25.4*0.0357,25.4*0.2062,25.4*0.2113],
-            ['5/16 in-24 UNF',25.4*0.0417,25.4*0.2614,25.4*0.2674],
-            ['3/8 in-24 UNF',25.4*0.0417,25.4*0.3239,25.4*0.3299],
-            ['7/16 in-20 UNF',25.4*0.0500,25.4*0.3762,25.4*0.3834],
-            ['1/2 in-20 UNF',25.4*0.0500,25.4*0.4387,25.4*0.4459],
-            ['9/16 in-18 UNF',25.4*0.0556,25.4*0.4943,25.4*0.5024],
-            ['5/8 in-18 UNF',25.4*0.0556,25.4*0.5568,25.4*0.5649],
-            ['3/4 in-16 UNF',25.4*0.0625,25.4*0.6733,25.4*0.6823],
-            ['7/8 in-14 UNF',25.4*0.0714,25.4*0.7874,25.4*0.7977],
-            ['1 in-12 UNF',25.4*0.0714,25.4*0.8978,25.4*0.9098],
-            ['1 in-14 UNF',25.4*0.0714,25.4*0.9132,25.4*0.923],
-            ['1 1/4 in-12 UNF',25.4*0.0833,25.4*1.0228,25.4*1.0348],
-            ['1 1/8 in-12 UNF',25.4*0.0833,25.4*1.1478,25.4*1.1598],
-            ['1 3/8 in-12 UNF',25.4*0.0833,25.4*1.2728,25.4*1.2848],
-            ['1 1/2 in-12 UNF',25.4*0.0833,25.4*1.3978,25.4*1.4098]]
-        else:
-            tmp_presets_data = presets
-        tmp=[]
-        for ii in range(0,len(tmp_presets_data)):
-            tmp.extend(tmp_presets_data[ii][1:]) #strip out string, only include pitch and both minor diameters
-        obj.presets_data = tmp
-        preset_names=[]
-        for td in tmp_presets_data:
-            preset_name = td[0]
-            if "M" in preset_name:
-                preset_name += " " + str(td[1])
-            preset_names.append(preset_name)
-        obj.Presets = preset_names
-        obj.preset_names = preset_names
-        obj.InternalOrExternal = internal_or_external
-        obj.ThreadCount = thread_count
-
-        if FreeCAD.GuiUp:
-            _ViewProviderWire(obj.ViewObject)
-            formatObject(obj)
-            select(obj)
-            body=FreeCADGui.ActiveDocument.ActiveView.getActiveObject("pdbody")
-            part=FreeCADGui.ActiveDocument.ActiveView.getActiveObject("part")
-            if body:
-                body.Group=body.Group+[obj]
-            elif part:
-                part.Group=part.Group+[obj]
-        FreeCAD.ActiveDocument.recompute()
-        return obj
+    def makeThreadProfile(self,name="VThreadProfile",minor_diameter=4.773,pitch=1,internal_or_external="External",internal_data=[],external_data=[],presets=[],thread_count=10,profile_id="VThread",preset=None,recompute=True):
+        '''see ThreadProfileObject.makeThreadProfile()'''
+        #deferred until an object is actually created, see __getattr__() above
+        from ThreadProfileObject import makeThreadProfile
+        return makeThreadProfile(name=name,minor_diameter=minor_diameter,pitch=pitch,internal_or_external=internal_or_external,
+            internal_data=internal_data,external_data=external_data,presets=presets,thread_count=thread_count,
+            profile_id=profile_id,preset=preset,recompute=recompute)
 
 #Gui.addCommand("ThreadProfileCreateObject", ThreadProfileCreateObjectCommandClass())
 
@@ -841,51 +584,10 @@ class ThreadProfileCreateButtressObjectCommandClass(ThreadProfileCreateObjectCom
 ]
     def makeButtressThreadProfile(self):
 
-        def cd(txt, tpi, nominal): #cd = calculate diameters
-            pitch = 25.4/tpi
-            length_of_engagement = 10 * pitch #10 * pitch, longer engagements should have more tolerance
-            nom = nominal * 25.4
-            minor = nom - 0.66271 * pitch
-            tolerance = 0.002 * (nom)**(1/3) + .00278 * length_of_engagement**(1/2) + 0.00854 * pitch**(1/2)
-            return[txt, pitch, minor - tolerance, minor + tolerance]
-        buttress_presets_data = [
-            ["Buttress presets",0,0,0], #just fillers, not used
-            cd("1/2-12",12,1/2),cd("1/2-16",16,1/2),cd("1/2-20",20,1/2),
-            cd("5/8-12",12,5/8),cd("5/8-16",16,5/8),cd("5/8-20",20,5/8),
-            cd("3/4-12",12,3/4),cd("3/4-16",16,3/4),cd("3/4-20",20,3/4),
-            cd("7/8-10",10,7/8),cd("7/8-12",12,7/8),cd("7/8-16",16,7/8),
-            cd("1-10",10,1),cd("1-12",12,1),cd("1-16",16,1),
-            cd("1 1/4-8",8,1.25),cd("1 1/4-10",10,1.25),cd("1 1/4-12",12,1.25),
-            cd("1 3/8-8",8,1.25),cd("1 3/8-10",10,1.375),cd("1 3/8-12",12,1.375),
-            cd("1 1/2-8",8,1.5),cd("1 1/2-10",10,1.5),cd("1 1/2-12",12,1.5),
-            cd("1 3/4-6",6,1+3/4),cd("1 3/4-6",8,1+3/4),cd("1 3/4-10",10,1+3/4),
-            cd("2-6",6,2),cd("2-8",8,2),cd("2-10",10,2),
-            cd("2 1/4-6",6,2+1/4),cd("2 1/4-8",8,2+1/4),cd("2 1/4-10",10,2+1/4),
-            cd("2 1/2-6",6,2+1/2),cd("2 1/2-8",8,2+1/2),cd("2 1/2-10",10,2+1/2),
-            cd("2 3/4-5",5,2+3/4),cd("2 3/4-6",6,2+3/4),cd("2 3/4-8",8,2+3/4),
-            cd("3-5",5,3),cd("3-6",6,3),cd("3-8",8,3),
-            cd("3 1/2-5",5,3+1/2),cd("3 1/2-6",6,3+1/2),cd("3 1/2-8",8,3+1/2),
-            cd("4-5",5,4),cd("4-6",6,4),cd("4-8",8,4),
-            cd("4 1/2-4",4,4+1/2),cd("4 1/2-5",5,4+1/2),cd("4 1/2-6",6,4+1/2),
-            cd("5-4",4,5),cd("5-5",5,5),cd("5-6",6,5),
-            cd("5 1/2-4",4,5+1/2),cd("5 1/2-5",5,5+1/2),cd("5 1/2-6",6,5+1/2),
-            cd("6-4",4,6),cd("6-5",5,6),cd("6-6",6,6),
-            cd("7-3",3,7),cd("7-4",4,7),cd("7-5",5,7),
-            cd("8-3",3,8),cd("8-4",4,8),cd("8-5",5,8),
-            cd("9-3",3,9),cd("9-4",4,9),cd("9-5",5,9),
-            cd("10-3",3,10),cd("10-4",4,10),cd("10-5",5,10),
-            cd("11-2.5",2.5,11),cd("11-3",3,11),cd("11-4",4,11),
-            cd("12-2.5",2.5,12),cd("12-3",3,12),cd("12-4",4,12),
-            cd("13-2.5",2.5,13),cd("13-3",3,13),cd("13-4",4,13),
-            cd("14-2.5",2.5,14),cd("14-3",3,14),cd("14-4",4,14),
-            cd("16-2.5",2.5,16),cd("16-3",3,16),cd("16-4",4,16),
-            cd("18-2",2,18),cd("18-2.5",2.5,18),cd("18-3",3,18),
-            cd("20-2",2,20),cd("20-2.5",2.5,20),cd("20-3",3,20),
-            cd("22-2",2,22),cd("22-2.5",2.5,22),cd("22-3",3,22),
-            cd("24-2",2,24),cd("24-2.5",2.5,24),cd("24-3",3,24)]
-        external_buttress_data = [0.651362286512,0.640050694251,0.62873910199,0.617427509729,0.606115917468,0.594804325207,0.583492732945,0.572181140684,0.560869548423,0.549557956162,0.538246363901,0.52693477164,0.515623179379,0.504311587118,0.492999994857,0.481688402596,0.470376810335,0.459065218074,0.447753625813,0.436442033552,0.42513044129,0.413818849029,0.402507256768,0.391195664507,0.379884072246,0.368572479985,0.357260887724,0.345949295463,0.334637703202,0.323326110941,0.31201451868,0.300702926419,0.289391334158,0.278079741896,0.266768149635,0.255456557374,0.244144965113,0.232833372852,0.221521780591,0.21021018833,0.198898596069,0.187587003808,0.176275411547,0.164963819286,0.153652227025,0.142340634764,0.131029042502,0.119717450241,0.10840585798,0.097094265719,0.085782673458,0.074471081197,0.063159488936,0.051847896675,0.040536304414,0.029224712153,0.017913119892,0.006601527631,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.001307212106,0.002696100995,0.004084989884,0.005473878773,0.006862767662,0.008251656551,0.00964054544,0.011029434329,0.012418323217,0.013807212106,0.015196100995,0.016584989884,0.017973878773,0.019362767662,0.020751656551,0.02214054544,0.023529434329,0.024918323217,0.026307212106,0.027696100995,0.029084989884,0.030473878773,0.031862767662,0.033251656551,0.03464054544,0.036029434329,0.037418323217,0.038807212106,0.040196100995,0.041584989884,0.042973878773,0.044362767662,0.045751656551,0.04714054544,0.048529434329,0.049918323217,0.051307212106,0.052696100995,0.054084989884,0.055473878773,0.056862767662,0.058251656551,0.05964054544,0.061029434329,0.062418323217,0.063807212106,0.065196100995,0.066584989884,0.067973878773,0.069362767662,0.070751656551,0.07214054544,0.073529434329,0.074918323217,0.076307212106,0.077696100995,0.079084989884,0.080473878773,0.081862767662,0.083251656551,0.08464054544,0.086029434329,0.087418323217,0.088807212106,0.090196100995,0.091584989884,0.092973878773,0.094362767662,0.095751656551,0.09714054544,0.098529434329,0.099918323217,0.101307212106,0.102696100995,0.104084989884,0.105473878773,0.106862767662,0.108251656551,0.10964054544,0.111029434329,0.112418323217,0.113807212106,0.115196100995,0.116584989884,0.117973878773,0.119362767662,0.120751656551,0.12214054544,0.123529434329,0.124918323217,0.126307212106,0.127696100995,0.129084989884,0.130473878773,0.131862767662,0.133251656551,0.13464054544,0.136029434329,0.137418323217,0.138807212106,0.140196100995,0.141584989884,0.142973878773,0.144362767662,0.145751656551,0.14714054544,0.148529434329,0.149918323217,0.151307212106,0.152696100995,0.154084989884,0.155473878773,0.156862767662,0.158251656551,0.15964054544,0.161029434329,0.162418323217,0.163807212106,0.165196100995,0.166584989884,0.167973878773,0.169362767662,0.170751656551,0.17214054544,0.173529434329,0.174918323217,0.176307212106,0.177696100995,0.179084989884,0.180473878773,0.181862767662,0.183251656551,0.18464054544,0.186029434329,0.187418323217,0.188807212106,0.190196100995,0.191584989884,0.192973878773,0.194362767662,0.195751656551,0.19714054544,0.198529434329,0.199918323217,0.201307212106,0.202696100995,0.204084989884,0.205473878773,0.206862767662,0.208251656551,0.20964054544,0.211029434329,0.212418323217,0.213807212106,0.215196100995,0.216584989884,0.217973878773,0.219362767662,0.220751656551,0.22214054544,0.223529434329,0.224918323217,0.226307212106,0.227696100995,0.229084989884,0.230473878773,0.231862767662,0.233251656551,0.23464054544,0.236029434329,0.237418323217,0.238807212106,0.240196100995,0.241584989884,0.242973878773,0.244362767662,0.245751656551,0.24714054544,0.248529434329,0.249918323217,0.251307212106,0.252696100995,0.254084989884,0.255473878773,0.256862767662,0.258251656551,0.25964054544,0.261029434329,0.262418323217,0.263807212106,0.265196100995,0.266584989884,0.267973878773,0.269362767662,0.270751656551,0.27214054544,0.273529434329,0.274918323217,0.276307212106,0.277696100995,0.279084989884,0.280473878773,0.281862767662,0.283251656551,0.28464054544,0.286029434329,0.287418323217,0.288807212106,0.290196100995,0.291584989884,0.292973878773,0.294362767662,0.295751656551,0.29714054544,0.298529434329,0.299918323217,0.301307212106,0.302696100995,0.304084989884,0.305473878773,0.306862767662,0.308251656551,0.30964054544,0.311029434329,0.312418323217,0.313807212106,0.315196100995,0.316584989884,0.317973878773,0.319362767662,0.320751656551,0.32214054544,0.323529434329,0.324918323217,0.326307212106,0.327696100995,0.329084989884,0.330473878773,0.331862767662,0.333251656551,0.33464054544,0.336029434329,0.337418323217,0.338807212106,0.340196100995,0.341584989884,0.342973878773,0.344362767662,0.345751656551,0.34714054544,0.348529434329,0.349918323217,0.351307212106,0.352696100995,0.354084989884,0.355473878773,0.356862767662,0.358251656551,0.35964054544,0.361029434329,0.362418323217,0.363807212106,0.365196100995,0.366584989884,0.367973878773,0.369362767662,0.370751656551,0.37214054544,0.373529434329,0.374918323217,0.376307212106,0.377696100995,0.379084989884,0.380473878773,0.381862767662,0.383251656551,0.38464054544,0.386029434329,0.387418323217,0.388807212106,0.390196100995,0.391584989884,0.392973878773,0.394362767662,0.395751656551,0.39714054544,0.398529434329,0.399918323217,0.401307212106,0.402696100995,0.404084989884,0.405473878773,0.406862767662,0.408251656551,0.40964054544,0.411029434329,0.412418323217,0.413807212106,0.415196100995,0.416584989884,0.417973878773,0.419362767662,0.420751656551,0.42214054544,0.423529434329,0.424918323217,0.426307212106,0.427696100995,0.429084989884,0.430473878773,0.431862767662,0.433251656551,0.43464054544,0.436029434329,0.437418323217,0.438807212106,0.440196100995,0.441584989884,0.442973878773,0.444362767662,0.445751656551,0.44714054544,0.448529434329,0.449918323217,0.451307212106,0.452696100995,0.454084989884,0.455473878773,0.456862767662,0.458251656551,0.45964054544,0.461029434329,0.462418323217,0.463807212106,0.465196100995,0.466584989884,0.467973878773,0.469362767662,0.470751656551,0.47214054544,0.473529434329,0.474918323217,0.476307212106,0.477696100995,0.479084989884,0.480473878773,0.481862767662,0.483251656551,0.48464054544,0.486029434329,0.487418323217,0.488807212106,0.490196100995,0.491584989884,0.492973878773,0.494362767662,0.495751656551,0.49714054544,0.498529434329,0.499918323217,0.501307212106,0.502696100995,0.504084989884,0.505473878773,0.506862767662,0.508251656551,0.50964054544,0.511029434329,0.512418323217,0.513807212106,0.515196100995,0.516584989884,0.517973878773,0.519362767662,0.520751656551,0.52214054544,0.523529434329,0.524918323217,0.526307212106,0.527696100995,0.529084989884,0.530473878773,0.531862767662,0.533251656551,0.53464054544,0.536029434329,0.537418323217,0.538807212106,0.540196100995,0.541584989884,0.542973878773,0.544362767662,0.545751656551,0.54714054544,0.548529434329,0.549918323217,0.551307212106,0.552696100995,0.554084989884,0.555473878773,0.556862767662,0.558251656551,0.55964054544,0.561029434329,0.562418323217,0.563807212106,0.565196100995,0.566584989884,0.567973878773,0.569362767662,0.570751656551,0.57214054544,0.573529434329,0.574918323217,0.576307212106,0.577696100995,0.579084989884,0.580473878773,0.581862767662,0.583251656551,0.58464054544,0.586029434329,0.587418323217,0.588807212106,0.590196100995,0.591584989884,0.592973878773,0.594362767662,0.595751656551,0.59714054544,0.598529434329,0.599918323217,0.601307212106,0.602696100995,0.604084989884,0.605473878773,0.606862767662,0.608251656551,0.60964054544,0.611029434329,0.612418323217,0.613807212106,0.615196100995,0.616584989884,0.617973878773,0.619362767662,0.620751656551,0.62214054544,0.623529434329,0.624918323217,0.626307212106,0.627696100995,0.629084989884,0.630473878773,0.631862767662,0.633251656551,0.63464054544,0.636029434329,0.637418323217,0.638807212106,0.640196100995,0.641584989884,0.642973878773,0.644362767662,0.645751656551,0.64714054544,0.648529434329,0.649918323217,0.651307212106,0.652696100995,0.654084989884,0.655473878773,0.656862767662,0.658251656551,0.65964054544,0.661029434329,0.662418323217,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773,0.662673878773]
-        internal_buttress_data = [0.651400386759,0.640088794497,0.628777202236,0.617465609975,0.606154017714,0.594842425453,0.583530833192,0.572219240931,0.56090764867,0.549596056409,0.538284464148,0.526972871887,0.515661279626,0.504349687365,0.493038095104,0.481726502842,0.470414910581,0.45910331832,0.447791726059,0.436480133798,0.425168541537,0.413856949276,0.402545357015,0.391233764754,0.379922172493,0.368610580232,0.357298987971,0.34598739571,0.334675803449,0.323364211188,0.312052618926,0.300741026665,0.289429434404,0.278117842143,0.266806249882,0.255494657621,0.24418306536,0.232871473099,0.221559880838,0.210248288577,0.198936696316,0.187625104055,0.176313511794,0.165001919533,0.153690327272,0.14237873501,0.131067142749,0.119755550488,0.108443958227,0.097132365966,0.085820773705,0.074509181444,0.063197589183,0.051885996925,0.040574404667,0.029262812409,0.017951220151,0.006639627893,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.000871979,0.00226086789,0.00364975678,0.005038645671,0.006427534561,0.007816423451,0.009205312341,0.010594201232,0.011983090122,0.013371979012,0.014760867902,0.016149756793,0.017538645683,0.018927534573,0.020316423463,0.021705312353,0.023094201242,0.024483090131,0.02587197902,0.027260867909,0.028649756797,0.030038645686,0.031427534575,0.032816423464,0.034205312353,0.035594201242,0.036983090131,0.03837197902,0.039760867909,0.041149756797,0.042538645686,0.043927534575,0.045316423464,0.046705312353,0.048094201242,0.049483090131,0.05087197902,0.052260867909,0.053649756797,0.055038645686,0.056427534575,0.057816423464,0.059205312353,0.060594201242,0.061983090131,0.06337197902,0.064760867908,0.066149756797,0.067538645686,0.068927534575,0.070316423464,0.071705312353,0.073094201242,0.074483090131,0.07587197902,0.077260867908,0.078649756797,0.080038645686,0.081427534575,0.082816423464,0.084205312353,0.085594201242,0.086983090131,0.08837197902,0.089760867908,0.091149756797,0.092538645686,0.093927534575,0.095316423464,0.096705312353,0.098094201242,0.099483090131,0.10087197902,0.102260867908,0.103649756797,0.105038645686,0.106427534575,0.107816423464,0.109205312353,0.110594201242,0.111983090131,0.11337197902,0.114760867908,0.116149756797,0.117538645686,0.118927534575,0.120316423464,0.121705312353,0.123094201242,0.124483090131,0.12587197902,0.127260867908,0.128649756797,0.130038645686,0.131427534575,0.132816423464,0.134205312353,0.135594201242,0.136983090131,0.13837197902,0.139760867908,0.141149756797,0.142538645686,0.143927534575,0.145316423464,0.146705312353,0.148094201242,0.149483090131,0.15087197902,0.152260867908,0.153649756797,0.155038645686,0.156427534575,0.157816423464,0.159205312353,0.160594201242,0.161983090131,0.16337197902,0.164760867908,0.166149756797,0.167538645686,0.168927534575,0.170316423464,0.171705312353,0.173094201242,0.174483090131,0.17587197902,0.177260867908,0.178649756797,0.180038645686,0.181427534575,0.182816423464,0.184205312353,0.185594201242,0.186983090131,0.18837197902,0.189760867908,0.191149756797,0.192538645686,0.193927534575,0.195316423464,0.196705312353,0.198094201242,0.199483090131,0.20087197902,0.202260867908,0.203649756797,0.205038645686,0.206427534575,0.207816423464,0.209205312353,0.210594201242,0.211983090131,0.21337197902,0.214760867908,0.216149756797,0.217538645686,0.218927534575,0.220316423464,0.221705312353,0.223094201242,0.224483090131,0.22587197902,0.227260867908,0.228649756797,0.230038645686,0.231427534575,0.232816423464,0.234205312353,0.235594201242,0.236983090131,0.23837197902,0.239760867908,0.241149756797,0.242538645686,0.243927534575,0.245316423464,0.246705312353,0.248094201242,0.249483090131,0.25087197902,0.252260867908,0.253649756797,0.255038645686,0.256427534575,0.257816423464,0.259205312353,0.260594201242,0.261983090131,0.26337197902,0.264760867908,0.266149756797,0.267538645686,0.268927534575,0.270316423464,0.271705312353,0.273094201242,0.274483090131,0.27587197902,0.277260867908,0.278649756797,0.280038645686,0.281427534575,0.282816423464,0.284205312353,0.285594201242,0.286983090131,0.28837197902,0.289760867908,0.291149756797,0.292538645686,0.293927534575,0.295316423464,0.296705312353,0.298094201242,0.299483090131,0.30087197902,0.302260867908,0.303649756797,0.305038645686,0.306427534575,0.307816423464,0.309205312353,0.310594201242,0.311983090131,0.31337197902,0.314760867908,0.316149756797,0.317538645686,0.318927534575,0.320316423464,0.321705312353,0.323094201242,0.324483090131,0.32587197902,0.327260867908,0.328649756797,0.330038645686,0.331427534575,0.332816423464,0.334205312353,0.335594201242,0.336983090131,0.33837197902,0.339760867908,0.341149756797,0.342538645686,0.343927534575,0.345316423464,0.346705312353,0.348094201242,0.349483090131,0.35087197902,0.352260867908,0.353649756797,0.355038645686,0.356427534575,0.357816423464,0.359205312353,0.360594201242,0.361983090131,0.36337197902,0.364760867908,0.366149756797,0.367538645686,0.368927534575,0.370316423464,0.371705312353,0.373094201242,0.374483090131,0.37587197902,0.377260867908,0.378649756797,0.380038645686,0.381427534575,0.382816423464,0.384205312353,0.385594201242,0.386983090131,0.38837197902,0.389760867908,0.391149756797,0.392538645686,0.393927534575,0.395316423464,0.396705312353,0.398094201242,0.399483090131,0.40087197902,0.402260867908,0.403649756797,0.405038645686,0.406427534575,0.407816423464,0.409205312353,0.410594201242,0.411983090131,0.41337197902,0.414760867908,0.416149756797,0.417538645686,0.418927534575,0.420316423464,0.421705312353,0.423094201242,0.424483090131,0.42587197902,0.427260867908,0.428649756797,0.430038645686,0.431427534575,0.432816423464,0.434205312353,0.435594201242,0.436983090131,0.43837197902,0.439760867908,0.441149756797,0.442538645686,0.443927534575,0.445316423464,0.446705312353,0.448094201242,0.449483090131,0.45087197902,0.452260867908,0.453649756797,0.455038645686,0.456427534575,0.457816423464,0.459205312353,0.460594201242,0.461983090131,0.46337197902,0.464760867908,0.466149756797,0.467538645686,0.468927534575,0.470316423464,0.471705312353,0.473094201242,0.474483090131,0.47587197902,0.477260867908,0.478649756797,0.480038645686,0.481427534575,0.482816423464,0.484205312353,0.485594201242,0.486983090131,0.48837197902,0.489760867908,0.491149756797,0.492538645686,0.493927534575,0.495316423464,0.496705312353,0.498094201242,0.499483090131,0.50087197902,0.502260867908,0.503649756797,0.505038645686,0.506427534575,0.507816423464,0.509205312353,0.510594201242,0.511983090131,0.51337197902,0.514760867908,0.516149756797,0.517538645686,0.518927534575,0.520316423464,0.521705312353,0.523094201242,0.524483090131,0.52587197902,0.527260867908,0.528649756797,0.530038645686,0.531427534575,0.532816423464,0.534205312353,0.535594201242,0.536983090131,0.53837197902,0.539760867908,0.541149756797,0.542538645686,0.543927534575,0.545316423464,0.546705312353,0.548094201242,0.549483090131,0.55087197902,0.552260867908,0.553649756797,0.555038645686,0.556427534575,0.557816423464,0.559205312353,0.560594201242,0.561983090131,0.56337197902,0.564760867908,0.566149756797,0.567538645686,0.568927534575,0.570316423464,0.571705312353,0.573094201242,0.574483090131,0.57587197902,0.577260867908,0.578649756797,0.580038645686,0.581427534575,0.582816423464,0.584205312353,0.585594201242,0.586983090131,0.58837197902,0.589760867908,0.591149756797,0.592538645686,0.593927534575,0.595316423464,0.596705312353,0.598094201242,0.599483090131,0.60087197902,0.602260867908,0.603649756797,0.605038645686,0.606427534575,0.607816423464,0.609205312353,0.610594201242,0.611983090131,0.61337197902,0.614760867908,0.616149756797,0.617538645686,0.618927534575,0.620316423464,0.621705312353,0.623094201242,0.624483090131,0.62587197902,0.627260867908,0.628649756797,0.630038645686,0.631427534575,0.632816423464,0.634205312353,0.635594201242,0.636983090131,0.63837197902,0.639760867908,0.641149756797,0.642538645686,0.643927534575,0.645316423464,0.646705312353,0.648094201242,0.649483090131,0.65087197902,0.652260867908,0.653649756797,0.655038645686,0.656427534575,0.657816423464,0.659205312353,0.660594201242,0.661983090131,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902,0.66271197902]
-        super(ThreadProfileCreateButtressObjectCommandClass, self).makeThreadProfile(name="BThreadProfile",internal_data = internal_buttress_data, external_data = external_buttress_data, presets = buttress_presets_data,minor_diameter=buttress_presets_data[13][2],pitch=25.4/10,internal_or_external="External",thread_count=10)
+        #profile data and presets are in the shared library, see ThreadProfileCore.tables
+        from ThreadProfileCore.presetdb import presetDatabase
+        preset = presetDatabase("Buttress").nearest(25.4, tpi=10) #1-10
+        super(ThreadProfileCreateButtressObjectCommandClass, self).makeThreadProfile(name="BThreadProfile",profile_id="Buttress",minor_diameter=preset.external_minor,pitch=preset.pitch,internal_or_external="External",thread_count=10)
 
 #Gui.addCommand("ThreadProfileCreateButtressObject", ThreadProfileCreateButtressObjectCommandClass())
 
@@ -926,59 +628,26 @@ class ThreadProfileCreateBottleObjectCommandClass(ThreadProfileCreateObjectComma
 ]
     def makeBottleThreadProfile(self):
 
-        def cd(txt, minor, major, tpi): #cd = calculate diameters
-            pitch = 25.4/tpi
-            offset = .25 #.25 mm
-            external = minor
-            internal = minor + offset
-            return[txt, pitch, external, internal]
-        bottle_presets_data = [
-            ["Bottle presets",0,0,0], #just fillers, not used
-            cd('13-SP415(M)',11.53,13.06,12),
-            cd('15-SP415(M)',13.23,14.76,12),
-            cd('18-SP400(M)',15.75,17.88,8),
-            cd('20-SP400(M)',17.75,19.89,8),
-            cd('22-SP400(M)',19.76,21.89,8),
-            cd('24-SP400(M)',21.74,23.87,8),
-            cd('28-SP400(M)',25.25,27.64,6),
-            cd('30-SP400(M)',26.23,28.62,6),
-            cd('33-SP400(M)',29.74,32.14,6),
-            cd('35-SP400(M)',32.25,34.64,6),
-            cd('38-SP400(M)',35.10,37.50,6),
-            cd('40-SP400(M)',37.75,40.13,6),
-            cd('43-SP400(M)',39.62,42.00,6),
-            cd('45-SP400(M)',41.81,44.20,6),
-            cd('48-SP400(M)',45.11,47.50,6),
-            cd('51-SP400(M)',47.60,50.00,6),
-            cd('53-SP400(M)',50.11,52.50,6),
-            cd('58-SP400(M)',54.10,56.50,6),
-            cd('60-SP400(M)',57.10,59.50,6),
-            cd('63-SP400(M)',60.12,62.51,6),
-            cd('66-SP400(M)',63.12,65.50,6),
-            cd('70-SP400(M)',67.00,69.50,6),
-            cd('75-SP400(M)',71.60,74.00,6),
-            cd('77-SP400(M)',74.70,77.10,6),
-            cd('83-SP400(M)',80.00,83.00,5),
-            cd('89-SP400(M)',86.12,89.18,5),
-            cd('100-SP400(M)',96.95,100.00,5),
-            cd('110-SP400(M)',107.00,110.00,5),
-            cd('120-SP400(M)',117.00,120.00,5)]
-        
-        internal_bottle_data = [6.8683031e-05,0.000137366062,0.000212133459,0.000297079403,0.00043472746,0.000654671378,0.000874564607,0.001094356609,0.001359150971,0.001721121373,0.002082807209,0.002443804942,0.002850563041,0.003361308354,0.003871704024,0.004381405087,0.004955897908,0.005628737414,0.006300748062,0.006971927834,0.007756613829,0.008607819995,0.009457347838,0.010315734263,0.011370310303,0.012423445314,0.013473928827,0.014685365793,0.015972298608,0.017255462058,0.018731355311,0.020298896767,0.021860838018,0.023734575329,0.0256608722,0.027746830253,0.030156669021,0.032682649119,0.035784784003,0.039333119593,0.043607169802,0.050108303718,0.058203072769,0.066297841819,0.074392610869,0.082487379919,0.090582148969,0.09867691802,0.10677168707,0.114715457724,0.122454130079,0.130192802434,0.137931474789,0.145783494053,0.153739940852,0.16169638765,0.169652834449,0.177609281248,0.185565728047,0.193522174845,0.201478621644,0.209435068443,0.217250848149,0.225058671756,0.232866495362,0.239116950513,0.243239377186,0.246810305242,0.249853555844,0.252406769649,0.254797942824,0.256883002572,0.258810868767,0.2606626839,0.262236336952,0.263809990003,0.265260684115,0.266549898945,0.267839113775,0.269050111281,0.270106429841,0.271162748401,0.272203697656,0.273058398511,0.273913099365,0.27476780022,0.275542163288,0.276214672995,0.276887182703,0.27755969241,0.278135951759,0.278642295503,0.279148639248,0.279654982993,0.280079914105,0.280431233266,0.280782552427,0.281133871587,0.281437919761,0.281640871019,0.281843822278,0.282046773536,0.282248726063,0.282314318596,0.28237991113,0.282445645984,0.282510772153,0.282532145192,0.282553518231,0.28257489127,0.28259626431,0.282617637349,0.282639010388,0.282660383427,0.282681756466,0.282703129505,0.282724502544,0.282745875583,0.282767248622,0.282788621661,0.282809994701,0.28283136774,0.282852740779,0.282874113818,0.282895486857,0.282916859896,0.282938232935,0.282959605974,0.282980979013,0.283002352052,0.283023725092,0.283045098131,0.28306647117,0.283087844209,0.283109217248,0.283130590287,0.283151963326,0.283173336365,0.283194709404,0.283216082443,0.283237455483,0.283258828522,0.283280201561,0.2833015746,0.283322947639,0.283344320678,0.283365693717,0.283387066756,0.283408439795,0.283429812834,0.283451185874,0.283472558913,0.283493931952,0.283515304991,0.28353667803,0.283558051069,0.283579424108,0.283600797147,0.283622170186,0.283643543225,0.283664916265,0.283686289304,0.283707662343,0.283729035382,0.283750408421,0.28377178146,0.283793154499,0.283814527538,0.283835900577,0.283857273616,0.283878646656,0.283900019695,0.283921392734,0.283942765773,0.283951688599,0.283902194483,0.283852700366,0.283803206249,0.283753712132,0.283704218016,0.283654723899,0.283611569121,0.283630031582,0.283648494043,0.283666956504,0.283685418965,0.283689560214,0.283620503218,0.283551446222,0.283482389226,0.28341333223,0.283344275234,0.283275218238,0.283206161242,0.283137104246,0.28306804725,0.282998990254,0.282929933258,0.282861100274,0.282719757663,0.282512040929,0.282304324194,0.28209660746,0.281888890725,0.281681173991,0.281473457256,0.281265740522,0.281058023788,0.280850307053,0.280642590319,0.280434873584,0.280213015121,0.279862714081,0.279512413041,0.279162112001,0.278811810961,0.278461509921,0.278111208881,0.277760907841,0.277410606801,0.277060305761,0.276710004721,0.276359703681,0.276009998755,0.275530567714,0.275029495361,0.274528423008,0.274027350656,0.273526278303,0.273025205951,0.272524133598,0.272023061246,0.271521988893,0.271020916541,0.270519844188,0.270018438336,0.269367290509,0.268703541348,0.268039792187,0.267376043026,0.266712293865,0.266048544704,0.265384795543,0.264721046382,0.264057297221,0.26339354806,0.262729703442,0.261990260998,0.261146476239,0.260302691481,0.259458906723,0.258615121965,0.257771337207,0.256927552448,0.25608376769,0.255239982932,0.254396198174,0.25355230571,0.25261348976,0.251565238425,0.25051698709,0.249468735755,0.24842048442,0.247372233085,0.24632398175,0.245275730415,0.24422747908,0.243179227745,0.242086677594,0.240815575077,0.239545391949,0.238275208821,0.237005025693,0.235734842565,0.234464659437,0.233194476309,0.231924293181,0.230568655072,0.229206476602,0.227844298132,0.226482119662,0.225119941192,0.223757762722,0.222395584252,0.221033405782,0.219650107646,0.218236464012,0.216822820379,0.215409176745,0.213995533111,0.212581889477,0.211168245844,0.20975460221,0.208340958576,0.206927314943,0.205513671309,0.204100027675,0.202686384042,0.201272740408,0.199859096774,0.19844545314,0.197031809507,0.195618165873,0.194204522239,0.192790878606,0.191377234972,0.189963591338,0.188549947705,0.187136304071,0.185722660437,0.184309016804,0.18289537317,0.181481729536,0.180068085902,0.178654442269,0.177240798635,0.175827155001,0.174413511368,0.172999867734,0.1715862241,0.170172580467,0.168758936833,0.167345293199,0.165931649565,0.164518005932,0.163104362298,0.161690718664,0.160277075031,0.158863431397,0.157449787763,0.15603614413,0.154622500496,0.153208856862,0.151795213228,0.150381569595,0.148967925961,0.147554282327,0.146140638694,0.14472699506,0.143313351426,0.141899707793,0.140500737494,0.139112056243,0.137723374992,0.13633469374,0.134946012489,0.133557331238,0.132168649987,0.130779968736,0.129391287485,0.128002606234,0.126613924982,0.125225243731,0.12383656248,0.122447881229,0.121059199978,0.119670518727,0.118281837476,0.116893156224,0.115504474973,0.114115793722,0.112727112471,0.11133843122,0.109949749969,0.108561068718,0.107172387466,0.105783706215,0.104395024964,0.103006343713,0.101617662462,0.100228981211,0.09884029996,0.097451618709,0.096062937457,0.094674256206,0.093285574955,0.091896893704,0.090508212453,0.089119531202,0.087730849951,0.086342168699,0.084953487448,0.083564806197,0.082176124946,0.080788287214,0.079404069355,0.078019851497,0.076635633638,0.07525141578,0.073867197921,0.072482980062,0.071098762204,0.069714544345,0.068330326487,0.066946108628,0.06556189077,0.064177672911,0.062793455052,0.061409237194,0.060025019335,0.058640801477,0.057256583618,0.05587236576,0.054488147901,0.053103930042,0.051733224667,0.050401495599,0.04906976653,0.047784638712,0.046568266765,0.045351894818,0.04413552287,0.042919150923,0.041702778976,0.040486407028,0.03943618023,0.03841146284,0.03738674545,0.036359968043,0.03533264278,0.034305317518,0.033277992255,0.032250666993,0.03122334173,0.030196016468,0.0293209833,0.028493936502,0.027666889704,0.026838996003,0.026010063867,0.025181131732,0.024352199596,0.023523267461,0.022694335326,0.02186540319,0.021036471055,0.020370341413,0.019719415915,0.019068490416,0.018417074611,0.017764922316,0.017112770022,0.016460617727,0.015808465432,0.015156313138,0.014504160843,0.013852008548,0.013269101482,0.012779696297,0.012290291113,0.011800885928,0.01131111685,0.010821219432,0.010331322013,0.009841424595,0.009351527176,0.008861629757,0.008371732339,0.00788183492,0.007452335438,0.007114370116,0.006776404795,0.006438439474,0.006100222288,0.005761820231,0.005423418173,0.005085016115,0.004746614058,0.004408212,0.004069809943,0.003731407885,0.003393005828,0.003191735689,0.002998655249,0.00280557481,0.002612490228,0.002419282801,0.002226075374,0.002032867947,0.00183966052,0.001646453093,0.001453245666,0.001260038239,0.001066830812,0.000900522301,0.000839410957,0.000778299614,0.00071718827,0.000656076927,0.000594965583,0.00053385424,0.000472742896,0.000411828152,0.00035115619,0.000290484228,0.000230947612,0.000238906289,0.000246864967,0.000254823645,0.000262782322,0.000270741,0.000278699678,0.000286658355,0.000294617033,0.000302575711,0.000310534388,0.000318493066,0.000326451744,0.000334410422,0.000342369099,0.000350327777,0.000358286455,0.000366245132,0.00037420381,0.000382162488,0.000390121165,0.000398079843,0.000406038521,0.000413997198,0.000421955876,0.000429914554,0.000437873231,0.000445831909,0.000453790587,0.000461749264,0.000469707942,0.00047766662,0.000485625297,0.000493583975,0.000501542653,0.00050950133,0.000517460008,0.000525418686,0.000533377363,0.000541336041,0.000549294719,0.000557253396,0.000565212074,0.000573170752,0.000581129429,0.000589088107,0.000597046785,0.000605005462,0.00061296414,0.000620922818,0.000628881496,0.000636840173,0.000644798851,0.000652757529,0.000660716206,0.000668674884,0.000676633562,0.000684592239,0.000692550917,0.000700509595,0.000708468272,0.00071642695,0.000724385628,0.000732344305,0.000740302983,0.000748261661,0.000756220338,0.000764179016,0.000772137694,0.000780096371,0.000788055049,0.000796013727,0.000803972404,0.000811931082,0.00081988976,0.000827848437,0.000835807115,0.000843765793,0.00085172447,0.000859683148,0.000867641826,0.000875600503,0.000883559181,0.000891517859,0.000899476536,0.000907435214,0.000915393892,0.00092335257,0.000931311247,0.000939269925,0.000947228603,0.00095518728,0.000963145958,0.000971104636,0.000979063313,0.000987021991,0.000994980669,0.001002939346,0.001010898024,0.001018856702,0.001026815379,0.001034774057,0.001042732735,0.001050691412,0.00105865009,0.001066608768,0.001074567445,0.001082526123,0.001090484801,0.001098443478,0.001106402156,0.001114360834,0.001122319511,0.001130278189,0.001138236867,0.001146195544,0.001154154222,0.0011621129,0.001170071577,0.001178030255,0.001185988933,0.001193947611,0.001201906288,0.001209864966,0.001217823644,0.001225782321,0.001233740999,0.001241699677,0.001249658354,0.001257617032,0.00126557571,0.001273534387,0.001281493065,0.001289451743,0.00129741042,0.001305369098,0.001313327776,0.001321286453,0.001329245131,0.001337203809,0.001345162486,0.001353121164,0.001361079842,0.001369038519,0.001376997197,0.001384955875,0.001392914552,0.00140087323,0.001408831908,0.001416790585,0.001403595664,0.001384628155,0.001365660646,0.001346693137,0.001327725628,0.001308758119,0.00128979061,0.001270823101,0.001251855592,0.001232888083,0.001213920574,0.001194953065,0.001175985556,0.001157018047,0.001138050538,0.001119083029,0.00110011552,0.001081148011,0.001062180502,0.001043212993,0.001024245484,0.001005277975,0.000986310466,0.000967342957,0.000948375448,0.00092940794,0.000910440431,0.000891472922,0.000872505413,0.000853537904,0.000834570395,0.000815602886,0.000796635377,0.000777667868,0.000758700359,0.00073973285,0.000720765341,0.000701797832,0.000682830323,0.000663862814,0.000644895305,0.000625927796,0.000606960287,0.000587992778,0.000569025269,0.00055005776,0.000531090251,0.000512122742,0.000493155233,0.000474187724,0.000455220215,0.000436252706,0.000417285197,0.000398317688,0.000379350179,0.00036038267,0.000341415161,0.000322447652,0.000303480144,0.000284512635,0.000265545126,0.000246577617,0.000227610108,0.000208642599,0.00018967509,0.000170707581,0.000151740072,0.000132772563,0.000113805054,9.4837545e-05,7.5870036e-05,5.6902527e-05,3.7935018e-05,1.8967509e-05]
-        external_bottle_data = internal_bottle_data
-        super(ThreadProfileCreateBottleObjectCommandClass, self).makeThreadProfile(name="Bottle_M_ThreadProfile",internal_data = internal_bottle_data, external_data = external_bottle_data, presets = bottle_presets_data,minor_diameter=bottle_presets_data[13][2],pitch=bottle_presets_data[13][1],internal_or_external="External",thread_count=3)
+        #profile data and presets are in the shared library, see ThreadProfileCore.tables
+        from ThreadProfileCore.presetdb import presetDatabase
+        preset = presetDatabase("Bottle").nearest(43) #43-SP400(M)
+        super(ThreadProfileCreateBottleObjectCommandClass, self).makeThreadProfile(name="Bottle_M_ThreadProfile",profile_id="Bottle",minor_diameter=preset.external_minor,pitch=preset.pitch,internal_or_external="External",thread_count=3)
 
 #Gui.addCommand("ThreadProfileCreateBottleObject", ThreadProfileCreateBottleObjectCommandClass())
 ####################################################################################
 
 def initialize():
     if FreeCAD.GuiUp:
+        Gui.Selection.addObserver(selectionCache)
         Gui.addCommand("ThreadProfileCreateObject", ThreadProfileCreateObjectCommandClass())
         Gui.addCommand("ThreadProfileMakeHelix", ThreadProfileMakeHelixCommandClass())
         Gui.addCommand("ThreadProfileOpenOnlineCalculator", ThreadProfileOpenOnlineCalculatorCommandClass())
         Gui.addCommand("ThreadProfileCreateButtressObject", ThreadProfileCreateButtressObjectCommandClass())
         Gui.addCommand("ThreadProfileCreateBottleObject", ThreadProfileCreateBottleObjectCommandClass())
         Gui.addCommand("ThreadProfileDoSweep", ThreadProfileDoSweepCommandClass())
+        Gui.addCommand("ThreadProfileMakeThread", ThreadProfileMakeThreadCommandClass())
+        Gui.addCommand("ThreadProfileReport", ThreadProfileReportCommandClass())
+        Gui.addCommand("ThreadProfileFit", ThreadProfileFitCommandClass())
         Gui.addCommand("ThreadProfileSettings", ThreadProfileSettingsCommandClass())
 
 
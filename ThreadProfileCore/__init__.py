@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  __init__.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Thread geometry core.  Pure python / numpy, no FreeCAD or Qt imports, so
+profiles can be computed in worker processes and in CI without starting FreeCAD."""
+
+from .geometry import unitCircle, sampleProfile, multiStart, parameterization, knotSequence
+from .presets import buttressPreset, bottlePreset, flattenPresets
+from .cache import contentHash, LRUCache
+from .decimate import adaptiveIndices, radialDeviation, samplePolar
+from .bspline import PeriodicFit, periodicBasis, profileParameters, fitPeriodicBSpline, scaledTolerance, minimalFit
+from .library import ProfileLibrary, profileLibrary, profileHash, presetsHash
+from .presetdb import Preset, PresetDatabase, presetDatabase, parseNominal
+from .helix import HelixBlend, bsplineBasis, helixBlend, helicalPoles
+from .synth import ThreadForm, makeForm, formTable, synthesizeProfile, synthesizeProfilePair
+from .spectral import Spectrum, profileSpectrum, evaluateSpectrum, spectrumSize
+from .fit import Fit, analyzeFit, presetFit, fitSummary
+from .standards import ThreadLimits, isoMetricLimits, unifiedLimits, buttressLimits, presetMinors, standardPresets
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  bspline.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Least squares fitting of periodic B-splines with uniform knots.  The fit is done directly
+on the profile points, so the pole count is chosen by the caller instead of by OCC's approximate()"""
+
+import math
+from collections import namedtuple
+import numpy as np
+from .cache import contentHash, LRUCache
+
+#poles is an (n, 2) array, mults and knots are lists in the form buildFromPolesMultsKnots() wants them
+PeriodicFit = namedtuple("PeriodicFit", "poles mults knots degree error")
+
+def periodicBasis(t, count, degree):
+    '''periodicBasis(t, count, degree): returns the (len(t), count) collocation matrix of the
+    uniform periodic B-spline basis with count poles at parameters t (wrapped into [0, 1))'''
+    u = (np.asarray(t, dtype=float) % 1.0) * count
+    span = np.minimum(np.floor(u).astype(int), count - 1)
+    s = u - span
+    #Cox-de Boor for integer knots, see The NURBS Book A2.2, the denominators are all j
+    N = np.zeros((degree + 1, len(s)))
+    N[0] = 1.0
+    for j in range(1, degree + 1):
+        saved = np.zeros(len(s))
+        for r in range(j):
+            temp = N[r] / j
+            N[r] = saved + (r + 1 - s) * temp
+            saved = (s + j - r - 1) * temp
+        N[j] = saved
+    A = np.zeros((len(s), count))
+    rows = np.arange(len(s))
+    for r in range(degree + 1):
+        np.add.at(A, (rows, (span - degree + r) % count), N[r])
+    return A
+
+def profileParameters(xs, ys):
+    '''profileParameters(xs, ys): polar angle of the points as a fraction of a full turn, the natural
+    parameter for a thread profile since the profile data is tabulated by angle'''
+    return (np.arctan2(ys, xs) / (2 * math.pi)) % 1.0
+
+def fitPeriodicBSpline(xs, ys, count, degree=3, t=None):
+    '''fitPeriodicBSpline(xs, ys, count, degree=3, t=None): least squares fit of a closed curve
+    through the points with a periodic B-spline of count poles and uniform knots.
+    t defaults to profileParameters(xs, ys).  count is limited to the number of points.
+    Returns a PeriodicFit, error is the largest distance between a point and the curve at its parameter.'''
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    if t is None:
+        t = profileParameters(xs, ys)
+    count = max(min(int(count), len(xs)), degree + 1)
+    A = periodicBasis(t, count, degree)
+    P = np.column_stack((xs, ys))
+    poles = np.linalg.lstsq(A, P, rcond=None)[0]
+    error = float(np.sqrt(((A.dot(poles) - P) ** 2).sum(axis=1)).max())
+    knots = (np.arange(count + 1) / float(count)).tolist()
+    mults = [1] * (count + 1)
+    return PeriodicFit(poles, mults, knots, degree, error)
+
+def scaledTolerance(pitch, diameter, fraction=1/30.):
+    '''scaledTolerance(pitch, diameter, fraction=1/30.): approximation tolerance in mm for a thread of this
+    pitch and (major) diameter, fraction of the ISO 965 grade 6 pitch diameter tolerance 90 P^0.4 d^0.1 um.
+    The default gives about the old fixed .003692 for M6x1, 0.0017 for M1x0.25 and 0.0097 for M100x6.'''
+    return fraction * 0.09 * pitch ** 0.4 * max(diameter, 1.0) ** 0.1
+
+_minimalCache = LRUCache(64)
+
+def minimalFit(xs, ys, tolerance, degrees=(3, 5), min_count=8, max_count=None):
+    '''minimalFit(xs, ys, tolerance, degrees=(3, 5), min_count=8, max_count=None): fitPeriodicBSpline() with
+    the fewest poles (then the lowest degree) whose error is within tolerance, found by bisection on the
+    pole count for each degree.  If no pole count is good enough the most accurate fit tried is returned,
+    check its error.  Memoized on the points and arguments.'''
+    key = contentHash(xs, ys, tolerance, tuple(degrees), min_count, max_count)
+    best = _minimalCache.get(key)
+    if best is not None:
+        return best
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    t = profileParameters(xs, ys)
+    top = min(max_count or len(xs), len(xs))
+    best = None
+    for degree in degrees:
+        low = max(min_count, degree + 1)
+        if low > top:
+            continue
+        #double the pole count until the tolerance is met, then bisect between the last two counts.
+        #The error is not strictly monotone in the pole count, so this finds a small count that meets
+        #the tolerance, usually but not always the smallest one
+        high = low
+        fit = fitPeriodicBSpline(xs, ys, high, degree, t)
+        while fit.error > tolerance and high < top:
+            low, high = high + 1, min(high * 2, top)
+            fit = fitPeriodicBSpline(xs, ys, high, degree, t)
+        if fit.error > tolerance:
+            #even the largest fit misses, keep the most accurate one in case nothing does better
+            if best is None or (best.error > tolerance and fit.error < best.error):
+                best = fit
+            continue
+        while low < high:
+            mid = (low + high) // 2
+            trial = fitPeriodicBSpline(xs, ys, mid, degree, t)
+            if trial.error <= tolerance:
+                high, fit = mid, trial
+            else:
+                low = mid + 1
+        if best is None or best.error > tolerance or len(fit.poles) < len(best.poles):
+            best = fit
+    _minimalCache.put(key, best)
+    return best
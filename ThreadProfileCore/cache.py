@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  cache.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Content hashing and a small LRU cache, used to share computed shapes between objects"""
+
+import hashlib
+from collections import OrderedDict
+import numpy as np
+
+def contentHash(*items):
+    '''contentHash(*items): returns a hex digest for items.  Lists, tuples and arrays of numbers are
+    hashed as float64 bytes so [1, 2] and [1.0, 2.0] give the same key, everything else by repr()'''
+    h = hashlib.sha1()
+    for item in items:
+        if isinstance(item, (list, tuple, np.ndarray)):
+            try:
+                h.update(np.asarray(item, dtype=np.float64).tobytes())
+            except (TypeError, ValueError):
+                h.update(repr(item).encode("utf-8"))
+        else:
+            h.update(repr(item).encode("utf-8"))
+        h.update(b"|")
+    return h.hexdigest()
+
+class LRUCache(object):
+    """Bounded least recently used cache"""
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key, default=None):
+        if key in self._items:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return self._items[key]
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > max(self.maxsize, 0):
+            self._items.popitem(last=False)
+
+    def clear(self):
+        self._items.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  decimate.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Adaptive point selection for profile tables.  Instead of taking every Quality-th sample,
+samples are picked by polyline simplification (Douglas-Peucker) of the periodic polar profile,
+so flat crests and roots get few points and flanks / radii get as many as needed."""
+
+import math
+import numpy as np
+from .cache import contentHash, LRUCache
+from .geometry import multiStart
+
+_decimateCache = LRUCache(256)
+
+def radialDeviation(data, indices):
+    '''radialDeviation(data, indices): returns the deviation of every sample in data from the
+    periodic linear interpolation through data[indices], in the units of data'''
+    data = np.asarray(data, dtype=float)
+    n = len(data)
+    indices = np.asarray(indices)
+    xp = np.concatenate((indices, [indices[0] + n]))
+    fp = np.concatenate((data[indices], [data[indices[0]]]))
+    x = np.arange(n)
+    x = np.where(x < indices[0], x + n, x)
+    return np.abs(data - np.interp(x, xp, fp))
+
+def adaptiveIndices(data, tolerance, max_gap=24):
+    '''adaptiveIndices(data, tolerance, max_gap=24): returns (indices, error)
+    indices are the sorted indices into data to keep, error is the maximum deviation of the
+    dropped samples from the periodic polyline through the kept ones, always <= tolerance.
+    tolerance is in the units of data (pitch units for ThreadProfile tables).
+    max_gap limits the number of samples between kept ones so flat regions, which are arcs
+    once wrapped around the minor diameter, still get enough points for the spline.'''
+    key = contentHash(data, tolerance, max_gap)
+    cached = _decimateCache.get(key)
+    if cached is not None:
+        return cached
+    data = np.asarray(data, dtype=float)
+    n = len(data)
+    max_gap = max(int(max_gap), 1)
+    if n < 4:
+        result = (np.arange(n), 0.0)
+        _decimateCache.put(key, result)
+        return result
+    wrapped = np.concatenate((data, data[:1])) #closed profile, sample n is sample 0 again
+    keep = np.zeros(n + 1, dtype=bool)
+    keep[0] = keep[n] = True
+    #seed with the sample furthest from the first one so the two halves are simplified separately
+    far = int(np.argmax(np.abs(data - data[0])))
+    if far > 0:
+        keep[far] = True
+        stack = [(0, far), (far, n)]
+    else:
+        stack = [(0, n)]
+    while stack:
+        i, j = stack.pop()
+        if j - i < 2:
+            continue
+        inner = np.arange(i + 1, j)
+        line = wrapped[i] + (wrapped[j] - wrapped[i]) * (inner - i) / float(j - i)
+        dev = np.abs(wrapped[inner] - line)
+        k = int(np.argmax(dev))
+        if dev[k] > tolerance or j - i > max_gap:
+            mid = int(inner[k]) if dev[k] > tolerance else (i + j) // 2
+            keep[mid] = True
+            stack.append((i, mid))
+            stack.append((mid, j))
+    indices = np.flatnonzero(keep[:n])
+    error = float(radialDeviation(data, indices).max())
+    result = (indices, error)
+    _decimateCache.put(key, result)
+    return result
+
+def samplePolar(data, minor_diameter, pitch, indices, starts=1):
+    '''samplePolar(data, minor_diameter, pitch, indices, starts=1): returns numpy arrays (x, y) of the profile
+    points for the given indices into data, same angles as sampleProfile() uses'''
+    indices = np.asarray(indices)
+    alpha = (indices + 1) * (math.pi * 2 / len(data))
+    radius = minor_diameter / 2 + np.asarray(data, dtype=float)[indices] * pitch
+    if starts > 1:
+        return multiStart(alpha, radius, starts)
+    return np.cos(alpha) * radius, np.sin(alpha) * radius
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  fit.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Fit of an internal and an external thread from their profile tables.  Both threads are sections
+along the axis, radius against axial position within one pitch, so the clearances follow from the
+tables, the pitch and the minor diameters without making any solids or cross sections."""
+
+from collections import namedtuple
+import numpy as np
+from .cache import contentHash, LRUCache
+from .library import profileLibrary
+from .presetdb import presetDatabase
+
+#all lengths in mm, the arrays are over one pitch at the axial positions in position, sample k at (k + 1) / n:
+#radial: radial clearance, negative where the threads interfere, as modelled (both at the same placement)
+#axial_up, axial_down: how far each point of the external flank can move along the axis before it hits the internal thread
+#play_up, play_down: how far the external thread can move along the axis, the smallest of axial_up / axial_down
+#interference: (start, end) axial positions of the ranges with negative radial clearance
+#allowance: internal minus external pitch diameter, the pitch diameters are where thread and groove are equally wide
+Fit = namedtuple("Fit", "position radial axial_up axial_down min_clearance min_position interference "
+                        "play_up play_down internal_pitch_diameter external_pitch_diameter allowance")
+
+_fitCache = LRUCache(32)
+
+def _resample(data, samples):
+    #periodic linear interpolation of a profile table to samples values, same layout as the tables
+    data = np.asarray(data, dtype=float)
+    n = len(data)
+    if n == samples:
+        return data
+    x = np.arange(1, samples + 1) * (float(n) / samples) - 1
+    return np.interp(x, np.arange(-1, n), np.concatenate((data[-1:], data)))
+
+def _firstContact(internal, external, direction):
+    #for every sample of external, the number of samples along the axis (direction +1 / -1) to the first sample
+    #of internal that is at or below it, 0 where they already interfere
+    n = len(external)
+    steps = np.arange(1, n)
+    ahead = internal[(np.arange(n)[:, None] + direction * steps[None, :]) % n] <= external[:, None]
+    first = np.where(ahead.any(axis=1), ahead.argmax(axis=1) + 1, n)
+    return np.where(internal < external, 0, first)
+
+def _ranges(mask, position, step):
+    #(start, end) positions of the runs of True in the periodic mask
+    if not mask.any():
+        return []
+    if mask.all():
+        return [(position[0] - step, position[-1])]
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1) - 1
+    runs = [[position[s] - step, position[e]] for s, e in zip(starts, ends)]
+    if len(runs) > 1 and mask[0] and mask[-1]: #the run through the end of the pitch continues at the start
+        runs[0][0] = runs.pop()[0] - position[-1]
+    return [tuple(run) for run in runs]
+
+def analyzeFit(internal_data, external_data, pitch, internal_minor, external_minor, samples=None):
+    '''analyzeFit(internal_data, external_data, pitch, internal_minor, external_minor, samples=None): the Fit of an
+    internal thread with profile table internal_data and minor diameter internal_minor and an external thread
+    with external_data and external_minor, same pitch.  The tables are resampled to samples (default: the
+    longer table) values, the axial resolution is pitch / samples.  Memoized.'''
+    key = contentHash(internal_data, external_data, pitch, internal_minor, external_minor, samples)
+    fit = _fitCache.get(key)
+    if fit is not None:
+        return fit
+    if pitch <= 0:
+        raise ValueError("ThreadProfile: pitch must be positive")
+    n = samples or max(len(internal_data), len(external_data))
+    internal = internal_minor / 2. + pitch * _resample(internal_data, n)
+    external = external_minor / 2. + pitch * _resample(external_data, n)
+    step = pitch / n
+    position = np.arange(1, n + 1) * step
+    radial = internal - external
+    lowest = int(radial.argmin())
+    axial_up = _firstContact(internal, external, 1) * step
+    axial_down = _firstContact(internal, external, -1) * step
+    internal_pd, external_pd = 2 * float(np.median(internal)), 2 * float(np.median(external))
+    for array in (position, radial, axial_up, axial_down):
+        array.flags.writeable = False
+    fit = Fit(position, radial, axial_up, axial_down, float(radial[lowest]), float(position[lowest]),
+              _ranges(radial < 0, position, step), float(axial_up.min()), float(axial_down.min()),
+              internal_pd, external_pd, internal_pd - external_pd)
+    _fitCache.put(key, fit)
+    return fit
+
+def presetFit(profile_id, preset, samples=None):
+    '''presetFit(profile_id, preset, samples=None): analyzeFit() of the internal and external thread of the library
+    profile profile_id (e.g. "VThread") with the minor diameters and pitch of preset, a Preset or preset name'''
+    value = profileLibrary.getProfile(profile_id)
+    if value is None:
+        raise ValueError("ThreadProfile: unknown profile \""+str(profile_id)+"\"")
+    if not hasattr(preset, "pitch"):
+        db = presetDatabase(profile_id)
+        if db is None or preset not in db:
+            raise ValueError("ThreadProfile: unknown preset \""+str(preset)+"\" for profile \""+str(profile_id)+"\"")
+        preset = db.find(preset)
+    internal_data, external_data = value
+    return analyzeFit(internal_data, external_data, preset.pitch, preset.internal_minor, preset.external_minor, samples)
+
+def fitSummary(fit):
+    '''fitSummary(fit): the numbers of fit as lines of text'''
+    lines = ["Minimum radial clearance: %.4f mm at %.4f mm" % (fit.min_clearance, fit.min_position),
+             "Axial play: +%.4f / -%.4f mm" % (fit.play_up, fit.play_down),
+             "Pitch diameters: internal %.4f mm, external %.4f mm, allowance %.4f mm"
+             % (fit.internal_pitch_diameter, fit.external_pitch_diameter, fit.allowance)]
+    if fit.interference:
+        lines.append("Interference at " + ", ".join("%.4f - %.4f mm" % run for run in fit.interference))
+    else:
+        lines.append("No interference")
+    return lines
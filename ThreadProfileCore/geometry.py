@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  geometry.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Profile point generation and knot parameterization"""
+
+import math
+import numpy as np
+from .cache import contentHash, LRUCache
+
+#unit circle tables used by sampleProfile(), keyed by (len(data), step)
+_unitCircleCache = {}
+
+def unitCircle(length, step):
+    '''unitCircle(length, step): returns cached (cos, sin) arrays for the sample angles
+    used when taking every step-th element of a profile table with length elements'''
+    key = (length, step)
+    table = _unitCircleCache.get(key)
+    if table is None:
+        #angle is index * step rather than a running sum so there is no accumulated error
+        #first sample is at one step, matching the original behavior (seam position unchanged)
+        count = len(range(0, length, step))
+        alpha = np.arange(1, count + 1) * (math.pi * 2 / length * step)
+        table = (np.cos(alpha), np.sin(alpha))
+        _unitCircleCache[key] = table
+    return table
+
+def sampleProfile(data, minor_diameter, pitch, step=1, starts=1):
+    '''sampleProfile(data, minor_diameter, pitch, step=1, starts=1): returns numpy arrays (x, y) of the
+    profile points, using every step-th element of data for the radius offsets, with starts lobes
+    per revolution (see multiStart())'''
+    radius = minor_diameter / 2 + np.asarray(data, dtype=float)[::step] * pitch
+    if starts > 1:
+        alpha = np.arange(1, len(radius) + 1) * (math.pi * 2 / len(data) * step)
+        return multiStart(alpha, radius, starts)
+    cos, sin = unitCircle(len(data), step)
+    return cos * radius, sin * radius
+
+def multiStart(alpha, radius, starts):
+    '''multiStart(alpha, radius, starts): (x, y) arrays of the polar profile alpha, radius of one thread
+    squeezed into 1 / starts of a revolution and repeated starts times.  This is the section of a thread
+    with that many starts, swept along a helix with a lead of starts * pitch.'''
+    alpha = (np.asarray(alpha) / starts + np.arange(starts)[:, None] * (math.pi * 2 / starts)).ravel()
+    radius = np.tile(radius, starts)
+    return np.cos(alpha) * radius, np.sin(alpha) * radius
+
+def parameterization(pts, a, closed):
+    '''parameterization(pts, a, closed): computes a knot sequence for pts, an (n, 2) or (n, 3) array
+    a (0-1) : parameterization factor
+    a=0 -> Uniform / a=0.5 -> Centripetal / a=1.0 -> Chord-Length'''
+    pts = np.asarray(pts, dtype=float)
+    if closed: # we need to add the first point as the end point
+        pts = np.vstack((pts, pts[:1]))
+    lengths = np.sqrt(((pts[1:] - pts[:-1]) ** 2).sum(axis=1)) ** a
+    return np.concatenate(([0.], np.cumsum(lengths))).tolist()
+
+_knotCache = LRUCache(64)
+
+def knotSequence(pts, a, closed):
+    '''knotSequence(pts, a, closed): parameterization() memoized on the content of pts, returns a tuple'''
+    pts = np.asarray(pts, dtype=float)
+    key = contentHash(pts, a, closed)
+    knots = _knotCache.get(key)
+    if knots is None:
+        knots = tuple(parameterization(pts, a, closed))
+        _knotCache.put(key, knots)
+    return knots
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  helix.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Helical sweep of a profile as a tensor product B-spline surface.  The helical motion (rotation
+about z while rising one pitch per turn) is approximated by a clamped B-spline in v whose poles are
+2x2 xy transforms plus a height.  Applying pole j's transform to every pole of the profile spline
+gives row j of the surface poles, so no sweep is needed to make the thread solid."""
+
+import math
+from collections import namedtuple
+import numpy as np
+
+#transforms is (m, 2, 2), heights is (m,), knots / mults as buildFromPolesMultsKnots() wants them,
+#error is the largest deviation from the exact helical motion per unit radius
+HelixBlend = namedtuple("HelixBlend", "transforms heights knots mults degree error")
+
+def _basisFunctions(t, knots, degree):
+    #(span, N) with N[r] the value of basis function span - degree + r at t
+    count = len(knots) - degree - 1
+    span = np.searchsorted(knots, t, side="right") - 1
+    span = np.clip(span, degree, count - 1)
+    N = np.zeros((degree + 1, len(t)))
+    N[0] = 1.0
+    left = np.zeros((degree + 1, len(t)))
+    right = np.zeros((degree + 1, len(t)))
+    for j in range(1, degree + 1):
+        left[j] = t - knots[span + 1 - j]
+        right[j] = knots[span + j] - t
+        saved = np.zeros(len(t))
+        for r in range(j):
+            temp = N[r] / (right[r + 1] + left[j - r])
+            N[r] = saved + right[r + 1] * temp
+            saved = left[j - r] * temp
+        N[j] = saved
+    return span, N
+
+def bsplineBasis(t, knots, degree):
+    '''bsplineBasis(t, knots, degree): (len(t), len(knots) - degree - 1) collocation matrix for the
+    full (non-periodic) knot vector knots, t = knots[-1] belongs to the last span'''
+    t = np.asarray(t, dtype=float)
+    knots = np.asarray(knots, dtype=float)
+    span, N = _basisFunctions(t, knots, degree)
+    A = np.zeros((len(t), len(knots) - degree - 1))
+    rows = np.arange(len(t))
+    for r in range(degree + 1):
+        A[rows, span - degree + r] = N[r]
+    return A
+
+def _evaluate(t, knots, degree, coefficients):
+    #spline value at t without building the collocation matrix
+    span, N = _basisFunctions(t, knots, degree)
+    return sum(N[r] * coefficients[span - degree + r] for r in range(degree + 1))
+
+def helixBlend(turns, pitch, poles_per_turn=16, degree=3):
+    '''helixBlend(turns, pitch, poles_per_turn=16, degree=3): HelixBlend for turns turns of a right handed
+    helical motion with the given pitch, v runs from 0 to turns.  More poles per turn = more accurate.'''
+    spans = max(int(math.ceil(turns * poles_per_turn - 1e-9)), 1)
+    breaks = np.linspace(0., turns, spans + 1)
+    full = np.concatenate(([0.] * degree, breaks, [turns] * degree))
+    count = spans + degree
+    #heights: B-splines reproduce linear functions exactly with poles at the Greville abscissae
+    greville = np.array([full[j + 1:j + degree + 1].mean() for j in range(count)])
+    heights = greville * pitch
+    #rotations: least squares with the end transforms fixed so the end sections are exact, planar copies.
+    #The transforms are rotations scaled by about the same factor, so they are solved as complex numbers
+    first = 1. + 0.j
+    last = np.exp(2j * math.pi * turns)
+    if count <= 64:
+        flat = _solveRotations(full, degree, np.arange(1, count - 1), np.array([first] + [0.] * (count - 2) + [last]), 0., turns)
+    else:
+        #long threads: away from the ends the solution is the exact rotation times a constant factor,
+        #only the poles near the ends need solving, which keeps this linear in the number of turns
+        mid = count // 2
+        v = np.linspace(full[mid], full[mid + 1], 33)
+        M = bsplineBasis(v, full, degree)
+        w = M.dot(np.exp(2j * math.pi * greville)) * np.exp(-2j * math.pi * v)
+        kappa = np.vdot(w, np.ones(len(v))) / np.vdot(w, w)
+        flat = kappa * np.exp(2j * math.pi * greville)
+        flat[0] = first
+        flat[-1] = last
+        near = 3 * degree
+        flat = _solveRotations(full, degree, np.arange(1, near + 1), flat, 0., full[near + degree + 1])
+        flat = _solveRotations(full, degree, np.arange(count - near - 1, count - 1), flat, full[count - near - 2], turns)
+    check = np.linspace(0., turns, spans * 32 + 1)
+    #the transforms are [[a, -b], [b, a]] = a + bi, so the error for any unit vector is |difference|
+    error = float(np.abs(_evaluate(check, full, degree, flat) - np.exp(2j * math.pi * check)).max())
+    knots = breaks.tolist()
+    mults = [degree + 1] + [1] * (spans - 1) + [degree + 1]
+    transforms = np.empty((count, 2, 2))
+    transforms[:, 0, 0] = transforms[:, 1, 1] = flat.real
+    transforms[:, 1, 0] = flat.imag
+    transforms[:, 0, 1] = -flat.imag
+    return HelixBlend(transforms, heights, knots, mults, degree, error)
+
+def _solveRotations(full, degree, free, coefficients, v0, v1):
+    #least squares for coefficients[free] so the spline matches exp(2 pi i v) on [v0, v1], the others are kept
+    spans = np.count_nonzero(np.diff(full[(full >= v0) & (full <= v1)]) > 0)
+    v = np.linspace(v0, v1, max(spans, 1) * 8 + 1)
+    M = bsplineBasis(v, full, degree)
+    fixed = np.ones(len(coefficients), dtype=bool)
+    fixed[free] = False
+    rhs = np.exp(2j * math.pi * v) - M[:, fixed].dot(coefficients[fixed])
+    result = np.array(coefficients, dtype=complex)
+    if len(free):
+        result[free] = np.linalg.lstsq(M[:, free], rhs, rcond=None)[0]
+    return result
+
+def helicalPoles(profile_poles, blend):
+    '''helicalPoles(profile_poles, blend): (n, m, 3) surface poles for the (n, 2) or (n, 3) poles of a
+    profile spline in the xy plane, u along the profile, v along the helix'''
+    P = np.asarray(profile_poles, dtype=float)[:, :2]
+    xy = np.einsum("mab,nb->nma", blend.transforms, P)
+    z = np.broadcast_to(blend.heights, xy.shape[:2])
+    return np.concatenate((xy, z[..., None]), axis=2)
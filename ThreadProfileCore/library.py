@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  library.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Shared profile and preset library.  ThreadProfile objects reference profile data and preset
+tables by ID and content hash instead of each carrying its own copy of the 720 float tables,
+so document size, load time and memory do not scale with the number of objects."""
+
+import numpy as np
+from .cache import contentHash
+from .presets import flattenPresets
+from . import synth
+
+PROFILE = "profile"
+PRESETS = "presets"
+
+def profileHash(internal_data, external_data):
+    '''profileHash(internal_data, external_data): content hash of a profile'''
+    return contentHash(PROFILE, internal_data, external_data)
+
+def presetsHash(preset_names, presets_data):
+    '''presetsHash(preset_names, presets_data): content hash of a flattened preset table'''
+    return contentHash(PRESETS, list(preset_names), presets_data)
+
+def _readonly(data):
+    if isinstance(data, np.ndarray) and data.dtype == np.float64 and not data.flags.writeable:
+        return data #already read-only, e.g. memory-mapped tables, no need to copy
+    data = np.array(data, dtype=float)
+    data.flags.writeable = False
+    return data
+
+class ProfileLibrary(object):
+    """Registry of profiles, (internal_data, external_data), and preset tables, (preset_names, presets_data),
+    by kind, ID and content hash.  Entries can be registered with a loader so the data is only
+    built the first time it is asked for."""
+
+    def __init__(self):
+        self._byHash = {} #(kind, hash) -> value
+        self._ids = {} #(kind, id) -> hash of the current version
+        self._loaders = {} #(kind, id) -> callable returning the value
+
+    def registerProfile(self, profile_id, internal_data, external_data):
+        '''registerProfile(profile_id, internal_data, external_data): returns the content hash'''
+        value = (_readonly(internal_data), _readonly(external_data))
+        return self._register(PROFILE, profile_id, profileHash(*value), value)
+
+    def registerPresets(self, presets_id, presets):
+        '''registerPresets(presets_id, presets): presets is a list of preset rows, returns the content hash'''
+        preset_names, presets_data = flattenPresets(presets)
+        value = (tuple(preset_names), _readonly(presets_data))
+        return self._register(PRESETS, presets_id, presetsHash(*value), value)
+
+    def registerLoader(self, kind, entry_id, loader):
+        '''registerLoader(kind, entry_id, loader): loader() returns the arguments of registerProfile()
+        (without the ID) for PROFILE or the preset rows for PRESETS'''
+        self._loaders[(kind, entry_id)] = loader
+
+    def _register(self, kind, entry_id, h, value):
+        self._byHash.setdefault((kind, h), value)
+        if entry_id:
+            self._ids[(kind, entry_id)] = h
+        return h
+
+    def _load(self, kind, entry_id):
+        loader = self._loaders.pop((kind, entry_id), None)
+        if loader is None:
+            return
+        if kind == PROFILE:
+            self.registerProfile(entry_id, *loader())
+        else:
+            self.registerPresets(entry_id, loader())
+
+    def currentHash(self, kind, entry_id):
+        '''currentHash(kind, entry_id): hash of the current version of entry_id, None if unknown'''
+        self._load(kind, entry_id)
+        return self._ids.get((kind, entry_id))
+
+    def get(self, kind, entry_id=None, entry_hash=None):
+        '''get(kind, entry_id=None, entry_hash=None): returns the value with entry_hash if known,
+        else the current version of entry_id if entry_hash is empty, else None'''
+        if entry_id:
+            self._load(kind, entry_id)
+        if entry_hash:
+            if (kind, entry_hash) not in self._byHash:
+                #an older version of entry_id may be registered under another ID, e.g. VThreadLegacy
+                self._loadAll(kind)
+            return self._byHash.get((kind, entry_hash))
+        if entry_id and (kind, entry_id) in self._ids:
+            return self._byHash[(kind, self._ids[(kind, entry_id)])]
+        return None
+
+    def getProfile(self, profile_id=None, profile_hash=None):
+        '''getProfile(profile_id=None, profile_hash=None): (internal_data, external_data) or None'''
+        return self.get(PROFILE, profile_id, profile_hash)
+
+    def getPresets(self, presets_id=None, presets_hash=None):
+        '''getPresets(presets_id=None, presets_hash=None): (preset_names, presets_data) or None'''
+        return self.get(PRESETS, presets_id, presets_hash)
+
+    def findProfile(self, internal_data, external_data):
+        '''findProfile(internal_data, external_data): (profile_id, hash) of a registered profile
+        with the same content, (None, None) if there is none'''
+        return self._find(PROFILE, profileHash(internal_data, external_data))
+
+    def findPresets(self, presets):
+        '''findPresets(presets): (presets_id, hash) of a registered preset table with the same content'''
+        return self._find(PRESETS, presetsHash(*flattenPresets(presets)))
+
+    def _loadAll(self, kind):
+        for (k, entry_id) in list(self._loaders):
+            if k == kind:
+                self._load(k, entry_id)
+
+    def _find(self, kind, h):
+        self._loadAll(kind)
+        for (k, entry_id), entry_hash in self._ids.items():
+            if k == kind and entry_hash == h:
+                return entry_id, h
+        return None, None
+
+def _builtinLoader(name):
+    def loader():
+        from . import tables
+        return tables.loadPresets(name)
+    return loader
+
+def _builtinProfileLoader(name):
+    def loader():
+        from . import tables
+        return tables.loadProfile(name)
+    return loader
+
+def _standardLoader():
+    #V thread presets with the metric and UN rows computed after ISO 965-1 / ASME B1.1
+    from . import standards
+    return [list(row) for row in standards.standardPresets()]
+
+def _synthLoader(profile_id):
+    return lambda: synth.synthesizeProfilePair(profile_id)
+
+def _placeholderPresets(profile_id):
+    #presets are needed by ThreadProfile objects, forms without a table only get the placeholder row
+    return lambda: [[profile_id + " presets", 0.0, 0.0, 0.0]]
+
+#the session wide library, with the built-in profiles and preset tables
+profileLibrary = ProfileLibrary()
+for _id, _prefix in (("VThread", "v"), ("Buttress", "buttress"), ("Bottle", "bottle")):
+    profileLibrary.registerLoader(PROFILE, _id, _builtinProfileLoader(_prefix))
+    profileLibrary.registerLoader(PRESETS, _id, _standardLoader if _prefix == "v" else _builtinLoader(_prefix))
+#synthesized from the thread forms in synth.py, 720 samples per pitch
+for _id, (_internal, _external, _prefix) in synth.profiles.items():
+    profileLibrary.registerLoader(PROFILE, _id, _synthLoader(_id))
+    profileLibrary.registerLoader(PRESETS, _id, (_standardLoader if _prefix == "v" else _builtinLoader(_prefix)) if _prefix else _placeholderPresets(_id))
+#the typed-in V preset table used before the standards were computed, only found by the hash stored in older
+#documents, new objects get the computed table of VThread
+profileLibrary.registerLoader(PRESETS, "VThreadLegacy", _builtinLoader("v"))
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  presetdb.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Indexed preset database.  Presets can be looked up by name, nominal diameter, pitch / TPI and
+family, and queried for the nearest match, e.g. presetDatabase("VThread").nearest(10, pitch=1.25)"""
+
+import re
+import bisect
+from collections import namedtuple
+import numpy as np
+from .cache import contentHash, LRUCache
+from .library import profileLibrary
+
+#nominal and pitch are in mm, tpi is threads per inch, index is the row in preset_names / presets_data
+Preset = namedtuple("Preset", "name family nominal pitch tpi external_minor internal_minor index")
+
+_metricRe = re.compile(r"^M(\d+(?:\.\d+)?)\b")
+#1/4 in, 1 1/8 in, 2-1/2 in, 2 in, and the buttress form 1 1/4-8 (no "in")
+_inchRe = re.compile(r"^(?:(\d+)[ -])?(\d+)(?:/(\d+))?(?: in|(?=-\d))")
+_bottleRe = re.compile(r"^(\d+)-SP\d+")
+
+def parseNominal(name):
+    '''parseNominal(name): nominal diameter in mm from a preset name, None if there is none'''
+    m = _metricRe.match(name)
+    if m:
+        return float(m.group(1))
+    m = _bottleRe.match(name)
+    if m:
+        return float(m.group(1))
+    m = _inchRe.match(name)
+    if m:
+        whole, num, den = m.groups()
+        inches = float(num) / float(den) if den else float(num)
+        if whole:
+            inches += float(whole)
+        return inches * 25.4
+    return None
+
+def parseFamily(name, presets_id=""):
+    '''parseFamily(name, presets_id=""): family of a preset, e.g. "Metric Coarse", "UNC", "Buttress"'''
+    if presets_id in ("Buttress", "Bottle"):
+        return presets_id
+    for token, family in (("Coarse", "Metric Coarse"), ("Fine", "Metric Fine"), ("UNC", "UNC"), ("UNF", "UNF"), ("NHR", "NHR")):
+        if token in name:
+            return family
+    return presets_id or "Custom"
+
+class PresetDatabase(object):
+    """Presets from one flattened preset table, indexed by name, family, nominal diameter and pitch.
+    Row 0 of a preset table is a placeholder, it can be found by name but is not returned by queries."""
+
+    def __init__(self, preset_names, presets_data, presets_id=""):
+        self.presets_id = presets_id
+        self.presets = []
+        self._byName = {}
+        self._byFamily = {}
+        for idx, name in enumerate(preset_names):
+            pitch = float(presets_data[idx*3])
+            preset = Preset(name, parseFamily(name, presets_id) if idx else None, parseNominal(name), pitch,
+                            25.4 / pitch if pitch else 0.0, float(presets_data[idx*3+1]), float(presets_data[idx*3+2]), idx)
+            self._byName.setdefault(name, preset)
+            self.presets.append(preset)
+            if idx:
+                self._byFamily.setdefault(preset.family, []).append(preset)
+        queryable = [p for p in self.presets[1:] if p.nominal is not None]
+        queryable.sort(key=lambda p: (p.nominal, p.pitch))
+        self._sorted = queryable
+        self._nominals = [p.nominal for p in queryable]
+        self._nominalArray = np.array(self._nominals)
+        self._pitchArray = np.array([p.pitch for p in queryable])
+        self._tpiArray = np.array([p.tpi for p in queryable])
+        self._familyArray = np.array([p.family for p in queryable], dtype=object)
+
+    def __len__(self):
+        return len(self.presets)
+
+    def __contains__(self, name):
+        return name in self._byName
+
+    def find(self, name):
+        '''find(name): the preset with this name, None if there is none'''
+        return self._byName.get(name)
+
+    def index(self, name):
+        '''index(name): row of the preset with this name, -1 if there is none'''
+        preset = self._byName.get(name)
+        return preset.index if preset else -1
+
+    def families(self):
+        return sorted(self._byFamily)
+
+    def byFamily(self, family):
+        return list(self._byFamily.get(family, []))
+
+    def byNominal(self, nominal, tolerance=1e-6):
+        '''byNominal(nominal, tolerance=1e-6): presets with this nominal diameter (mm), sorted by pitch'''
+        lo = bisect.bisect_left(self._nominals, nominal - tolerance)
+        hi = bisect.bisect_right(self._nominals, nominal + tolerance)
+        return self._sorted[lo:hi]
+
+    def byPitch(self, pitch, tolerance=1e-3):
+        '''byPitch(pitch, tolerance=1e-3): presets with this pitch (mm), sorted by nominal diameter'''
+        return [self._sorted[ii] for ii in np.flatnonzero(np.abs(self._pitchArray - pitch) <= tolerance)]
+
+    def byTpi(self, tpi, tolerance=1e-2):
+        '''byTpi(tpi, tolerance=1e-2): presets with this many threads per inch, sorted by nominal diameter'''
+        return [self._sorted[ii] for ii in np.flatnonzero(np.abs(self._tpiArray - tpi) <= tolerance)]
+
+    def search(self, text):
+        '''search(text): presets whose name contains text, case insensitive'''
+        text = text.lower()
+        return [p for p in self.presets[1:] if text in p.name.lower()]
+
+    def nearest(self, nominal, pitch=None, tpi=None, family=None):
+        '''nearest(nominal, pitch=None, tpi=None, family=None): the preset closest to nominal (mm),
+        among those the pitch (or tpi) closest to the one given, None if there are no candidates'''
+        if tpi and not pitch:
+            pitch = 25.4 / tpi
+        mask = np.ones(len(self._sorted), dtype=bool)
+        if family:
+            mask &= self._familyArray == family
+        if not mask.any():
+            return None
+        nominalError = np.where(mask, np.abs(self._nominalArray - nominal), np.inf)
+        pitchError = np.abs(self._pitchArray - pitch) if pitch else np.zeros(len(self._sorted))
+        order = np.lexsort((pitchError, np.round(nominalError, 9)))
+        return self._sorted[order[0]]
+
+_databases = LRUCache(32)
+
+def presetDatabase(presets_id=None, presets_hash=None, preset_names=None, presets_data=None):
+    '''presetDatabase(presets_id=None, presets_hash=None, preset_names=None, presets_data=None):
+    the memoized PresetDatabase for a library preset table, or for the given embedded tables'''
+    if preset_names is None:
+        key = (presets_id, presets_hash)
+    else:
+        key = contentHash(list(preset_names), presets_data)
+    db = _databases.get(key)
+    if db is None:
+        if preset_names is None:
+            value = profileLibrary.getPresets(presets_id, presets_hash)
+            if value is None:
+                return None
+            preset_names, presets_data = value
+        db = PresetDatabase(preset_names, presets_data, presets_id or "")
+        _databases.put(key, db)
+    return db
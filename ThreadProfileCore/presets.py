@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  presets.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Preset rows and the helpers used to compute them.  A preset row is
+[name, pitch, external minor diameter, internal minor diameter]"""
+
+def buttressPreset(txt, tpi, nominal):
+    '''buttressPreset(txt, tpi, nominal): ANSI B1.9 class 2 buttress preset row, nominal in inches'''
+    pitch = 25.4/tpi
+    length_of_engagement = 10 * pitch #10 * pitch, longer engagements should have more tolerance
+    nom = nominal * 25.4
+    minor = nom - 0.66271 * pitch
+    tolerance = 0.002 * (nom)**(1/3) + .00278 * length_of_engagement**(1/2) + 0.00854 * pitch**(1/2)
+    return[txt, pitch, minor - tolerance, minor + tolerance]
+
+def bottlePreset(txt, minor, major, tpi):
+    '''bottlePreset(txt, minor, major, tpi): SP4xx (M) bottle preset row, internal minor is .25 mm larger'''
+    pitch = 25.4/tpi
+    offset = .25 #.25 mm
+    external = minor
+    internal = minor + offset
+    return[txt, pitch, external, internal]
+
+def flattenPresets(presets):
+    '''flattenPresets(presets): returns (preset_names, presets_data) as stored in the
+    ThreadProfile properties of the same names.  presets_data holds 3 floats per preset.
+    Metric names ("M" in name) get the pitch appended since they are not unique otherwise.'''
+    presets_data = []
+    preset_names = []
+    for row in presets:
+        presets_data.extend(row[1:]) #strip out string, only include pitch and both minor diameters
+        preset_name = row[0]
+        if "M" in preset_name:
+            preset_name += " " + str(row[1])
+        preset_names.append(preset_name)
+    return preset_names, presets_data
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  spectral.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Fourier representation of profile tables.  A profile is a periodic function of the angle, so it
+can be kept as its first few Fourier coefficients and evaluated at any number of samples, without
+the integer strides of Quality and without aliasing.  Dropping harmonics is a low-pass filter."""
+
+from collections import namedtuple
+import numpy as np
+from .cache import contentHash, LRUCache
+
+#coefficients: rfft coefficients 0 .. harmonics of the table, length: number of samples in the table,
+#error: largest difference between the table and the truncated series at the table samples
+Spectrum = namedtuple("Spectrum", "coefficients length error")
+
+_spectrumCache = LRUCache(64)
+
+def _truncationError(full, length, harmonics):
+    kept = np.zeros_like(full)
+    kept[:harmonics + 1] = full[:harmonics + 1]
+    return kept, np.fft.irfft(kept, length)
+
+def profileSpectrum(data, tolerance=None, harmonics=None):
+    '''profileSpectrum(data, tolerance=None, harmonics=None): Spectrum of the profile table data with the
+    fewest harmonics that reproduce data within tolerance (pitch units), at most harmonics of them.
+    With neither all harmonics are kept.  Memoized on the content of data.'''
+    key = contentHash(data, tolerance, harmonics)
+    spectrum = _spectrumCache.get(key)
+    if spectrum is not None:
+        return spectrum
+    data = np.asarray(data, dtype=float)
+    length = len(data)
+    full = np.fft.rfft(data)
+    top = len(full) - 1 if harmonics is None else max(0, min(int(harmonics), len(full) - 1))
+    if tolerance is not None:
+        #the error is not strictly monotone in the number of harmonics, bisect for a small count that meets it
+        low, high = 0, top
+        while low < high:
+            mid = (low + high) // 2
+            if np.abs(_truncationError(full, length, mid)[1] - data).max() <= tolerance:
+                high = mid
+            else:
+                low = mid + 1
+        top = high
+    error = float(np.abs(_truncationError(full, length, top)[1] - data).max())
+    spectrum = Spectrum(full[:top + 1].copy(), length, error)
+    spectrum.coefficients.flags.writeable = False
+    _spectrumCache.put(key, spectrum)
+    return spectrum
+
+def evaluateSpectrum(spectrum, samples):
+    '''evaluateSpectrum(spectrum, samples): the profile at samples evenly spaced points in the layout of the
+    tables, value k at (k + 1) / samples of the period.  Harmonics above samples / 2 are dropped, so
+    resampling does not alias.'''
+    n = spectrum.length
+    keep = min(len(spectrum.coefficients), samples // 2 + 1)
+    j = np.arange(keep)
+    #table sample k sits at (k + 1) / n of the period, so shift by one new sample minus one old one
+    shift = np.exp(2j * np.pi * j * (1. / samples - 1. / n))
+    c = np.zeros(samples // 2 + 1, dtype=complex)
+    c[:keep] = spectrum.coefficients[:keep] * shift
+    return np.fft.irfft(c, samples) * (samples / float(n))
+
+def spectrumSize(spectrum):
+    '''spectrumSize(spectrum): number of floats needed to store spectrum, 2 per harmonic plus the mean'''
+    return 2 * len(spectrum.coefficients) - 1
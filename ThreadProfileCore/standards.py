@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  standards.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Thread limits from the tolerance formulas of the standards, computed locally: ISO 965-1 metric,
+ASME B1.1 unified inch (UN) and ANSI B1.9 buttress.  All functions take numpy arrays of nominal
+diameters and pitches in mm, so a whole size range is one call, and return limits in mm.
+The preset tables of the V thread profile are generated from these (see standardPresets()).
+
+The minor diameters of the presets position the profile data, whose shape is fixed, so a tolerance
+on the pitch diameter moves the minor diameter by the same amount (see presetMinors()).  These are
+not the minor diameter limits of the standards: the zero line of the V profile data, internal and
+external, is the basic minor diameter D1 (the external data dips 0.0722 P below it for the rounded
+root), so its minor diameter is the pitch diameter less 0.433013 P."""
+
+import re
+from collections import namedtuple
+import numpy as np
+from .cache import contentHash, LRUCache
+from .presetdb import parseNominal
+from .tables import loadPresets
+
+#limits in mm, arrays with one element per size, engagement is the length of engagement used for the tolerances
+ThreadLimits = namedtuple("ThreadLimits", "standard nominal pitch engagement external_major_max external_major_min "
+                          "external_pitch_max external_pitch_min external_minor_max internal_minor_min internal_minor_max "
+                          "internal_pitch_min internal_pitch_max internal_major_min")
+
+#basic dimensions in pitches below the nominal diameter, ISO 68-1 / ASME B1.1 (H = sqrt(3) / 2 P)
+PITCH_DIAMETER = 0.649519   #3/4 H
+MINOR_DIAMETER = 1.082532   #5/4 H, internal thread D1
+ROOT_DIAMETER = 1.226869    #17/12 H, ISO 965 external thread root d3 (root radius H / 6)
+UNR_ROOT_DIAMETER = 1.190716   #ASME B1.1 UNR external thread root (root radius 0.144 P)
+#buttress: minor diameter of the buttress profile data, the basic pitch diameter of ANSI B1.9 is D - 0.6 P
+BUTTRESS_MINOR = 0.66271
+BUTTRESS_PITCH = 0.6
+
+_limitsCache = LRUCache(64)
+
+def _memoized(name, function, *args):
+    key = contentHash(name, *args)
+    limits = _limitsCache.get(key)
+    if limits is None:
+        limits = function(*args)
+        _limitsCache.put(key, limits)
+    return limits
+
+def _arrays(*values):
+    return np.broadcast_arrays(*[np.asarray(v, dtype=float) for v in values])
+
+_classRe = re.compile(r"^(\d)([A-Za-z])(?:(\d)([A-Za-z]))?$")
+
+def parseClass(tolerance_class):
+    '''parseClass(tolerance_class): ISO 965 tolerance class, e.g. "6g" or "5g6g", as (pitch grade, position,
+    crest grade, crest position); the crest tolerance is the pitch tolerance if only one is given'''
+    m = _classRe.match(tolerance_class.strip())
+    if not m:
+        raise ValueError("ThreadProfile: invalid tolerance class \""+tolerance_class+"\", use e.g. 6g, 6H or 5g6g")
+    grade, position, crest, crest_position = m.groups()
+    if crest is None:
+        crest, crest_position = grade, position
+    if position != crest_position:
+        raise ValueError("ThreadProfile: tolerance class \""+tolerance_class+"\" mixes tolerance positions")
+    return int(grade), position, int(crest), crest_position
+
+###################################################################################
+# ISO 965-1 metric
+
+#limits of the diameter ranges of ISO 965-1, the tolerances use the geometric mean of the range
+_isoRanges = np.array([0.99, 1.4, 2.8, 5.6, 11.2, 22.4, 45., 90., 180., 355., 600.])
+#tolerance grade factors relative to grade 6
+_isoGrades = {3: 0.5, 4: 0.63, 5: 0.8, 6: 1., 7: 1.25, 8: 1.6, 9: 2.}
+#fundamental deviations in um, external (es, negative) and internal (EI) thread
+_isoDeviations = {"e": lambda p: -(50 + 11 * p), "f": lambda p: -(30 + 11 * p), "g": lambda p: -(15 + 11 * p),
+                  "h": lambda p: 0 * p, "G": lambda p: 15 + 11 * p, "H": lambda p: 0 * p}
+
+def isoEngagement(d, pitch):
+    '''isoEngagement(d, pitch): (lower, upper) limits of the normal (N) length of engagement in mm, shorter is
+    S and longer is L'''
+    d, pitch = _arrays(d, pitch)
+    return 2.24 * pitch * d ** 0.2, 6.7 * pitch * d ** 0.2
+
+def _isoMean(d):
+    #geometric mean of the ISO 965 diameter range of d
+    k = np.clip(np.searchsorted(_isoRanges, d, side="right"), 1, len(_isoRanges) - 1)
+    return np.sqrt(_isoRanges[k - 1] * _isoRanges[k])
+
+def _grade(grade, shift, grades):
+    #grade moved one finer (S) or coarser (L) for the length of engagement, limited to the grades there are
+    return np.clip(grade + shift, min(grades), max(grades))
+
+def _isoLimits(d, pitch, internal, external, engagement):
+    d, pitch = _arrays(d, pitch)
+    dm = _isoMean(d)
+    lower, upper = isoEngagement(d, pitch)
+    if isinstance(engagement, str):
+        shift = {"S": -1, "N": 0, "L": 1}[engagement.upper()]
+        length = {"S": lower, "N": (lower + upper) / 2, "L": upper}[engagement.upper()]
+    else:
+        length = np.broadcast_to(np.asarray(engagement, dtype=float), d.shape)
+        shift = np.where(length < lower, -1, np.where(length > upper, 1, 0))
+    ext_grade, ext_position, ext_crest, _ = parseClass(external)
+    int_grade, int_position, int_crest, _ = parseClass(internal)
+    if ext_position not in "efgh" or int_position not in "GH":
+        raise ValueError("ThreadProfile: ISO 965 tolerance positions are e, f, g, h (external) and G, H (internal)")
+    factor = lambda grade: np.vectorize(_isoGrades.get)(grade)
+    #tolerances in um for grade 6
+    td2 = 90 * pitch ** 0.4 * dm ** 0.1
+    td = 180 * pitch ** (2 / 3.) - 3.15 / np.sqrt(pitch)
+    tD1 = np.where(pitch < 1, 433 * pitch - 190 * pitch ** 1.22, 230 * pitch ** 0.7)
+    es = _isoDeviations[ext_position](pitch) / 1000.
+    ei = _isoDeviations[int_position](pitch) / 1000.
+    ext_pitch_tol = td2 * factor(_grade(ext_grade, shift, (3, 9))) / 1000.
+    int_pitch_tol = 1.32 * td2 * factor(_grade(int_grade, shift, (4, 8))) / 1000.
+    major_tol = td * factor(_grade(ext_crest, 0, (4, 8))) / 1000.
+    minor_tol = tD1 * factor(_grade(int_crest, 0, (4, 8))) / 1000.
+    d2 = d - PITCH_DIAMETER * pitch
+    d1 = d - MINOR_DIAMETER * pitch
+    return ThreadLimits("ISO 965", d, pitch, length, d + es, d + es - major_tol, d2 + es, d2 + es - ext_pitch_tol,
+                        d - ROOT_DIAMETER * pitch + es, d1 + ei, d1 + ei + minor_tol, d2 + ei, d2 + ei + int_pitch_tol, d + ei)
+
+def isoMetricLimits(d, pitch, internal="6H", external="6h", engagement="N"):
+    '''isoMetricLimits(d, pitch, internal="6H", external="6h", engagement="N"): ThreadLimits after ISO 965-1 for
+    nominal diameters d and pitches in mm.  internal and external are tolerance classes (G, H and e, f, g, h
+    positions, grades 4 - 8 and 3 - 9).  engagement is "S", "N" or "L", or lengths in mm, which are classified
+    with isoEngagement(); S and L take the pitch diameter tolerance one grade finer / coarser, as the
+    recommended classes of ISO 965-1 do.  6H / 6h is the basic profile at maximum material.  Memoized.'''
+    return _memoized("iso", _isoLimits, d, pitch, internal, external, engagement)
+
+###################################################################################
+# ASME B1.1 unified inch
+
+#pitch diameter tolerance relative to class 2A
+_unFactors = {"1A": 1.5, "2A": 1., "3A": 0.75, "1B": 1.95, "2B": 1.3, "3B": 0.975}
+
+def _unLimits(d, pitch, internal, external, engagement):
+    d, pitch = _arrays(d, pitch)
+    if external.upper() not in _unFactors or internal.upper() not in _unFactors or external[-1:].upper() != "A" or internal[-1:].upper() != "B":
+        raise ValueError("ThreadProfile: unified thread classes are 1A, 2A, 3A (external) and 1B, 2B, 3B (internal)")
+    external, internal = external.upper(), internal.upper()
+    #the formulas are in inches
+    D, P = d / 25.4, pitch / 25.4
+    LE = 9 * P if engagement is None else np.broadcast_to(np.asarray(engagement, dtype=float), d.shape) / 25.4
+    td2 = 0.0015 * D ** (1 / 3.) + 0.0015 * np.sqrt(LE) + 0.015 * P ** (2 / 3.)
+    allowance = 0.3 * td2 if external != "3A" else 0 * td2
+    major_tol = (0.09 if external == "1A" else 0.06) * P ** (2 / 3.)
+    minor_tol = np.clip(0.05 * P ** (2 / 3.) + 0.03 * P / D - 0.002, 0.12 * P, 0.25 * P - 0.4 * P * P)
+    E = D - PITCH_DIAMETER * P
+    D1 = D - MINOR_DIAMETER * P
+    inches = (D - allowance, D - allowance - major_tol, E - allowance, E - allowance - _unFactors[external] * td2,
+              D - UNR_ROOT_DIAMETER * P - allowance, D1, D1 + minor_tol, E, E + _unFactors[internal] * td2, D)
+    return ThreadLimits("ASME B1.1", d, pitch, LE * 25.4, *[value * 25.4 for value in inches])
+
+def unifiedLimits(d, pitch, internal="3B", external="3A", engagement=None):
+    '''unifiedLimits(d, pitch, internal="3B", external="3A", engagement=None): ThreadLimits after ASME B1.1 for
+    nominal diameters d and pitches (25.4 / TPI) in mm.  Classes 1A, 2A, 3A and 1B, 2B, 3B; engagement is the
+    length of engagement in mm, default 9 pitches as in the standard's tables.  1A and 2A have the allowance
+    of 0.3 times the class 2A pitch diameter tolerance.  3B / 3A is the basic profile at maximum material.
+    Memoized.'''
+    return _memoized("un", _unLimits, d, pitch, internal, external, engagement)
+
+###################################################################################
+# ANSI B1.9 buttress
+
+#pitch diameter tolerance relative to class 2
+_buttressFactors = {"1": 1.5, "2": 1., "3": 0.667}
+
+def _buttressLimits(d, pitch, internal, external, engagement):
+    d, pitch = _arrays(d, pitch)
+    internal, external = str(internal).rstrip("AB"), str(external).rstrip("AB")
+    if internal not in _buttressFactors or external not in _buttressFactors:
+        raise ValueError("ThreadProfile: buttress thread classes are 1, 2 and 3")
+    D, P = d / 25.4, pitch / 25.4
+    LE = 10 * P if engagement is None else np.broadcast_to(np.asarray(engagement, dtype=float), d.shape) / 25.4
+    td2 = 0.002 * D ** (1 / 3.) + 0.00278 * np.sqrt(LE) + 0.00854 * np.sqrt(P)
+    allowance = 0.3 * td2 if external != "3" else 0 * td2
+    E = D - BUTTRESS_PITCH * P
+    minor = D - BUTTRESS_MINOR * P
+    ext_tol, int_tol = _buttressFactors[external] * td2, _buttressFactors[internal] * td2
+    inches = (D - allowance, D - allowance - ext_tol, E - allowance, E - allowance - ext_tol, minor - allowance,
+              minor, minor + int_tol, E, E + int_tol, D)
+    return ThreadLimits("ANSI B1.9", d, pitch, LE * 25.4, *[value * 25.4 for value in inches])
+
+def buttressLimits(d, pitch, internal="2", external="2", engagement=None):
+    '''buttressLimits(d, pitch, internal="2", external="2", engagement=None): ThreadLimits after ANSI B1.9 (7 / 45
+    degree) for nominal diameters d and pitches in mm, classes 1, 2 and 3 (an A / B suffix is ignored).  engagement
+    is the length of engagement in mm, default 10 pitches.  The minor diameters are those of the buttress profile
+    data, D - 0.66271 P at maximum material.  Memoized.'''
+    return _memoized("buttress", _buttressLimits, d, pitch, internal, external, engagement)
+
+###################################################################################
+# Presets
+
+#pitch diameter minus the minor diameter of the profile data, in pitches: D1 for the V data, D - 0.66271 P for buttress
+_profileMinors = {"ISO 965": MINOR_DIAMETER - PITCH_DIAMETER, "ASME B1.1": MINOR_DIAMETER - PITCH_DIAMETER,
+                  "ANSI B1.9": BUTTRESS_MINOR - BUTTRESS_PITCH}
+
+def presetMinors(limits, material="max"):
+    '''presetMinors(limits, material="max"): (external_minor, internal_minor) arrays, the MinorDiameter that puts
+    the profile data at the pitch diameter limits of ThreadLimits, at maximum material ("max"), the middle of
+    the pitch diameter tolerance ("mid") or minimum material ("min").  For 6H / 6h and 3B / 3A at maximum
+    material both are the basic minor diameter D1 = D - 1.082532 P.'''
+    k = {"max": 0., "mid": 0.5, "min": 1.}[material]
+    offset = _profileMinors[limits.standard] * limits.pitch
+    return (limits.external_pitch_max - k * (limits.external_pitch_max - limits.external_pitch_min) - offset,
+            limits.internal_pitch_min + k * (limits.internal_pitch_max - limits.internal_pitch_min) - offset)
+
+_tpiRe = re.compile(r"-(\d+)( 1/2)? UN")
+
+def _tpi(name):
+    #threads per inch from a UN preset name, "2 in-4 1/2 UNC" -> 4.5, None if it is no UN preset
+    m = _tpiRe.search(name)
+    return None if m is None else float(m.group(1)) + (0.5 if m.group(2) else 0.)
+
+def standardPresets(metric=("6H", "6h"), unified=("3B", "3A"), engagement="N", material="max"):
+    '''standardPresets(metric=("6H", "6h"), unified=("3B", "3A"), engagement="N", material="max"): the V thread preset
+    rows [name, pitch, external minor, internal minor] with the metric rows computed by isoMetricLimits() and the
+    UNC / UNF rows by unifiedLimits() for the (internal, external) classes, default the basic profile.  engagement
+    is S, N or L (UN always uses 9 pitches) or a length in mm.  The sizes come from the built-in table, other rows
+    are kept as they are.  Metric values are rounded to 0.001 mm, UN values to 0.0001 in as in the standards'
+    tables.  Memoized.'''
+    key = contentHash("presets", metric, unified, engagement, material)
+    rows = _limitsCache.get(key)
+    if rows is not None:
+        return rows
+    rows = [list(row) for row in loadPresets("v")]
+    sizes = [ii for ii, row in enumerate(rows) if row[0].startswith("M")]
+    if sizes:
+        limits = isoMetricLimits([parseNominal(rows[ii][0]) for ii in sizes], [rows[ii][1] for ii in sizes],
+                                 metric[0], metric[1], engagement)
+        for ii, ext, inner in zip(sizes, *[np.round(m, 3).tolist() for m in presetMinors(limits, material)]):
+            rows[ii][2:] = [ext, inner]
+    sizes = [ii for ii, row in enumerate(rows) if _tpi(row[0])]
+    if sizes:
+        #the pitch comes from the name, some rows of the old table had the pitch of another size
+        pitch = 25.4 / np.array([_tpi(rows[ii][0]) for ii in sizes])
+        limits = unifiedLimits([parseNominal(rows[ii][0]) for ii in sizes], pitch, unified[0], unified[1],
+                               None if isinstance(engagement, str) else engagement)
+        minors = [(np.round(m / 25.4, 4) * 25.4).tolist() for m in presetMinors(limits, material)]
+        for ii, p, ext, inner in zip(sizes, pitch.tolist(), *minors):
+            rows[ii][1:] = [p, ext, inner]
+    _limitsCache.put(key, rows)
+    return rows
+
+def limitsSummary(limits, index=0):
+    '''limitsSummary(limits, index=0): the limits of size index of ThreadLimits as lines of text'''
+    value = lambda field: float(np.ravel(getattr(limits, field))[index])
+    return ["%s, nominal %.3f mm, pitch %.4f mm, length of engagement %.2f mm" % (limits.standard, value("nominal"), value("pitch"), value("engagement")),
+            "External major diameter: %.4f - %.4f mm" % (value("external_major_min"), value("external_major_max")),
+            "External pitch diameter: %.4f - %.4f mm" % (value("external_pitch_min"), value("external_pitch_max")),
+            "External minor diameter: max %.4f mm" % value("external_minor_max"),
+            "Internal minor diameter: %.4f - %.4f mm" % (value("internal_minor_min"), value("internal_minor_max")),
+            "Internal pitch diameter: %.4f - %.4f mm" % (value("internal_pitch_min"), value("internal_pitch_max")),
+            "Internal major diameter: min %.4f mm" % value("internal_major_min")]
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  synth.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Thread profile synthesis.  A profile table (radius above the minor radius in pitch units, one
+value per 1/n of a pitch, as in Resources/profiles) is computed from the thread form: flank angles,
+crest and root flat widths, crest and root radii and thread depth, all in pitch units.  Tables are
+made at any resolution on demand and memoized, e.g. synthesizeProfile("ISO68 external", 720)"""
+
+import math
+from collections import namedtuple
+import numpy as np
+from .cache import LRUCache
+
+#flank1 / flank2: angles of the rising / falling flank from the radial direction in degrees, depth: from
+#root to crest, crest / root: flat widths, crest_radius / root_radius: rounding of the crest (peak) and root
+#(valley) corners, offset: radius of the root line, phase: axial position of the middle of the root.
+#Forms are seen from the thread surface outwards: for an internal thread the crest is at the major
+#diameter, so it is the nut's root.
+ThreadForm = namedtuple("ThreadForm", "name flank1 flank2 depth crest root crest_radius root_radius offset phase")
+
+def makeForm(name="Custom", flank1=30., flank2=30., depth=None, crest=0., root=None, crest_radius=0., root_radius=0., offset=0., phase=0.):
+    '''makeForm(name="Custom", flank1=30., flank2=30., depth=None, crest=0., root=None, crest_radius=0., root_radius=0.,
+    offset=0., phase=0.): a ThreadForm, the flanks and flats must add up to one pitch so one of depth, crest
+    and root can be left out (None) and is computed.  Raises ValueError if the form does not fit in a pitch.'''
+    slope = math.tan(math.radians(flank1)) + math.tan(math.radians(flank2))
+    if [depth, crest, root].count(None) > 1:
+        raise ValueError("ThreadProfile: thread form "+name+" needs two of depth, crest and root")
+    if depth is None:
+        depth = (1. - crest - root) / slope
+    elif crest is None:
+        crest = 1. - root - depth * slope
+    elif root is None:
+        root = 1. - crest - depth * slope
+    if depth <= 0 or root < -1e-12 or crest < -1e-12 or abs(crest + root + depth * slope - 1.) > 1e-6:
+        raise ValueError("ThreadProfile: thread form "+name+" does not fit in one pitch")
+    return ThreadForm(name, float(flank1), float(flank2), float(depth), max(float(crest), 0.), max(float(root), 0.),
+                      float(crest_radius), float(root_radius), float(offset), float(phase))
+
+H = math.sqrt(3.) / 2. #height of the fundamental triangle of 60 degree threads
+
+#built-in forms, the ISO 68 forms reproduce the V tables in Resources/profiles, the buttress forms the
+#buttress tables within 0.0003 P
+forms = dict((f.name, f) for f in (
+    #ISO 68-1 basic profile, external with the rounded root R = H/6 of ISO 965 (minor d3 = d1 - H/6)
+    makeForm("ISO68 external", 30, 30, depth=7*H/8, crest=1/8., root=0., root_radius=H/6, offset=-H/4, phase=1/8.),
+    makeForm("ISO68 internal", 30, 30, depth=3*H/4, crest=0., root=1/4., crest_radius=H/12, phase=1/8.),
+    #ASME B1.1 UN basic profile with the flat root, UNR is the ISO external form
+    makeForm("UN external", 30, 30, depth=5*H/8, crest=1/8., root=1/4.),
+    makeForm("UN internal", 30, 30, depth=5*H/8, crest=1/8., root=1/4.),
+    #ASME B1.9 45/7 buttress, h = 0.6627 P, flat 0.1631 P at the root of the external thread and at the major
+    #diameter of the internal one.  Sharp corners as the built-in tables, the standard allows a 0.0714 P root radius
+    makeForm("Buttress external", 45, 7, depth=0.66271, crest=None, root=0.1631, phase=0.16295),
+    makeForm("Buttress internal", 45, 7, depth=0.66271, crest=0.1631, root=None, phase=0.12775),
+    #SPI SP400 bottle finish, 10 / 45 degree flanks with rounded crest and root, within 0.011 P of the built-in table
+    makeForm("SP400 external", 10, 45, depth=0.284, crest=0.24, root=None, crest_radius=0.09, root_radius=0.07, phase=0.835),
+    makeForm("SP400 internal", 10, 45, depth=0.284, crest=0.24, root=None, crest_radius=0.09, root_radius=0.07, phase=0.835),
+    #ASME B1.5 general purpose ACME, 29 degrees, h = 0.5 P, flats 0.3707 P
+    makeForm("ACME external", 14.5, 14.5, depth=0.5, crest=0.3707, root=None),
+    makeForm("ACME internal", 14.5, 14.5, depth=0.5, crest=0.3707, root=None),
+    #ISO 2904 trapezoidal, 30 degrees, H1 = 0.5 P
+    makeForm("Trapezoidal external", 15, 15, depth=0.5, crest=0.366, root=None),
+    makeForm("Trapezoidal internal", 15, 15, depth=0.5, crest=0.366, root=None),
+))
+
+#profile ID in the shared library: (internal form, external form, built-in presets to use or None)
+profiles = {
+    "ISO68": ("ISO68 internal", "ISO68 external", "v"),
+    "UN": ("UN internal", "UN external", "v"),
+    "Buttress45": ("Buttress internal", "Buttress external", "buttress"),
+    "SP400": ("SP400 internal", "SP400 external", "bottle"),
+    "ACME": ("ACME internal", "ACME external", None),
+    "Trapezoidal": ("Trapezoidal internal", "Trapezoidal external", None),
+}
+
+def _fillet(corner, before, after, radius):
+    #(start z, end z, centre z, centre r, radius, sign) of the arc rounding corner, sign -1 = lower arc (root)
+    a = (before - corner) / np.hypot(*(before - corner))
+    b = (after - corner) / np.hypot(*(after - corner))
+    half = math.acos(max(-1., min(1., float(a.dot(b))))) / 2.
+    reach = radius / math.tan(half)
+    centre = corner + (a + b) / np.hypot(*(a + b)) * radius / math.sin(half)
+    start, end = corner + a * reach, corner + b * reach
+    return start[0], end[0], centre[0], centre[1], radius, -1. if centre[1] > corner[1] else 1., reach
+
+def _corners(form):
+    #sharp profile corners from the start of the root flat, with the rounding radius of each
+    d = form.depth
+    rise = d * math.tan(math.radians(form.flank1))
+    points = [(0., 0., form.root_radius), (form.root, 0., form.root_radius),
+              (form.root + rise, d, form.crest_radius), (form.root + rise + form.crest, d, form.crest_radius)]
+    merged = []
+    for z, r, radius in points: #zero width flats give a single corner
+        if merged and abs(merged[-1][0] - z) < 1e-12 and merged[-1][1] == r:
+            continue
+        merged.append((z, r, radius))
+    if len(merged) > 1 and abs(merged[-1][0] - 1.) < 1e-12:
+        merged.pop()
+    return merged
+
+def formTable(form, samples=720):
+    '''formTable(form, samples=720): read-only array of the profile radius above the minor radius in
+    pitch units at z = (k + 1) / samples pitches, k = 0 .. samples - 1, the layout of the built-in tables'''
+    key = (tuple(form), samples)
+    table = _tableCache.get(key)
+    if table is not None:
+        return table
+    corners = _corners(form)
+    count = len(corners)
+    xy = np.array([(z, r) for z, r, radius in corners])
+    #three periods so every corner has neighbours and the arcs may cross the period boundary
+    ext = np.vstack((xy - (1., 0.), xy, xy + (1., 0.)))
+    u = ((np.arange(1, samples + 1) / float(samples) - form.phase + form.root / 2.) % 1.)
+    r = np.interp(u, np.append(ext[:, 0], 2.), np.append(ext[:, 1], ext[0, 1]))
+    reaches = []
+    for ii, (z, rr, radius) in enumerate(corners):
+        if radius <= 0:
+            reaches.append(0.)
+            continue
+        start, end, cz, cr, radius, sign, reach = _fillet(ext[count + ii], ext[count + ii - 1], ext[count + ii + 1], radius)
+        reaches.append(reach)
+        for shift in (-1., 0., 1.):
+            mask = (u >= start + shift) & (u <= end + shift)
+            dz = u[mask] - cz - shift
+            r[mask] = cr + sign * np.sqrt(np.maximum(radius * radius - dz * dz, 0.))
+    for ii in range(count): #neighbouring fillets must not overlap
+        length = np.hypot(*(xy[(ii + 1) % count] + ((1., 0.) if ii + 1 == count else (0., 0.)) - xy[ii]))
+        if reaches[ii] + reaches[(ii + 1) % count] > length + 1e-12:
+            raise ValueError("ThreadProfile: crest or root radius too large for thread form "+form.name)
+    table = r + form.offset
+    table.flags.writeable = False
+    _tableCache.put(key, table)
+    return table
+
+_tableCache = LRUCache(64)
+
+def synthesizeProfile(name, samples=720):
+    '''synthesizeProfile(name, samples=720): formTable() of a built-in form by name, or of a ThreadForm'''
+    form = forms[name] if isinstance(name, str) else name
+    return formTable(form, samples)
+
+def synthesizeProfilePair(profile_id, samples=720):
+    '''synthesizeProfilePair(profile_id, samples=720): (internal_data, external_data) for a key of profiles'''
+    internal, external = profiles[profile_id][:2]
+    return synthesizeProfile(internal, samples), synthesizeProfile(external, samples)
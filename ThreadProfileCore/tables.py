@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  tables.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Built-in profile data and preset tables, loaded on first use from Resources/profiles.
+
+Profile data are the x-coordinates of a thread profile with pitch=1 sketched on the xz plane
+with x=0 at the minor radius of the profile, one element every 1/720 of the pitch (2 per degree),
+stored as <name>_internal.npy and <name>_external.npy and memory-mapped when loaded.
+Preset tables are stored as <name>_presets.npz with a names array and an (n, 3) data array of
+pitch, external minor diameter, internal minor diameter."""
+
+import os
+import numpy as np
+
+resourcePath = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Resources", "profiles")
+
+#profiles that share a table, bottle threads use the same data for internal and external
+_aliases = {"bottle_external": "bottle_internal"}
+
+def loadProfileTable(name):
+    '''loadProfileTable(name): read-only memory-mapped array of profile data, name is e.g. "v_internal"'''
+    name = _aliases.get(name, name)
+    return np.load(os.path.join(resourcePath, name + ".npy"), mmap_mode="r")
+
+def loadProfile(name):
+    '''loadProfile(name): (internal_data, external_data) of a built-in profile, name is "v", "buttress" or "bottle"'''
+    return loadProfileTable(name + "_internal"), loadProfileTable(name + "_external")
+
+def loadPresets(name):
+    '''loadPresets(name): preset rows [name, pitch, external minor, internal minor] of a built-in preset table'''
+    with np.load(os.path.join(resourcePath, name + "_presets.npz")) as npz:
+        return [[str(n)] + row for n, row in zip(npz["names"].tolist(), npz["data"].tolist())]
@@ -0,0 +1,594 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  ThreadProfileObject.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#
+#  Based on some code from Draft.py, authored by "Yorik van Havre, Werner Mayer, 
+#  Martin Burbaum, Ken Cline, Dmitry Chigrin, Daniel Falck"
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""The ThreadProfile document object.  Kept apart from ThreadProfileCmd so the Draft and Part
+imports it needs are only done when an object is created or a document containing one is opened."""
+
+import time
+import math
+import FreeCAD
+import Draft
+from FreeCAD import Base
+import Draft_rc
+from PySide.QtCore import QT_TRANSLATE_NOOP
+from Draft import _DraftObject, getParam, _ViewProviderWire
+from ThreadProfileCore import sampleProfile, knotSequence, contentHash, LRUCache
+from ThreadProfileCore import adaptiveIndices, samplePolar, fitPeriodicBSpline, scaledTolerance, minimalFit
+from ThreadProfileCore import profileSpectrum, evaluateSpectrum
+from ThreadProfileCore.library import profileLibrary, PROFILE, PRESETS
+from ThreadProfileCore.presetdb import presetDatabase
+from ThreadProfileCmd import version
+
+#values of the Engine property, see _ThreadProfile.makeSpline()
+engines = ["Approximate", "LeastSquares", "Minimal", "Interpolate"]
+#values of the Sampling property, see _ThreadProfile.makePoints()
+samplings = ["Quality", "Adaptive", "Fourier"]
+
+#wire/face shapes made by _ThreadProfile.execute(), shared by all ThreadProfile objects in the session
+#so identical profiles are only approximated once, keyed by _ThreadProfile.shapeKey()
+shapeCache = LRUCache(FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/ThreadProfile").GetInt("ShapeCacheSize", 64))
+
+def instrumentationEnabled():
+    '''True if the Instrumentation parameter is set, then execute() records its timings in the objects'''
+    return FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/ThreadProfile").GetBool("Instrumentation", False)
+
+#name, type, description of the properties set by _ThreadProfile.recordTimings(), all readonly
+instrumentationProperties = [
+    ("PointCount", "App::PropertyInteger", "Number of points made from the profile data"),
+    ("SplinePoles", "App::PropertyInteger", "Number of poles of the B-spline"),
+    ("CacheHit", "App::PropertyBool", "True if the shape was found in the shape cache, then approximation and face took no time"),
+    ("TimePoints", "App::PropertyFloat", "Milliseconds spent making the points"),
+    ("TimeApproximation", "App::PropertyFloat", "Milliseconds spent making the B-spline"),
+    ("TimeFace", "App::PropertyFloat", "Milliseconds spent making the wire and face"),
+    ("TimePlacement", "App::PropertyFloat", "Milliseconds spent setting the shape and placement"),
+    ("TimeTotal", "App::PropertyFloat", "Milliseconds spent in the last execute()"),
+]
+
+class _ThreadProfile(_DraftObject):
+    "The ThreadProfile object"
+
+    def __init__(self, obj):
+        _DraftObject.__init__(self,obj,"ThreadProfile")
+        obj.addProperty("App::PropertyFloat", "Version", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property","The version of ThreadProfile Workbench used to create this object")).Version = version
+        obj.addProperty("App::PropertyFloat", "ThreadCount", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property","Height of thread in terms of number of threads, applied to Helix if created with workbench")).ThreadCount=10
+        obj.addProperty("App::PropertyVectorList","Points","ThreadProfile", QT_TRANSLATE_NOOP("App::Property","The points of the B-spline"))
+        obj.addProperty("App::PropertyBool","Closed","ThreadProfile",QT_TRANSLATE_NOOP("App::Property","If the B-spline is closed or not"))
+        obj.addProperty("App::PropertyBool","MakeFace","ThreadProfile",QT_TRANSLATE_NOOP("App::Property","Create a face if this spline is closed"))
+        obj.addProperty("App::PropertyArea","Area","ThreadProfile",QT_TRANSLATE_NOOP("App::Property","The area of this object"))
+        obj.addProperty("App::PropertyLength", "MinorDiameter", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "The minor diameter of the thread"))
+        obj.addProperty("App::PropertyFloatList","internal_data","ThreadProfile",QT_TRANSLATE_NOOP("App::Property", "Data used to construct internal thread"))
+        obj.addProperty("App::PropertyFloatList","external_data","ThreadProfile",QT_TRANSLATE_NOOP("App::Property", "Data used to construct external thread"))
+        obj.addProperty("App::PropertyStringList","preset_names","ThreadProfile",QT_TRANSLATE_NOOP("App::Property", "list of preset names"))
+        obj.addProperty("App::PropertyFloatList","presets_data","ThreadProfile",QT_TRANSLATE_NOOP("App::Property","list of pitches and diameters"))
+        obj.addProperty("App::PropertyLength", "Pitch", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Pitch of the thread, use 25.4 / TPI if in mm mode else 1 / TPI to convert from threads per inch"))
+        obj.addProperty("App::PropertyEnumeration", "InternalOrExternal", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Whether to make internal or external thread profile"))
+        obj.InternalOrExternal=["Internal", "External"]
+        obj.InternalOrExternal="External"
+        obj.addProperty("App::PropertyEnumeration", "Presets", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Some presets"))
+        obj.addProperty("App::PropertyIntegerConstraint", "Quality", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Quality of profile: 1 = highest quality, 12 = lowest quality, higher numbers improve performance, but degrade quality of profile, valid values = 1 through 12"))
+        obj.addProperty("App::PropertyString", "Continuity", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Continuity of the produced BSpline -- readonly"))
+        obj.addProperty("App::PropertyStringList", "Instructions", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Instructions")).Instructions=[\
+"Expand this with the ... button to view instructions",\
+"Sweep this object along a helix of the same pitch to produce your thread.",\
+"It is recommended to make the helix in the ThreadProfile workbench.",\
+"If there is an active Body the ThreadProfile object will be put into it.,"\
+"If not it can be dragged and dropped into the body later.",\
+"If there is an active Body when the helix is made there will be made a ShapeBinder for it",\
+"For internal threads you will need to cut the Sweep object out of a cylinder, or if using Part Design sweep it as a Subtractive Pipe.",\
+"Always use Frenet mode",\
+"I have provided some presets, but it is possible there could be some errors.  Double check for mission critical applications.",\
+"Also, the tolerances might be different from what you wish to have.  I believe the internal minor diameters are all minimum and the external are all maximum.",\
+]
+        obj.Quality = (1,1,12,1) #1 default, 1 minimum, 12 max, 1 step size
+        obj.setEditorMode("internal_data", 2) #0 = normal, 1 = readonly, 2 = hidden
+        obj.setEditorMode("Closed", 2)
+        obj.setEditorMode("MakeFace", 2)
+        obj.setEditorMode("external_data", 2)
+        obj.setEditorMode("Area", 2)
+        obj.setEditorMode("Version", 1)
+        obj.setEditorMode("Continuity", 1)
+        obj.setEditorMode("preset_names", 2)
+        obj.setEditorMode("presets_data", 2)
+        obj.MakeFace = getParam("fillmode",True)
+        obj.Closed = True
+        obj.Points = []
+        self.assureProperties(obj)
+
+
+    def assureProperties(self, obj): # for Compatibility with older versions
+        if not hasattr(obj, "Parameterization"):
+            obj.addProperty("App::PropertyFloat","Parameterization","ThreadProfile",QT_TRANSLATE_NOOP("App::Property","Parameterization factor"))
+            obj.Parameterization = 1.0
+            obj.setEditorMode("Parameterization", 2)
+            self.knotSeq = []
+        if not hasattr(obj, "ProfileId"):
+            obj.addProperty("App::PropertyString", "ProfileId", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "ID of the profile data in the shared profile library, empty if the data is embedded in internal_data and external_data"))
+            obj.addProperty("App::PropertyString", "ProfileHash", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Content hash of the profile data in the shared profile library"))
+            obj.addProperty("App::PropertyString", "PresetsId", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "ID of the presets in the shared profile library, empty if the presets are embedded in preset_names and presets_data"))
+            obj.addProperty("App::PropertyString", "PresetsHash", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Content hash of the presets in the shared profile library"))
+            obj.setEditorMode("ProfileId", 1)
+            obj.setEditorMode("ProfileHash", 2)
+            obj.setEditorMode("PresetsId", 2)
+            obj.setEditorMode("PresetsHash", 2)
+        if not hasattr(obj, "Starts"):
+            obj.addProperty("App::PropertyIntegerConstraint", "Starts", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Number of starts of the thread; the profile repeats Starts times per revolution and the helix made by the workbench has a lead of Starts * Pitch"))
+            obj.Starts = (1,1,16,1) #1 default, 1 minimum, 16 max, 1 step size
+        if not hasattr(obj, "Sampling"):
+            obj.addProperty("App::PropertyEnumeration", "Sampling", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Quality = use every Quality-th point of the profile data, Adaptive = pick points so the radial deviation stays within SamplingTolerance, Fourier = SampleCount points of the profile's Fourier series truncated to SamplingTolerance"))
+            obj.Sampling = samplings
+            obj.Sampling = "Quality"
+        elif list(obj.getEnumerationsOfProperty("Sampling")) != samplings:
+            sampling = obj.Sampling
+            obj.Sampling = samplings
+            obj.Sampling = sampling
+        if not hasattr(obj, "SamplingTolerance"):
+            obj.addProperty("App::PropertyLength", "SamplingTolerance", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Maximum radial deviation of the dropped points in Adaptive sampling mode, of the truncated series in Fourier sampling mode"))
+            obj.SamplingTolerance = 0.002
+        if not hasattr(obj, "SamplingError"):
+            obj.addProperty("App::PropertyLength", "SamplingError", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Achieved maximum radial deviation in Adaptive and Fourier sampling modes -- readonly"))
+            obj.setEditorMode("SamplingError", 1)
+        if not hasattr(obj, "SampleCount"):
+            obj.addProperty("App::PropertyIntegerConstraint", "SampleCount", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Number of points in Fourier sampling mode, any count from 8 to 2880"))
+            obj.SampleCount = (180,8,2880,1) #180 default, 8 minimum, 2880 max, 1 step size
+        if not hasattr(obj, "Harmonics"):
+            obj.addProperty("App::PropertyIntegerConstraint", "Harmonics", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Upper limit on the number of harmonics kept in Fourier sampling mode, 0 = no limit; a low limit gives a smoothed preview of the profile"))
+            obj.Harmonics = (0,0,1440,1)
+        if not hasattr(obj, "HarmonicsUsed"):
+            obj.addProperty("App::PropertyInteger", "HarmonicsUsed", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Number of harmonics needed for SamplingTolerance in Fourier sampling mode -- readonly"))
+            obj.setEditorMode("HarmonicsUsed", 1)
+        if not hasattr(obj, "Engine"):
+            obj.addProperty("App::PropertyEnumeration", "Engine", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Approximate = OCC BSplineCurve.approximate(), LeastSquares = periodic B-spline with PoleCount poles and uniform knots fitted to the points, Minimal = fewest poles within a tolerance scaled to pitch and diameter, Interpolate = exact periodic interpolation of the points with knots from Parameterization"))
+            obj.Engine = engines
+            obj.Engine = "Approximate"
+        elif list(obj.getEnumerationsOfProperty("Engine")) != engines:
+            engine = obj.Engine
+            obj.Engine = engines
+            obj.Engine = engine
+        if not hasattr(obj, "PoleCount"):
+            obj.addProperty("App::PropertyIntegerConstraint", "PoleCount", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Number of poles of the B-spline in LeastSquares engine mode, limited to the number of points"))
+            obj.PoleCount = (128,8,720,1) #128 default, 8 minimum, 720 max, 1 step size
+        if not hasattr(obj, "Degree"):
+            obj.addProperty("App::PropertyIntegerConstraint", "Degree", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Degree of the B-spline in LeastSquares engine mode, 3 = cubic, 5 = quintic"))
+            obj.Degree = (3,3,5,1)
+        if not hasattr(obj, "FitError"):
+            obj.addProperty("App::PropertyLength", "FitError", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Largest distance between a point and the B-spline in LeastSquares and Minimal engine modes -- readonly"))
+            obj.setEditorMode("FitError", 1)
+        if not hasattr(obj, "RelativeTolerance"):
+            obj.addProperty("App::PropertyFloat", "RelativeTolerance", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Tolerance of the Minimal engine as a fraction of the ISO 965 grade 6 pitch diameter tolerance for this pitch and diameter, see FitTolerance"))
+            obj.RelativeTolerance = 1/30.
+        if not hasattr(obj, "FitTolerance"):
+            obj.addProperty("App::PropertyLength", "FitTolerance", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Tolerance the Minimal engine fits to, from RelativeTolerance, Pitch and diameter -- readonly"))
+            obj.setEditorMode("FitTolerance", 1)
+        if not hasattr(obj, "FitPoles"):
+            obj.addProperty("App::PropertyInteger", "FitPoles", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Number of poles of the B-spline made by the engine -- readonly"))
+            obj.addProperty("App::PropertyInteger", "FitDegree", "ThreadProfile", QT_TRANSLATE_NOOP("App::Property", "Degree of the B-spline made by the engine -- readonly"))
+            obj.setEditorMode("FitPoles", 1)
+            obj.setEditorMode("FitDegree", 1)
+
+    def assureInstrumentation(self, obj):
+        '''adds the instrumentation properties, only done when the Instrumentation parameter is set'''
+        for name, kind, tip in instrumentationProperties:
+            if not hasattr(obj, name):
+                obj.addProperty(kind, name, "Instrumentation", QT_TRANSLATE_NOOP("App::Property", tip+" -- readonly"))
+                obj.setEditorMode(name, 1)
+
+    def recordTimings(self, obj, shape, cacheHit, times):
+        '''sets the instrumentation properties, times are the perf_counter() values at the start of execute()
+        and after points, approximation, face and placement'''
+        self.assureInstrumentation(obj)
+        obj.PointCount = len(obj.Points)
+        obj.SplinePoles = shape.Edges[0].Curve.NbPoles if shape and shape.Edges else 0
+        obj.CacheHit = cacheHit
+        ms = [(b - a) * 1000. for a, b in zip(times, times[1:])]
+        obj.TimePoints, obj.TimeApproximation, obj.TimeFace, obj.TimePlacement = ms
+        obj.TimeTotal = (times[-1] - times[0]) * 1000.
+
+    def parameterization (self, pts, a, closed):
+        # Computes a knot Sequence for a set of points, see ThreadProfileCore.parameterization(),
+        # cached on the points so recomputes of unchanged profiles reuse it
+        return list(knotSequence([(p.x,p.y,p.z) for p in pts], a, closed))
+
+    def getProfileData(self, obj):
+        '''returns (data, pitch, minor_diameter, step, external) used to make the points'''
+        if hasattr(obj.Pitch,"Value"): #compatibility with objects created with version <= 1.20
+            pitch = obj.Pitch.Value
+        else:
+            pitch = obj.Pitch
+        minor_diameter = obj.MinorDiameter.Value
+        if "external" in obj.InternalOrExternal.lower():
+            external = True
+        else:
+            if "internal" in obj.InternalOrExternal.lower():
+                external=False
+            else:
+                FreeCAD.Console.PrintWarning("ThreadProfile: Unable to determine internal or external thread type, using external\n")
+                external=True
+        step = obj.Quality #1 means do not skip any points, 2 means use every other, 3 every 3rd, etc.
+        internal_data, external_data = self.getProfileTables(obj)
+        if external:
+            our_data = external_data
+        else:
+            our_data = internal_data
+        return our_data, pitch, minor_diameter, step, external
+
+    def getProfileTables(self, obj):
+        '''returns (internal_data, external_data) from the shared library if obj references it,
+        falling back on the data embedded in obj'''
+        return self.getTables(obj, PROFILE, "ProfileId", "ProfileHash", "internal_data", "external_data")
+
+    def getPresetTables(self, obj):
+        '''returns (preset_names, presets_data) from the shared library if obj references it,
+        falling back on the presets embedded in obj'''
+        return self.getTables(obj, PRESETS, "PresetsId", "PresetsHash", "preset_names", "presets_data")
+
+    def getPresetDatabase(self, obj):
+        '''returns the indexed ThreadProfileCore.PresetDatabase for the presets of obj'''
+        if getattr(obj, "PresetsHash", ""):
+            db = presetDatabase(obj.PresetsId, obj.PresetsHash)
+            if db:
+                return db
+        preset_names, presets_data = self.getPresetTables(obj)
+        return presetDatabase(getattr(obj, "PresetsId", ""), preset_names=preset_names, presets_data=presets_data)
+
+    def getTables(self, obj, kind, idProp, hashProp, firstProp, secondProp):
+        entry_id = getattr(obj, idProp, "")
+        entry_hash = getattr(obj, hashProp, "")
+        if entry_hash:
+            value = profileLibrary.get(kind, entry_id, entry_hash)
+            if value:
+                return value
+        first = getattr(obj, firstProp, [])
+        second = getattr(obj, secondProp, [])
+        if first or second:
+            return first, second
+        value = profileLibrary.get(kind, entry_id)
+        if value:
+            FreeCAD.Console.PrintWarning("ThreadProfile: "+obj.Name+" "+kind+" not found in library by hash, using current version of "+entry_id+"\n")
+            return value
+        FreeCAD.Console.PrintError("ThreadProfile: "+obj.Name+" has no "+kind+" data and "+kind+" \""+entry_id+"\" is not in the library\n")
+        return [], []
+
+    def makePoints(self, obj):
+        our_data, pitch, minor_diameter, step, external = self.getProfileData(obj)
+        starts = getattr(obj, "Starts", 1)
+        if hasattr(obj, "Sampling") and obj.Sampling == "Adaptive" and pitch > 0:
+            indices, error = adaptiveIndices(our_data, obj.SamplingTolerance.Value / pitch)
+            xs, ys = samplePolar(our_data, minor_diameter, pitch, indices, starts)
+            obj.SamplingError = error * pitch
+        elif hasattr(obj, "Sampling") and obj.Sampling == "Fourier" and pitch > 0:
+            spectrum = profileSpectrum(our_data, obj.SamplingTolerance.Value / pitch, obj.Harmonics or None)
+            values = evaluateSpectrum(spectrum, obj.SampleCount)
+            xs, ys = samplePolar(values, minor_diameter, pitch, range(len(values)), starts)
+            obj.SamplingError = spectrum.error * pitch
+            obj.HarmonicsUsed = len(spectrum.coefficients) - 1
+        else:
+            xs, ys = sampleProfile(our_data, minor_diameter, pitch, step, starts)
+        return [Base.Vector(x,y,0) for x,y in zip(xs.tolist(), ys.tolist())]
+
+    def shapeKey(self, obj, closed, makeFace):
+        '''key into shapeCache, covers everything that affects the shape made in execute()'''
+        our_data, pitch, minor_diameter, step, external = self.getProfileData(obj)
+        sampling = (obj.Sampling, obj.SamplingTolerance.Value, getattr(obj, "SampleCount", None), getattr(obj, "Harmonics", None)) if hasattr(obj, "Sampling") else None
+        engine = (obj.Engine, obj.PoleCount, obj.Degree, getattr(obj, "RelativeTolerance", None), obj.Parameterization) if hasattr(obj, "Engine") else None
+        return contentHash(our_data, pitch, minor_diameter, step, external, closed, makeFace, sampling, engine, getattr(obj, "Starts", 1))
+
+    def fitTolerance(self, obj):
+        '''tolerance of the Minimal engine in mm, see ThreadProfileCore.scaledTolerance(), the diameter is
+        the largest diameter of obj.Points'''
+        pitch = self.getProfileData(obj)[1]
+        diameter = 2 * max(p.x * p.x + p.y * p.y for p in obj.Points) ** .5 if obj.Points else 0.
+        return scaledTolerance(pitch, diameter, obj.RelativeTolerance)
+
+    def makeSpline(self, obj):
+        '''returns (spline, fit_error) made from obj.Points with the engine selected in obj.Engine,
+        fit_error is None for the Approximate and Interpolate engines.  The Minimal engine picks the degree and
+        pole count, Interpolate passes through every point with knots from obj.Parameterization.'''
+        import Part
+        spline = Part.BSplineCurve()
+        if hasattr(obj, "Engine") and obj.Engine in ("LeastSquares", "Minimal"):
+            pts = obj.Points
+            xs, ys = [p.x for p in pts], [p.y for p in pts]
+            if obj.Engine == "Minimal":
+                fit = minimalFit(xs, ys, self.fitTolerance(obj))
+            else:
+                fit = fitPeriodicBSpline(xs, ys, obj.PoleCount, obj.Degree)
+            poles = [Base.Vector(x,y,0) for x,y in fit.poles.tolist()]
+            spline.buildFromPolesMultsKnots(poles, fit.mults, fit.knots, True, fit.degree)
+            return spline, fit.error
+        if hasattr(obj, "Engine") and obj.Engine == "Interpolate":
+            closed = obj.Closed and len(obj.Points) > 2
+            self.knotSeq = self.parameterization(obj.Points, obj.Parameterization, closed)
+            spline.interpolate(Points = obj.Points, PeriodicFlag = closed, Parameters = self.knotSeq)
+            return spline, None
+        spline.approximate(Points = obj.Points, DegMin = 3, DegMax = 5, Tolerance = .003692, Continuity = 'C3', ParamType = 'ChordLength')
+        spline.setPeriodic()
+        return spline, None
+
+    def onDocumentRestored(self, obj):
+        #properties added since the document was saved, e.g. Starts, which expressions of new helices refer to
+        self.assureProperties(obj)
+
+    def onChanged(self, fp, prop):
+        if prop == "Engine":
+            #Parameterization is only used by the Interpolate engine
+            fp.setEditorMode("Parameterization", 0 if fp.Engine == "Interpolate" else 2)
+        if prop == "Parameterization":
+            if fp.Parameterization < 0.:
+                fp.Parameterization = 0.
+            if fp.Parameterization > 1.0:
+                fp.Parameterization = 1.0
+        if prop == "Presets" or prop == "InternalOrExternal":
+            if hasattr(fp,"Presets") and hasattr(fp,"presets_data"):
+                preset = self.getPresetDatabase(fp).find(getattr(fp,"Presets"))
+                if preset and preset.index != 0:
+                    fp.Pitch = preset.pitch
+                    if "External" in fp.InternalOrExternal:
+                        fp.MinorDiameter = preset.external_minor
+                    else:
+                        fp.MinorDiameter = preset.internal_minor
+        if prop in ("ThreadCount", "Starts") and hasattr(fp, "ThreadCount"):
+            #the helix has one turn per lead, ThreadCount / Starts of them
+            turns = int(math.ceil(fp.ThreadCount / float(getattr(fp, "Starts", 1)) - 1e-9))
+            ins = fp.InList
+            for inobj in ins:
+                if hasattr(inobj,"Spine") and inobj.Spine and inobj.Spine[1]:
+                    #an empty edge list (makeSweep before the helix is computed) means the whole helix, leave it
+                    spine = inobj.Spine
+                    helix = spine[0]
+                    edgeNames = []
+                    for ii in range(1,turns):
+                        edgeNames.append("Edge"+str(ii))
+                    inobj.Spine = [helix,edgeNames]
+
+
+    def execute(self, obj):
+        self.assureProperties(obj)
+        timing = [time.perf_counter()] if instrumentationEnabled() else None
+        obj.Points = self.makePoints(obj)
+        import Part
+        shape = None
+        cacheHit = False
+        if obj.Points:
+            plm = obj.Placement
+            closed = obj.Closed and (len(obj.Points) > 2)
+            if closed and obj.Points[0] == obj.Points[-1]:  # should not occur, but OCC will crash
+                FreeCAD.Console.PrintError(QT_TRANSLATE_NOOP('draft',  "_ThreadProfile.createGeometry: Closed with same first/last Point. Geometry not updated.")+"\n")
+                return
+            makeFace = obj.MakeFace if hasattr(obj,"MakeFace") else True
+            key = self.shapeKey(obj, closed, makeFace)
+            if timing:
+                timing.append(time.perf_counter())
+            cached = shapeCache.get(key)
+            if cached is None:
+                spline, fit_error = self.makeSpline(obj)
+                if timing:
+                    timing.append(time.perf_counter())
+                if closed:
+                    # DNC: bug fix: convert to face if closed
+                    shape = Part.Wire(spline.toShape())
+                    # Creating a face from a closed spline cannot be expected to always work
+                    # Usually, if the spline is not flat the call of Part.Face() fails
+                    try:
+                        if makeFace:
+                            shape = Part.Face(shape)
+                    except Part.OCCError:
+                        pass
+                else:
+                    shape = spline.toShape()
+                cached = (shape, spline.Continuity, fit_error)
+                shapeCache.put(key, cached)
+            else:
+                cacheHit = True
+                if timing:
+                    timing.append(timing[-1])
+            if timing:
+                timing.append(time.perf_counter())
+            shape, continuity, fit_error = cached
+            if fit_error is not None:
+                obj.FitError = fit_error
+            if obj.Engine == "Minimal":
+                obj.FitTolerance = self.fitTolerance(obj)
+            if shape.Edges:
+                obj.FitPoles = shape.Edges[0].Curve.NbPoles
+                obj.FitDegree = shape.Edges[0].Curve.Degree
+            obj.Shape = shape
+            if hasattr(obj,"Area") and hasattr(shape,"Area"):
+                obj.Area = shape.Area
+            obj.Continuity = continuity
+            obj.Placement = plm
+        obj.positionBySupport()
+        if timing:
+            while len(timing) < 4: #no points, nothing approximated
+                timing.append(timing[-1])
+            timing.append(time.perf_counter())
+            self.recordTimings(obj, shape, cacheHit, timing)
+
+    # for compatibility with older versions
+    _ViewProviderBSpline = _ViewProviderWire
+
+###################################################################################
+# Object factories, used by the commands, ThreadProfileBatch and ThreadProfileCatalog, no GUI needed
+
+def makeThreadProfile(name="VThreadProfile",minor_diameter=4.773,pitch=1,internal_or_external="External",internal_data=[],external_data=[],presets=[],thread_count=10,profile_id="VThread",preset=None,recompute=True):
+    '''makeThreadProfile(name="VThreadProfile",minor_diameter=4.773,pitch=1,internal_or_external="External",internal_data=[],external_data=[],presets=[],thread_count=10,profile_id="VThread",preset=None,recompute=True):
+    Creates a thread profile object in the active document that can be swept along a helix to produce a thread.
+    Code is based on Draft.makeBSpline().'''
+    if not FreeCAD.ActiveDocument:
+        FreeCAD.Console.PrintError("No active document. Aborting\n")
+        return
+    else: fname = name
+    from ThreadProfileCore import flattenPresets
+    obj = FreeCAD.ActiveDocument.addObject("Part::Part2DObjectPython",fname)
+    _ThreadProfile(obj)
+    obj.Closed = True
+    obj.Support = None
+    #allow to include custom thread profile for internal_data or external_data
+    #these are 720 floats of the x-coordinates
+    #of a thread profile with pitch=1 sketched on the xz plane
+    #with x=0 at the minor radius of the profile
+    #the element position is the z-coordinate / 720 (2 points per degree)
+    #y-coordinate is always zero
+    #the thread profile produced is a function of these values, minor diameter, and pitch
+    #profiles and presets found in the shared library are only referenced by ID and hash,
+    #unless the EmbedProfileData parameter is set, custom ones are always embedded
+    embed = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/ThreadProfile").GetBool("EmbedProfileData", False)
+    library_internal, library_external = profileLibrary.getProfile(profile_id)
+    if len(internal_data)==0:
+        internal_data = library_internal
+    if len(external_data)==0:
+        external_data = library_external
+    found_id, found_hash = profileLibrary.findProfile(internal_data, external_data)
+    if found_id:
+        obj.ProfileId = found_id
+        obj.ProfileHash = found_hash
+    if embed or not found_id:
+        obj.internal_data = list(internal_data)
+        obj.external_data = list(external_data)
+    obj.Pitch = pitch #default pitch
+    obj.MinorDiameter = minor_diameter #M6x1 internal 6g tolerance class is default
+
+    if len (presets) == 0:
+        found_id = profile_id
+        found_hash = profileLibrary.currentHash(PRESETS, profile_id)
+    else:
+        found_id, found_hash = profileLibrary.findPresets(presets)
+    if found_id:
+        obj.PresetsId = found_id
+        obj.PresetsHash = found_hash
+        preset_names, presets_data = profileLibrary.getPresets(found_id, found_hash)
+    else:
+        preset_names, presets_data = flattenPresets(presets)
+    if embed or not found_id:
+        obj.presets_data = list(presets_data)
+        obj.preset_names = list(preset_names)
+    obj.Presets = list(preset_names)
+    obj.InternalOrExternal = internal_or_external
+    obj.ThreadCount = thread_count
+    if preset:
+        obj.Presets = preset #sets Pitch and MinorDiameter in onChanged()
+
+    if FreeCAD.GuiUp:
+        _ViewProviderWire(obj.ViewObject)
+        Draft.formatObject(obj)
+        Draft.select(obj)
+        import FreeCADGui
+        body=FreeCADGui.ActiveDocument.ActiveView.getActiveObject("pdbody")
+        part=FreeCADGui.ActiveDocument.ActiveView.getActiveObject("part")
+        if body:
+            body.Group=body.Group+[obj]
+        elif part:
+            part.Group=part.Group+[obj]
+    if recompute:
+        FreeCAD.ActiveDocument.recompute()
+    return obj
+
+def makeHelix(profile, body=None, part=None):
+    '''makeHelix(profile, body=None, part=None): makes a Part::Helix with pitch and height linked to the
+    ThreadProfile object profile, placement too unless disabled in settings.  If there is a body
+    a ShapeBinder of the helix is made in it.  Returns (helix, shapebinder), shapebinder is None if
+    there is no body.  Does not recompute the document.'''
+    doc = profile.Document
+    name = profile.Name
+    helix = doc.addObject("Part::Helix","Helix")
+    helix.Label = helix.Name
+    profile.Proxy.assureProperties(profile) #Starts, in case profile is from an older version and not recomputed yet
+    helix.setExpression("Pitch",name+'.Pitch*'+name+'.Starts') #the lead, one turn advances all starts
+    helix.setExpression("Height",name+'.ThreadCount*'+name+'.Pitch')
+    pg = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/ThreadProfile")
+    if pg.GetBool("LinkHelixPlacementParametrically", True):
+        #one expression for the whole placement instead of one per component
+        helix.setExpression('Placement',name+'.Placement')
+    else:
+        helix.Placement=profile.Placement
+    if part:
+        part.Group=part.Group+[helix]
+    shapebinder = None
+    if body:
+        shapebinder = body.newObject('PartDesign::ShapeBinder','ShapeBinder')
+        shapebinder.Support = [(helix,'')]
+        if FreeCAD.GuiUp:
+            helix.ViewObject.Visibility=False
+    return helix, shapebinder
+
+def makeSweep(profile, spine, body=None):
+    '''makeSweep(profile, spine, body=None): sweeps the ThreadProfile object profile along spine in Frenet mode.
+    If spine is a Part::Helix a Part::Sweep is made, else spine is taken as a ShapeBinder in body and
+    an AdditivePipe (external threads) or SubtractivePipe (internal threads) is made in body.
+    Returns the new object.  Does not recompute the document.'''
+    doc = profile.Document
+    if spine.isDerivedFrom("Part::Helix") or not body:
+        sweep = doc.addObject('Part::Sweep','Sweep')
+        sweep.Sections=[profile,]
+        edgeList = []
+        count = len(spine.Shape.Edges) #0 if the helix is not recomputed yet, then the whole helix is used
+        for ii in range(1,count+1):
+            edgeList.append("Edge"+str(ii))
+        sweep.Spine=(spine,edgeList)
+        sweep.Solid=True
+        sweep.Frenet=True
+        if FreeCAD.GuiUp:
+            profile.ViewObject.Visibility = False
+            spine.ViewObject.Visibility = False
+        return sweep
+    if "External" in profile.InternalOrExternal:
+        #additive part design sweep
+        pipe = body.newObject("PartDesign::AdditivePipe","AdditivePipe")
+    else:
+        pipe = body.newObject("PartDesign::SubtractivePipe","SubtractivePipe")
+    pipe.Profile = profile
+    pipe.Spine = spine
+    pipe.Mode = 'Frenet'
+    if FreeCAD.GuiUp:
+        profile.ViewObject.Visibility = False
+        spine.ViewObject.Visibility = False
+        pipe.ViewObject.ShapeColor=body.ViewObject.ShapeColor
+        pipe.ViewObject.LineColor=body.ViewObject.LineColor
+        pipe.ViewObject.PointColor=body.ViewObject.PointColor
+        pipe.ViewObject.Transparency=body.ViewObject.Transparency
+        pipe.ViewObject.DisplayMode=body.ViewObject.DisplayMode
+    return pipe
+
+def makeThread(profile=None, body=None, part=None, sweep=True, direct=None):
+    '''makeThread(profile=None, body=None, part=None, sweep=True, direct=None): the whole pipeline in one pass, makes a V thread
+    profile if profile is None, then the helix (and ShapeBinder if there is a body) and the sweep
+    (Part::Sweep, or Additive/Subtractive pipe in body).  Returns (profile, helix, shapebinder, sweep).
+    If direct (default: the UseDirectSolid setting) and there is no body a ThreadSolid is made in place
+    of the helix and sweep, returned as sweep with helix None.
+    Does not open a transaction or recompute, the caller does that once for everything.'''
+    if profile is None:
+        profile = makeThreadProfile(recompute=False)
+    if direct is None:
+        direct = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/ThreadProfile").GetBool("UseDirectSolid", False)
+    if direct and sweep and not body:
+        from ThreadProfileSolid import makeThreadSolid
+        return profile, None, None, makeThreadSolid(profile, part=part)
+    helix, shapebinder = makeHelix(profile, body=body, part=part)
+    pipe = None
+    if sweep:
+        pipe = makeSweep(profile, shapebinder or helix, body=body)
+    return profile, helix, shapebinder, pipe
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  ThreadProfileSolid.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Thread solid made directly from the ThreadProfile spline: the helical motion is written as a
+B-spline blend (ThreadProfileCore.helix), so the lateral surface of the thread is one B-spline
+surface with the profile spline's poles moved along the helix.  No Part::Helix, no sweep.
+Long threads can also be assembled from copies of one cached turn (replicateTurns)."""
+
+import math
+import FreeCAD
+import Part
+from PySide.QtCore import QT_TRANSLATE_NOOP
+from ThreadProfileCore import helixBlend, helicalPoles, contentHash, LRUCache
+
+#one turn (and fractional end turn) lateral faces made by makeTurn(), keyed by turnKey()
+turnCache = LRUCache(FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/ThreadProfile").GetInt("TurnCacheSize", 32))
+
+#tolerance for sewing the copies of a turn together, makePipeShell ends are approximated
+sewingTolerance = 1e-4
+
+def profileCurve(profile):
+    '''profileCurve(profile): the periodic B-spline of the ThreadProfile object profile in its own
+    coordinates (xy plane, axis at the origin)'''
+    shape = profile.Shape.copy()
+    shape.Placement = FreeCAD.Placement()
+    return shape.Edges[0].Curve
+
+def makeHelicalSolid(curve, pitch, turns, poles_per_turn=16, degree=3):
+    '''makeHelicalSolid(curve, pitch, turns, poles_per_turn=16, degree=3): solid swept by the periodic
+    B-spline curve in the xy plane along a right handed helix about z, returns (solid, error) where
+    error is the largest deviation of the surface from the exact helical sweep in mm'''
+    blend = helixBlend(turns, pitch, poles_per_turn, degree)
+    profile_poles = [(p.x, p.y) for p in curve.getPoles()]
+    poles = helicalPoles(profile_poles, blend)
+    surface = Part.BSplineSurface()
+    surface.buildFromPolesMultsKnots([[FreeCAD.Vector(*p) for p in row] for row in poles.tolist()],
+        curve.getMultiplicities(), blend.mults, curve.getKnots(), blend.knots,
+        True, False, curve.Degree, blend.degree)
+    lateral = surface.toShape()
+    #the end sections are exact copies of the profile, closed edges at v = 0 and v = turns
+    caps = [Part.Face(Part.Wire(edge)) for edge in lateral.Edges if edge.isClosed()]
+    solid = Part.Solid(Part.Shell([lateral] + caps))
+    if solid.Volume < 0:
+        solid.reverse()
+    radius = max((x * x + y * y) ** .5 for x, y in profile_poles)
+    return solid, blend.error * radius
+
+def curveHash(curve):
+    '''curveHash(curve): content hash of a B-spline curve, the profile part of the turnCache keys'''
+    poles = [c for p in curve.getPoles() for c in (p.x, p.y, p.z)]
+    return contentHash(poles, curve.getKnots(), curve.getMultiplicities(), curve.Degree)
+
+def turnKey(curve, pitch, fraction, method, poles_per_turn=16, degree=3):
+    '''turnKey(curve, pitch, fraction, method, poles_per_turn=16, degree=3): key into turnCache'''
+    if method == "Sweep":
+        poles_per_turn = degree = None #not used by the sweep
+    return contentHash(curveHash(curve), pitch, round(fraction, 9), method, poles_per_turn, degree)
+
+def _lateralFaces(shape):
+    #all but the planar end caps, the faces of a thread turn are never horizontal otherwise
+    return [face for face in shape.Faces if face.BoundBox.ZLength > 1e-7]
+
+def makeTurn(curve, pitch, fraction=1., method="Sweep", poles_per_turn=16, degree=3):
+    '''makeTurn(curve, pitch, fraction=1., method="Sweep", poles_per_turn=16, degree=3): lateral faces of
+    fraction of a turn of thread starting at z = 0, made with makePipeShell along a Part.makeHelix spine
+    as the Sweep does (method "Sweep") or with makeHelicalSolid() (method "Direct").  Cached in turnCache.'''
+    key = turnKey(curve, pitch, fraction, method, poles_per_turn, degree)
+    faces = turnCache.get(key)
+    if faces is None:
+        if method == "Sweep":
+            radius = max(p.Length for p in curve.getPoles())
+            spine = Part.Wire(Part.makeHelix(pitch, pitch * fraction, radius))
+            shape = spine.makePipeShell([Part.Wire(curve.toShape())], True, True)
+        else:
+            shape = makeHelicalSolid(curve, pitch, fraction, poles_per_turn, degree)[0]
+        faces = _lateralFaces(shape)
+        turnCache.put(key, faces)
+    return faces
+
+def _sew(shapes):
+    #shell of the faces of shapes with the coincident edges of neighbouring faces merged, the edges a shell
+    #among shapes already shares are not free and are left alone, only its open ends are sewn to the rest
+    sewn = Part.Compound(shapes)
+    sewn.sewShape(sewingTolerance)
+    return Part.Shell(sewn.Faces)
+
+def _cap(shell, z):
+    #planar face on the free edges of shell at height z, sharing those edges so no sewing is needed
+    edges = [e for e in shell.getFreeEdges().Edges if e.BoundBox.ZLength < sewingTolerance and abs(e.BoundBox.ZMin - z) < sewingTolerance]
+    return Part.Face(Part.Wire(Part.__sortEdges__(edges)))
+
+def _closeShell(shell, height):
+    #solid from a lateral shell running from z = 0 to z = height
+    solid = Part.Solid(Part.Shell(shell.Faces + [_cap(shell, 0.), _cap(shell, height)]))
+    if solid.Volume < 0:
+        solid.reverse()
+    return solid
+
+def _translated(faces, z):
+    return [face.translated(FreeCAD.Vector(0, 0, z)) for face in faces]
+
+def wholeTurns(curve, pitch, whole, method="Sweep", poles_per_turn=16, degree=3, previous=None):
+    '''wholeTurns(curve, pitch, whole, method="Sweep", poles_per_turn=16, degree=3, previous=None): the
+    sewn lateral faces of whole turns of thread as (key, whole, shell), shell is None for 0 turns.
+    previous is an earlier result for the same turn: fewer turns are trimmed from it without sewing, more
+    turns sew only the copies of the turn above it onto a copy of its shell.  The turn itself comes from
+    turnCache.'''
+    key = turnKey(curve, pitch, 1., method, poles_per_turn, degree)
+    if previous and previous[0] == key and previous[2] is not None:
+        if previous[1] == whole:
+            return previous
+        if previous[1] > whole:
+            #faces of the sewn shell keep their shared edges, a subset needs no sewing
+            faces = [face for face in previous[2].Faces if face.BoundBox.Center.z < whole * pitch]
+            return key, whole, Part.Shell(faces) if faces else None
+        start, shapes = previous[1], [previous[2].copy()]
+    else:
+        start, shapes = 0, []
+    if whole > start:
+        turn = makeTurn(curve, pitch, 1., method, poles_per_turn, degree)
+        for ii in range(start, whole):
+            shapes.extend(_translated(turn, ii * pitch))
+    return key, whole, _sew(shapes) if shapes else None
+
+def replicateTurns(curve, pitch, turns, method="Sweep", poles_per_turn=16, degree=3, previous=None):
+    '''replicateTurns(curve, pitch, turns, method="Sweep", poles_per_turn=16, degree=3, previous=None): same
+    solid as makeHelicalSolid() or a sweep along a helix, made from copies of one cached turn (see makeTurn())
+    moved up one pitch each, plus the fractional end turn, sewn and capped.  Costs about one turn of
+    sweeping for any length.  Returns (solid, whole), pass whole as previous when only turns changed, its
+    shell is then trimmed or extended instead of sewn again (see wholeTurns()).'''
+    count = int(math.floor(turns + 1e-9))
+    fraction = turns - count
+    whole = wholeTurns(curve, pitch, count, method, poles_per_turn, degree, previous)
+    shell = whole[2]
+    if fraction > 1e-9:
+        #the turn above a whole number of turns starts at the same angle as the first one
+        end = _translated(makeTurn(curve, pitch, fraction, method, poles_per_turn, degree), count * pitch)
+        #sewn onto a copy, whole keeps the shell of whole turns for the next call
+        shell = _sew(([shell.copy()] if shell else []) + end)
+    return _closeShell(shell, turns * pitch), whole
+
+class _ThreadSolid:
+    "Thread solid made from a ThreadProfile object without helix or sweep"
+
+    def __init__(self, obj):
+        obj.addProperty("App::PropertyLink", "Profile", "ThreadSolid", QT_TRANSLATE_NOOP("App::Property","The ThreadProfile object to make the thread from"))
+        obj.addProperty("App::PropertyFloat", "Turns", "ThreadSolid", QT_TRANSLATE_NOOP("App::Property","Length of the thread in turns of the helix, one lead each, linked to ThreadCount / Starts of the profile by default")).Turns = 10
+        obj.addProperty("App::PropertyIntegerConstraint", "PolesPerTurn", "ThreadSolid", QT_TRANSLATE_NOOP("App::Property","Poles per turn of the helical blend, more = more accurate, see HelixError")).PolesPerTurn = (16,4,64,1)
+        obj.addProperty("App::PropertyIntegerConstraint", "Degree", "ThreadSolid", QT_TRANSLATE_NOOP("App::Property","Degree of the helical blend")).Degree = (3,3,5,1)
+        obj.addProperty("App::PropertyLength", "HelixError", "ThreadSolid", QT_TRANSLATE_NOOP("App::Property","Largest deviation of the helical blend from an exact helical sweep, 0 for ReplicatedSweep (readonly)"))
+        obj.setEditorMode("HelixError", 1)
+        obj.Proxy = self
+        self.assureProperties(obj)
+        self.sewnTurns = None
+
+    def assureProperties(self, obj): # for Compatibility with older versions
+        if not hasattr(obj, "Method"):
+            obj.addProperty("App::PropertyEnumeration", "Method", "ThreadSolid", QT_TRANSLATE_NOOP("App::Property", "Direct = one helical surface for the whole length, ReplicatedDirect / ReplicatedSweep = one cached turn made directly or swept with makePipeShell, copied for the whole length"))
+            obj.Method = ["Direct", "ReplicatedDirect", "ReplicatedSweep"]
+            obj.Method = "Direct"
+
+    def execute(self, obj):
+        self.assureProperties(obj)
+        if not obj.Profile or obj.Turns <= 0:
+            return
+        plm = obj.Placement
+        pitch = getattr(obj.Profile.Pitch, "Value", obj.Profile.Pitch) #float in versions <= 1.20
+        pitch *= getattr(obj.Profile, "Starts", 1) #the lead, the profile of a multi-start thread has Starts lobes
+        curve = profileCurve(obj.Profile)
+        if obj.Method == "Direct":
+            solid, error = makeHelicalSolid(curve, pitch, obj.Turns, obj.PolesPerTurn, obj.Degree)
+        else:
+            method = "Sweep" if obj.Method == "ReplicatedSweep" else "Direct"
+            #only Turns changed: the sewn whole turns of the last recompute are trimmed or extended, not sewn again
+            solid, self.sewnTurns = replicateTurns(curve, pitch, obj.Turns, method, obj.PolesPerTurn, obj.Degree, getattr(self, "sewnTurns", None))
+            error = helixBlend(1., pitch, obj.PolesPerTurn, obj.Degree).error * max(p.Length for p in curve.getPoles()) if method == "Direct" else 0.
+        obj.Shape = solid
+        obj.Placement = plm
+        obj.HelixError = error
+
+    def __getstate__(self):
+        return None
+
+    def __setstate__(self, state):
+        self.sewnTurns = None
+        return None
+
+def makeThreadSolid(profile, part=None, method="Direct"):
+    '''makeThreadSolid(profile, part=None, method="Direct"): makes a ThreadSolid from the ThreadProfile object profile,
+    turns and placement linked to the profile, method is one of the Method property values.
+    Returns the new object.  Does not recompute the document.'''
+    doc = profile.Document
+    name = profile.Name
+    obj = doc.addObject("Part::FeaturePython", "ThreadSolid")
+    _ThreadSolid(obj)
+    obj.Profile = profile
+    obj.Method = method
+    profile.Proxy.assureProperties(profile) #Starts, in case profile is from an older version and not recomputed yet
+    obj.setExpression("Turns", name+'.ThreadCount/'+name+'.Starts')
+    pg = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/ThreadProfile")
+    if pg.GetBool("LinkHelixPlacementParametrically", True):
+        obj.setExpression('Placement', name+'.Placement')
+    else:
+        obj.Placement = profile.Placement
+    if part:
+        part.Group = part.Group+[obj]
+    if FreeCAD.GuiUp:
+        obj.ViewObject.Proxy = 0
+        profile.ViewObject.Visibility = False
+    return obj
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  pipeline_benchmark.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Thread pipeline benchmark: times each stage of making a thread for every Quality value 1-12 and
+for V, buttress and bottle presets:
+
+    makePoints        _ThreadProfile.makePoints()
+    parameterization  _ThreadProfile.parameterization()
+    approximate       _ThreadProfile.makeSpline() with the Approximate engine (BSplineCurve.approximate)
+    face              Part.Face of the closed spline, as execute() makes it
+    helix             Part.makeHelix, what Part::Helix computes
+    sweep             makePipeShell along the helix in Frenet mode, what Part::Sweep computes
+
+Usage: python benchmarks/pipeline_benchmark.py [--stub] [--quality 1 2 ...] [--turns N] [--repeat N]
+                                               [--json] [--output FILE] [--compare OLD.json]
+
+Run it with the python FreeCAD uses (or FreeCADCmd) to time all stages.  With --stub, or when FreeCAD
+cannot be imported, small stand-ins for the FreeCAD, Part, Base, Draft and PySide modules are
+installed so the pure python stages (makePoints, parameterization) run anywhere, the OCC stages are
+reported as skipped.  --output writes the json results to a file, --compare prints the stages that
+got slower than in an earlier json file, so releases can be compared."""
+
+import os
+import sys
+import json
+import time
+import types
+import argparse
+import statistics
+
+wbPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, wbPath)
+
+#name, library id, preset, InternalOrExternal
+cases = [
+    ("V M10x1.5 external", "VThread", "M10 Coarse 1.5", "External"),
+    ("V M10x1.5 internal", "VThread", "M10 Coarse 1.5", "Internal"),
+    ("Buttress 1-10 external", "Buttress", "1-10", "External"),
+    ("Bottle 43-SP400 external", "Bottle", "43-SP400(M) 4.233333333333333", "External"),
+]
+
+stages = ("makePoints", "parameterization", "approximate", "face", "helix", "sweep")
+
+def installStubs():
+    '''stand-ins for the modules ThreadProfileObject imports, only what the pure python stages use'''
+    class Vector(object):
+        __slots__ = ("x", "y", "z")
+        def __init__(self, x=0., y=0., z=0.):
+            self.x, self.y, self.z = x, y, z
+    class Params(object):
+        def __getattr__(self, name):
+            return lambda key, default=None: default
+    class Console(object):
+        @staticmethod
+        def PrintWarning(text): pass
+        @staticmethod
+        def PrintError(text): sys.stderr.write(text)
+    class DraftObject(object):
+        def __init__(self, obj, tp): pass
+    Base = types.ModuleType("Base")
+    Base.Vector = Vector
+    FreeCAD = types.ModuleType("FreeCAD")
+    FreeCAD.Base, FreeCAD.Vector, FreeCAD.GuiUp, FreeCAD.Console = Base, Vector, False, Console
+    FreeCAD.ParamGet = lambda path: Params()
+    QtCore = types.ModuleType("PySide.QtCore")
+    QtCore.QT_TRANSLATE_NOOP = lambda context, text: text
+    PySide = types.ModuleType("PySide")
+    PySide.QtCore, PySide.QtGui = QtCore, types.ModuleType("PySide.QtGui")
+    Draft = types.ModuleType("Draft")
+    Draft._DraftObject, Draft._ViewProviderWire = DraftObject, object
+    Draft.getParam = lambda name, default=None: default
+    Part = types.ModuleType("Part") #no geometry, the OCC stages are skipped
+    Part.stub = True
+    sys.modules.update({"FreeCAD": FreeCAD, "FreeCAD.Base": Base, "FreeCADGui": types.ModuleType("FreeCADGui"),
+        "PySide": PySide, "PySide.QtCore": QtCore, "PySide.QtGui": PySide.QtGui, "Draft": Draft,
+        "Draft_rc": types.ModuleType("Draft_rc"), "Part": Part})
+
+class Quantity(object):
+    def __init__(self, value):
+        self.Value = value
+
+class ProfileStandIn(object):
+    '''the properties of a ThreadProfile object the stages read, so no document is needed'''
+    def __init__(self, library_id, preset, side, quality):
+        from ThreadProfileCore import profileLibrary, presetDatabase
+        from ThreadProfileCore.library import PROFILE
+        p = presetDatabase(library_id).find(preset)
+        self.Name = "ThreadProfile"
+        self.ProfileId, self.ProfileHash = library_id, profileLibrary.currentHash(PROFILE, library_id)
+        self.Pitch = Quantity(p.pitch)
+        self.MinorDiameter = Quantity(p.external_minor if side == "External" else p.internal_minor)
+        self.InternalOrExternal = side
+        self.Quality = quality
+        self.Sampling, self.SamplingTolerance = "Quality", Quantity(0.002)
+        self.Engine, self.PoleCount, self.Degree = "Approximate", 128, 3
+        self.Parameterization = 1.0
+        self.Points = []
+
+def timeIt(func, repeat, setup=None):
+    #setup runs before each run, untimed
+    times = []
+    for ii in range(repeat):
+        if setup:
+            setup()
+        t = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - t)
+    return times, result
+
+def runCase(proxy, library_id, preset, side, quality, turns, repeat, occ):
+    obj = ProfileStandIn(library_id, preset, side, quality)
+    result = {}
+    from ThreadProfileCore import geometry
+    def record(stage, func, setup=None):
+        times, value = timeIt(func, repeat, setup)
+        result[stage] = {"min_ms": min(times) * 1000, "median_ms": statistics.median(times) * 1000}
+        return value
+    obj.Points = record("makePoints", lambda: proxy.makePoints(obj))
+    #knotSequence() is memoized, empty its cache so every run computes the knots
+    record("parameterization", lambda: proxy.parameterization(obj.Points, obj.Parameterization, True), geometry._knotCache.clear)
+    result["points"] = len(obj.Points)
+    if not occ:
+        for stage in stages[2:]:
+            result[stage] = {"skipped": "no FreeCAD"}
+        return result
+    import Part
+    spline = record("approximate", lambda: proxy.makeSpline(obj)[0])
+    wire = Part.Wire(spline.toShape())
+    record("face", lambda: Part.Face(wire))
+    pitch = obj.Pitch.Value
+    radius = max(p.Length for p in spline.getPoles())
+    helix = record("helix", lambda: Part.makeHelix(pitch, pitch * turns, radius))
+    spine = Part.Wire(helix)
+    record("sweep", lambda: spine.makePipeShell([wire], True, True))
+    result["poles"] = spline.NbPoles
+    return result
+
+def compare(results, path, threshold):
+    '''lines for the stages at least threshold times slower than in the json results in path'''
+    with open(path) as f:
+        old = {(r["case"], r["quality"]): r for r in json.load(f)["results"]}
+    lines = []
+    for r in results:
+        before = old.get((r["case"], r["quality"]))
+        if not before:
+            continue
+        for stage in stages:
+            a, b = before.get(stage, {}), r.get(stage, {})
+            if "min_ms" in a and "min_ms" in b and a["min_ms"] > 0 and b["min_ms"] / a["min_ms"] >= threshold:
+                lines.append("%-26s Q%-3d %-17s %8.2f ms -> %8.2f ms (x%.2f)" % (r["case"], r["quality"], stage, a["min_ms"], b["min_ms"], b["min_ms"] / a["min_ms"]))
+    return lines
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ThreadProfile pipeline benchmark")
+    parser.add_argument("--stub", action="store_true", help="use stand-in FreeCAD modules, pure python stages only")
+    parser.add_argument("--quality", type=int, nargs="+", default=list(range(1, 13)), help="Quality values, default 1-12")
+    parser.add_argument("--turns", type=float, default=10, help="helix length in turns for the helix and sweep stages")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage")
+    parser.add_argument("--json", action="store_true", help="print results as json")
+    parser.add_argument("--output", help="also write the json results to this file")
+    parser.add_argument("--compare", help="json results of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=1.2, help="slowdown ratio reported by --compare")
+    args = parser.parse_args(argv)
+    occ = not args.stub
+    if occ:
+        try:
+            import FreeCAD, Part
+        except ImportError:
+            occ = False
+    if not occ:
+        installStubs()
+    from ThreadProfileObject import _ThreadProfile
+    from ThreadProfileCmd import version
+    proxy = _ThreadProfile.__new__(_ThreadProfile) #no document object, the stages only need the methods
+    results = []
+    for name, library_id, preset, side in cases:
+        for quality in args.quality:
+            r = runCase(proxy, library_id, preset, side, quality, args.turns, args.repeat, occ)
+            r.update(case=name, quality=quality)
+            results.append(r)
+    report = {"version": version, "python": sys.version.split()[0], "mode": "freecad" if occ else "stub",
+              "turns": args.turns, "repeat": args.repeat, "stages": list(stages), "results": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print("mode: %s   ThreadProfile %s   min ms of %d runs" % (report["mode"], version, args.repeat))
+        print("%-26s %-4s %6s " % ("case", "Q", "points") + " ".join("%11s" % s[:11] for s in stages))
+        for r in results:
+            cells = ["%11.3f" % r[s]["min_ms"] if "min_ms" in r[s] else "%11s" % "-" for s in stages]
+            print("%-26s %-4d %6d " % (r["case"], r["quality"], r["points"]) + " ".join(cells))
+    if args.compare:
+        lines = compare(results, args.compare, args.threshold)
+        print("%d stages at least x%.2f slower than %s" % (len(lines), args.threshold, args.compare))
+        for line in lines:
+            print(line)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  solid_benchmark.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Thread solid benchmark: Part.makeHelix + makePipeShell (what Part::Sweep does) against the direct
+helical B-spline solid of ThreadProfileSolid and the solids replicated from one cached turn, for a
+few presets and lengths.  Volumes are compared
+so a fast but wrong solid shows up.
+
+Usage: python benchmarks/solid_benchmark.py [--repeat N] [--turns 1 10 50] [--json]
+
+Needs FreeCAD's Part module, run it with FreeCADCmd or the python FreeCAD uses."""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+
+wbPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, wbPath)
+
+from ThreadProfileCore import sampleProfile, fitPeriodicBSpline, profileLibrary, presetDatabase
+
+#name, library id, preset query, External or Internal
+cases = [
+    ("V M10x1.5 external", "VThread", dict(nominal=10, pitch=1.5), "External"),
+    ("V M10x1.5 internal", "VThread", dict(nominal=10, pitch=1.5), "Internal"),
+    ("Buttress 1-10 external", "Buttress", dict(nominal=25.4, tpi=10), "External"),
+    ("Bottle 43-SP400 external", "Bottle", dict(nominal=43), "External"),
+]
+
+def profileCurve(profile_id, query, which, pole_count=128):
+    '''periodic B-spline of the profile in the xy plane, the same fit the LeastSquares engine makes'''
+    import FreeCAD, Part
+    preset = presetDatabase(profile_id).nearest(**query)
+    internal, external = profileLibrary.getProfile(profile_id)
+    data, minor = (external, preset.external_minor) if which == "External" else (internal, preset.internal_minor)
+    xs, ys = sampleProfile(data, minor, preset.pitch)
+    fit = fitPeriodicBSpline(xs, ys, pole_count)
+    curve = Part.BSplineCurve()
+    curve.buildFromPolesMultsKnots([FreeCAD.Vector(x, y, 0) for x, y in fit.poles.tolist()], fit.mults, fit.knots, True, fit.degree)
+    return curve, preset.pitch
+
+def sweepSolid(curve, pitch, turns):
+    import Part
+    radius = max(p.Length for p in curve.getPoles())
+    spine = Part.Wire(Part.makeHelix(pitch, pitch * turns, radius))
+    return spine.makePipeShell([Part.Wire(curve.toShape())], True, True)
+
+def timeIt(func, repeat):
+    times = []
+    for ii in range(repeat):
+        t = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - t)
+    return times, result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ThreadProfile thread solid benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case")
+    parser.add_argument("--turns", type=float, nargs="+", default=[1, 10, 50], help="thread lengths in turns")
+    parser.add_argument("--json", action="store_true", help="print results as json")
+    args = parser.parse_args(argv)
+    try:
+        import Part
+    except ImportError:
+        print("solid_benchmark needs FreeCAD's Part module, run it with FreeCADCmd")
+        return
+    from ThreadProfileSolid import makeHelicalSolid, replicateTurns, turnCache
+    results = []
+    for name, profile_id, query, which in cases:
+        curve, pitch = profileCurve(profile_id, query, which)
+        for turns in args.turns:
+            r = {"name": name, "turns": turns}
+            try:
+                times, solid = timeIt(lambda: sweepSolid(curve, pitch, turns), args.repeat)
+                r.update(sweep_ms=min(times) * 1000, sweep_volume=solid.Volume)
+            except Exception as e:
+                r.update(sweep_error=str(e))
+            times, (solid, error) = timeIt(lambda: makeHelicalSolid(curve, pitch, turns), args.repeat)
+            r.update(direct_ms=min(times) * 1000, direct_median_ms=statistics.median(times) * 1000,
+                direct_volume=solid.Volume, direct_valid=solid.isValid(), helix_error_mm=error)
+            for method in ("Sweep", "Direct"):
+                turnCache.clear()
+                times, (solid, whole) = timeIt(lambda: replicateTurns(curve, pitch, turns, method), args.repeat)
+                #first run makes the turn, the others find it in turnCache
+                r["replicated_%s_first_ms" % method.lower()] = times[0] * 1000
+                r["replicated_%s_cached_ms" % method.lower()] = min(times[1:] or times) * 1000
+                r["replicated_%s_volume" % method.lower()] = solid.Volume
+            results.append(r)
+    if args.json:
+        print(json.dumps({"python": sys.version.split()[0], "results": results}, indent=2))
+        return
+    for r in results:
+        sweep = "sweep failed (%s)" % r["sweep_error"] if "sweep_error" in r else "sweep %9.2f ms" % r["sweep_ms"]
+        line = "%-26s %5g turns   %s   direct %9.2f ms   helix error %.2e mm" % (r["name"], r["turns"], sweep, r["direct_ms"], r["helix_error_mm"])
+        if "sweep_volume" in r:
+            line += "   volume diff %.3g%%" % (100. * abs(r["direct_volume"] - r["sweep_volume"]) / r["sweep_volume"])
+        print(line)
+        for method in ("sweep", "direct"):
+            print("%-26s %5g turns   replicated %-6s  first %9.2f ms   cached %9.2f ms" % ("", r["turns"], method,
+                r["replicated_%s_first_ms" % method], r["replicated_%s_cached_ms" % method]))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+###################################################################################
+#
+#  startup_benchmark.py
+#  
+#  Copyright 2019 Mark Ganson <TheMarkster> mwganson at gmail
+#  
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 2 of the License, or
+#  (at your option) any later version.
+#  
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#  
+#  
+###################################################################################
+
+"""Startup timing benchmark.  Each import is timed in a fresh interpreter, so nothing is cached
+in sys.modules, and repeated to get a stable minimum and median.
+
+Usage: python benchmarks/startup_benchmark.py [--repeat N] [--json]
+
+Run it with the python FreeCAD uses (or FreeCADCmd) to include the ThreadProfileCmd and
+ThreadProfileObject imports, with any other python only the FreeCAD independent steps are timed."""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+wbPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+#name, setup, statement timed; setup runs before the clock starts, in the same fresh interpreter
+cases = [
+    ("numpy", "", "import numpy"),
+    ("ThreadProfileCore", "import numpy", "import ThreadProfileCore"),
+    ("load V profile and presets", "import ThreadProfileCore",
+        "ThreadProfileCore.profileLibrary.getProfile('VThread'); ThreadProfileCore.profileLibrary.getPresets('VThread')"),
+    ("load all built-in tables", "import ThreadProfileCore",
+        "[(ThreadProfileCore.profileLibrary.getProfile(i), ThreadProfileCore.profileLibrary.getPresets(i)) for i in ('VThread', 'Buttress', 'Bottle')]"),
+    ("ThreadProfileCmd (workbench Initialize)", "import FreeCAD, FreeCADGui", "import ThreadProfileCmd"),
+    ("ThreadProfileObject (first object created)", "import ThreadProfileCmd", "import ThreadProfileObject"),
+]
+
+script = """
+import sys, time
+sys.path.insert(0, %r)
+%s
+t = time.perf_counter()
+%s
+sys.stdout.write(repr(time.perf_counter() - t))
+"""
+
+def timeCase(setup, statement, repeat):
+    times = []
+    for ii in range(repeat):
+        proc = subprocess.run([sys.executable, "-c", script % (wbPath, setup, statement)], capture_output=True, text=True)
+        if proc.returncode != 0:
+            return None, proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "failed"
+        times.append(float(proc.stdout))
+    return times, None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ThreadProfile startup timing benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per case")
+    parser.add_argument("--json", action="store_true", help="print results as json")
+    args = parser.parse_args(argv)
+    results = []
+    for name, setup, statement in cases:
+        times, error = timeCase(setup, statement, args.repeat)
+        if times is None:
+            results.append({"name": name, "skipped": error})
+        else:
+            results.append({"name": name, "min_ms": min(times) * 1000, "median_ms": statistics.median(times) * 1000})
+    if args.json:
+        print(json.dumps({"python": sys.version.split()[0], "results": results}, indent=2))
+        return
+    for r in results:
+        if "skipped" in r:
+            print("%-45s skipped (%s)" % (r["name"], r["skipped"]))
+        else:
+            print("%-45s min %8.2f ms   median %8.2f ms" % (r["name"], r["min_ms"], r["median_ms"]))
+
+if __name__ == "__main__":
+    main()